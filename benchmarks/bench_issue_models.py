@@ -0,0 +1,107 @@
+"""Compare the old json.dumps(indent=4) tool output with compact JiraIssue serialization,
+and with the equivalent dicts the MCP tools serialize.
+
+Run from the repository root:
+    python benchmarks/bench_issue_models.py
+"""
+import json
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from models import JiraIssue, compact_issue, to_compact_json
+
+BASE_URL = "https://jira.example.com"
+ISSUE_COUNT = 100
+ROUNDS = 200
+
+def make_user(name: str) -> dict:
+    return {
+        "self": f"{BASE_URL}/rest/api/2/user?username={name}",
+        "name": name,
+        "key": name,
+        "emailAddress": f"{name}@example.com",
+        "avatarUrls": {size: f"{BASE_URL}/secure/useravatar?size={size}&ownerId={name}"
+                       for size in ("48x48", "24x24", "16x16", "32x32")},
+        "displayName": name.title(),
+        "active": True,
+        "timeZone": "Europe/Berlin",
+    }
+
+def make_issue(number: int) -> dict:
+    """A raw issue as returned by /search with DEFAULT_READ_JIRA_FIELDS."""
+    return {
+        "expand": "operations,versionedRepresentations,editmeta,changelog,renderedFields",
+        "id": str(10000 + number),
+        "self": f"{BASE_URL}/rest/api/2/issue/{10000 + number}",
+        "key": f"ENG-{number}",
+        "fields": {
+            "summary": f"Service returns 500 when saving record {number}",
+            "description": "Steps to reproduce:\n" + "Open the record and press save. " * 20,
+            "status": {
+                "self": f"{BASE_URL}/rest/api/2/status/3",
+                "description": "This issue is being actively worked on at the moment by the assignee.",
+                "iconUrl": f"{BASE_URL}/images/icons/statuses/inprogress.png",
+                "name": "In Progress",
+                "id": "3",
+                "statusCategory": {"self": f"{BASE_URL}/rest/api/2/statuscategory/4", "id": 4,
+                                   "key": "indeterminate", "colorName": "yellow", "name": "In Progress"},
+            },
+            "assignee": make_user("alice"),
+            "reporter": make_user("bob"),
+            "labels": ["backend", "regression"],
+            "priority": {"self": f"{BASE_URL}/rest/api/2/priority/2",
+                         "iconUrl": f"{BASE_URL}/images/icons/priorities/high.svg", "name": "High", "id": "2"},
+            "created": "2025-05-01T10:00:00.000+0000",
+            "updated": "2025-05-02T12:30:00.000+0000",
+            "issuetype": {"self": f"{BASE_URL}/rest/api/2/issuetype/1", "id": "1", "description": "A problem.",
+                          "iconUrl": f"{BASE_URL}/images/icons/issuetypes/bug.png", "name": "Bug",
+                          "subtask": False},
+        },
+    }
+
+def old_board_output(issues: list) -> str:
+    """GetIssuesForBoard before: the raw response dumped with indentation."""
+    return json.dumps(issues, indent=4)
+
+def old_search_output(issues: list) -> str:
+    """GetIssues before: key/summary/status dicts dumped with indentation."""
+    return json.dumps([{
+        'key': issue.get('key'),
+        'summary': issue.get('fields', {}).get('summary'),
+        'status': issue.get('fields', {}).get('status', {}).get('name'),
+    } for issue in issues], indent=4)
+
+def new_output(issues: list) -> str:
+    """Tools now: JiraIssue models serialized compactly, once."""
+    return to_compact_json([JiraIssue.from_raw(issue) for issue in issues])
+
+def dict_output(issues: list) -> str:
+    """MCP tools now: the same output from compact_issue dicts, without building models."""
+    return to_compact_json([compact_issue(issue) for issue in issues])
+
+def search_subset(issue: dict) -> dict:
+    """What Jira returns for a search that only requests summary and status."""
+    fields = issue["fields"]
+    return {"key": issue["key"], "fields": {"summary": fields["summary"], "status": fields["status"]}}
+
+def report(name: str, func, issues: list) -> None:
+    output = func(issues)
+    seconds = timeit.timeit(lambda: func(issues), number=ROUNDS) / ROUNDS
+    print(f"{name:<28} {len(output.encode()):>10,} bytes {seconds * 1000:>9.3f} ms")
+
+if __name__ == "__main__":
+    full_issues = [make_issue(number) for number in range(ISSUE_COUNT)]
+    search_issues = [search_subset(issue) for issue in full_issues]
+
+    print(f"Per {ISSUE_COUNT} issues, mean of {ROUNDS} rounds")
+    print("Board/project tools (default read fields)")
+    report("  before: raw, indent=4", old_board_output, full_issues)
+    report("  after: JiraIssue compact", new_output, full_issues)
+    report("  after: compact dicts", dict_output, full_issues)
+    print("Search tools (summary, status)")
+    report("  before: dicts, indent=4", old_search_output, search_issues)
+    report("  after: JiraIssue compact", new_output, search_issues)
+    report("  after: compact dicts", dict_output, search_issues)
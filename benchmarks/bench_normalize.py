@@ -0,0 +1,140 @@
+"""Compare the recursive null stripping of ManageIssues with the single pass normalize().
+
+Run from the repository root:
+    python benchmarks/bench_normalize.py
+    python benchmarks/bench_normalize.py --kb 400 --rounds 50
+
+Every round decodes a JSON issue of about --kb kilobytes, as returned by get_issue with
+fields=*all, and cleans it up. The decode time is measured on its own and subtracted.
+The report shows the time and peak allocations of the cleanup, the size of the result,
+and the time of the whole get_issue path including shape_issue() with its default budget.
+"""
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from jira_client.client import JIRA_ISSUE_MAX_BYTES
+from jira_client.shaping import normalize, payload_size, shape_issue
+
+BASE_URL = "https://jira.example.com"
+
+def remove_null_values(obj: Any) -> Any:
+    """ManageIssues._remove_null_values before: rebuild every dict and list, dropping nulls."""
+    if isinstance(obj, dict):
+        return {k: remove_null_values(v) for k, v in obj.items() if v is not None}
+    elif isinstance(obj, list):
+        return [remove_null_values(item) for item in obj if item is not None]
+    else:
+        return obj
+
+def make_user(name: str) -> Dict[str, Any]:
+    return {"self": f"{BASE_URL}/rest/api/2/user?username={name}", "name": name, "key": name,
+            "emailAddress": f"{name}@example.com", "displayName": name.title(), "active": True,
+            "timeZone": "Europe/Berlin",
+            "avatarUrls": {size: f"{BASE_URL}/secure/useravatar?size={size}&ownerId={name}"
+                           for size in ("48x48", "24x24", "16x16", "32x32")}}
+
+def make_named(kind: str, name: str, index: int) -> Dict[str, Any]:
+    return {"self": f"{BASE_URL}/rest/api/2/{kind}/{index}", "id": str(index), "name": name,
+            "description": f"{name} {kind}", "iconUrl": f"{BASE_URL}/images/icons/{kind}/{index}.png"}
+
+def make_issue(kilobytes: int) -> Dict[str, Any]:
+    """A raw issue with every field: users, comments, worklogs, links, attachments and many empty custom fields."""
+    users = [make_user(name) for name in ("alice", "bob", "carol", "dave")]
+    fields: Dict[str, Any] = {
+        "summary": "Service returns 500 when saving a record with a long description",
+        "description": "Steps to reproduce:\n" + "Open the record, edit it and press save. " * 60,
+        "status": {**make_named("status", "In Progress", 3),
+                   "statusCategory": {"self": f"{BASE_URL}/rest/api/2/statuscategory/4", "id": 4,
+                                      "key": "indeterminate", "colorName": "yellow", "name": "In Progress"}},
+        "priority": make_named("priority", "High", 2),
+        "issuetype": {**make_named("issuetype", "Bug", 1), "subtask": False, "avatarId": 10303},
+        "assignee": users[0], "reporter": users[1], "creator": users[1],
+        "labels": ["backend", "regression"], "components": [make_named("component", "API", 10)],
+        "fixVersions": [], "versions": [], "subtasks": [], "environment": None, "duedate": None,
+        "resolution": None, "resolutiondate": None, "timeestimate": None, "aggregatetimeestimate": None,
+        "created": "2025-05-01T10:00:00.000+0000", "updated": "2025-05-02T12:30:00.000+0000",
+        "votes": {"self": f"{BASE_URL}/rest/api/2/issue/ENG-1/votes", "votes": 0, "hasVoted": False},
+        "watches": {"self": f"{BASE_URL}/rest/api/2/issue/ENG-1/watchers", "watchCount": 2, "isWatching": False},
+        "project": {**make_named("project", "Engineering", 10000), "key": "ENG",
+                    "avatarUrls": users[0]["avatarUrls"]},
+    }
+    for number in range(10100, 10180):
+        fields[f"customfield_{number}"] = None if number % 4 else {"self": f"{BASE_URL}/rest/api/2/customFieldOption/{number}",
+                                                                    "value": f"Option {number}", "id": str(number)}
+    fields["issuelinks"] = [{"id": str(index), "self": f"{BASE_URL}/rest/api/2/issueLink/{index}",
+                             "type": {"id": "10000", "name": "Blocks", "inward": "is blocked by",
+                                      "outward": "blocks", "self": f"{BASE_URL}/rest/api/2/issueLinkType/10000"},
+                             "outwardIssue": {"id": str(20000 + index), "key": f"ENG-{index}",
+                                              "self": f"{BASE_URL}/rest/api/2/issue/{20000 + index}",
+                                              "fields": {"summary": f"Linked issue {index}",
+                                                         "status": make_named("status", "Open", 1),
+                                                         "priority": make_named("priority", "Low", 4),
+                                                         "issuetype": make_named("issuetype", "Task", 3)}}}
+                            for index in range(15)]
+    fields["attachment"] = [{"self": f"{BASE_URL}/rest/api/2/attachment/{index}", "id": str(index),
+                             "filename": f"log-{index}.txt", "author": users[index % 4],
+                             "created": "2025-05-01T10:00:00.000+0000", "size": 2048, "mimeType": "text/plain",
+                             "content": f"{BASE_URL}/secure/attachment/{index}/log-{index}.txt", "thumbnail": None}
+                            for index in range(10)]
+    comments = []
+    worklogs = []
+    issue = {"expand": "renderedFields,names,schema,operations,editmeta,changelog,versionedRepresentations",
+             "id": "10001", "self": f"{BASE_URL}/rest/api/2/issue/10001", "key": "ENG-1", "fields": fields}
+    fields["comment"] = {"comments": comments, "maxResults": 0, "total": 0, "startAt": 0}
+    fields["worklog"] = {"worklogs": worklogs, "maxResults": 0, "total": 0, "startAt": 0}
+    index = 0
+    while payload_size(issue) < kilobytes * 1024:
+        comments.append({"self": f"{BASE_URL}/rest/api/2/issue/10001/comment/{index}", "id": str(index),
+                         "author": users[index % 4], "updateAuthor": users[index % 4],
+                         "body": f"Comment {index}: " + "looked into it and found the cause. " * 12,
+                         "created": "2025-05-01T10:00:00.000+0000", "updated": "2025-05-01T10:00:00.000+0000",
+                         "visibility": None})
+        worklogs.append({"self": f"{BASE_URL}/rest/api/2/issue/10001/worklog/{index}", "id": str(index),
+                         "author": users[index % 4], "updateAuthor": users[index % 4], "comment": "",
+                         "started": "2025-05-01T10:00:00.000+0000", "timeSpent": "1h", "timeSpentSeconds": 3600,
+                         "issueId": "10001"})
+        index += 1
+    for container, key in ((fields["comment"], "comments"), (fields["worklog"], "worklogs")):
+        container["maxResults"] = container["total"] = len(container[key])
+    return issue
+
+def measure(func: Callable[[Any], Any], payload: str, rounds: int) -> Dict[str, float]:
+    """Mean seconds and peak allocated bytes of func over freshly decoded copies of payload."""
+    issues = [json.loads(payload) for _ in range(rounds)]
+    started = time.perf_counter()
+    for issue in issues:
+        func(issue)
+    seconds = (time.perf_counter() - started) / rounds
+    issue = json.loads(payload)
+    tracemalloc.start()
+    func(issue)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"ms": seconds * 1000, "peak_kb": peak / 1024}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--kb", type=int, default=200, help="size of the raw issue in kilobytes")
+    parser.add_argument("--rounds", type=int, default=100)
+    args = parser.parse_args()
+
+    issue = make_issue(args.kb)
+    payload = json.dumps(issue)
+    print(f"Raw issue: {payload_size(issue):,} bytes, mean of {args.rounds} rounds")
+    print(f"{'':<34}{'ms':>9}{'peak KB':>10}{'result bytes':>14}")
+    for name, cleanup in (("before: _remove_null_values", remove_null_values), ("after: normalize", normalize)):
+        cleaned = payload_size(cleanup(json.loads(payload)))
+        step = measure(cleanup, payload, args.rounds)
+        print(f"{name:<34}{step['ms']:>9.3f}{step['peak_kb']:>10.0f}{cleaned:>14,}")
+        path = measure(lambda issue: shape_issue(cleanup(issue), JIRA_ISSUE_MAX_BYTES), payload, args.rounds)
+        print(f"{'  + shape_issue (get_issue path)':<34}{path['ms']:>9.3f}{path['peak_kb']:>10.0f}")
+
+if __name__ == "__main__":
+    main()
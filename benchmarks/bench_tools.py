@@ -0,0 +1,233 @@
+"""Drive every MCP tool concurrently against a local fake Jira and report latency, throughput and memory.
+
+No network or Jira instance is needed. Run from the repository root:
+    python benchmarks/bench_tools.py
+    python benchmarks/bench_tools.py --latency 0.05 --rate-limit 200 --calls 100 --concurrency 16
+    python benchmarks/bench_tools.py --tools get_issue,get_issues --json results.json
+
+Every tool is first measured on its own with the given concurrency, then all tools
+are called together in a mixed phase. Calls go through an in-memory MCP client
+session, so JSON-RPC framing, argument validation and result serialization are
+included in the latencies.
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+from urllib.request import urlopen
+
+import anyio
+from mcp.shared.memory import create_connected_server_and_client_session
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake_jira import STATUSES, start_process
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+def build_workloads(projects: List[str], issues_per_project: int) -> Dict[str, Callable[[random.Random], Dict[str, Any]]]:
+    """Arguments for one call of every tool, drawn from a seeded random generator."""
+    def key(rng: random.Random) -> str:
+        return f"{rng.choice(projects)}-{rng.randint(1, issues_per_project)}"
+
+    def project(rng: random.Random) -> str:
+        return rng.choice(projects)
+
+    def export(rng: random.Random) -> Dict[str, Any]:
+        format = rng.choice(["ndjson", "csv"])
+        return {"path": f"bench-{rng.getrandbits(32):08x}.{format}", "format": format,
+                "project_key": project(rng), "fields": "summary,status,priority,assignee"}
+
+    return {
+        "add": lambda rng: {"a": rng.randint(0, 9), "b": rng.randint(0, 9)},
+        "get_cache_stats": lambda rng: {},
+        "sync_project": lambda rng: {"project_key": project(rng)},
+        "get_mirror_status": lambda rng: {},
+        "get_issues_for_board": lambda rng: {"board_id": str(rng.randint(1, 4)), "limit": 20},
+        "get_issues_for_project": lambda rng: {"project_key": project(rng), "limit": 20},
+        "get_issues": lambda rng: {"jql": f'project = {project(rng)} AND status = "{rng.choice(STATUSES)}"',
+                                   "max_results": 150},
+        "run_jql_batch": lambda rng: {"queries": {name: f'project = {name} AND status = "{rng.choice(STATUSES)}"'
+                                                  for name in projects}, "limit": 50},
+        "get_changes_since": lambda rng: {"jql": f"project = {project(rng)}", "max_results": 100},
+        "get_issue": lambda rng: {"key": key(rng)},
+        "get_issues_by_keys": lambda rng: {"keys": [key(rng) for _ in range(20)]},
+        "aggregate_issues": lambda rng: {"jql": f"project = {project(rng)}",
+                                         "group_by": [rng.choice(["status", "assignee", "priority"])]},
+        "get_issue_comments": lambda rng: {"issue_id_or_key": key(rng), "limit": 10},
+        "get_issue_description": lambda rng: {"issue_key": key(rng)},
+        "get_projects": lambda rng: {},
+        "get_project_count": lambda rng: {},
+        "get_issues_count_for_project": lambda rng: {"project_key": project(rng)},
+        "get_linked_issues": lambda rng: {"issue_key": key(rng)},
+        "get_issue_graph": lambda rng: {"root_key": key(rng), "depth": 3},
+        "search_issues_by_text": lambda rng: {"text": rng.choice(["timeout", "memory leak", "cache"]), "max_results": 10},
+        "get_create_metadata": lambda rng: {"project_key": project(rng), "issue_type": rng.choice(["Bug", "Task"])},
+        "create_issue": lambda rng: {"project_key": project(rng), "issue_type": "Task", "summary": "Benchmark issue"},
+        "update_issue": lambda rng: {"issue_key": key(rng), "labels": ["bench"], "status": rng.choice(STATUSES),
+                                     "return_issue": rng.random() < 0.5},
+        "add_comment": lambda rng: {"issue_key": key(rng), "comment": "Benchmark comment"},
+        "bulk_create_issues": lambda rng: {"issues": [{"project_key": project(rng), "issue_type": "Task",
+                                                       "summary": f"Bulk benchmark issue {index}"}
+                                                      for index in range(10)]},
+        "bulk_update_issues": lambda rng: {"updates": [{"issue_key": key(rng), "labels": ["bench"]}
+                                                       for _ in range(10)]},
+        "bulk_add_comment": lambda rng: {"comments": [{"issue_key": key(rng), "comment": "Bulk benchmark comment"}
+                                                      for _ in range(10)]},
+        "export_issues": export,
+    }
+
+async def run_calls(client, calls: List[tuple], concurrency: int) -> Dict[str, Dict[str, List]]:
+    """Run (tool, arguments) calls with bounded concurrency, recording latencies and errors per tool."""
+    results: Dict[str, Dict[str, List]] = {}
+    limiter = anyio.Semaphore(concurrency)
+
+    async def call(name: str, arguments: Dict[str, Any]) -> None:
+        async with limiter:
+            started = time.perf_counter()
+            error = None
+            try:
+                result = await client.call_tool(name, arguments)
+                if result.isError:
+                    error = " ".join(getattr(item, "text", "") for item in result.content)
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            entry = results.setdefault(name, {"latencies": [], "errors": []})
+            entry["latencies"].append(time.perf_counter() - started)
+            if error:
+                entry["errors"].append(error)
+
+    async with anyio.create_task_group() as tg:
+        for name, arguments in calls:
+            tg.start_soon(call, name, arguments)
+    return results
+
+def summarize(results: Dict[str, Dict[str, List]], seconds: float) -> Dict[str, Dict[str, Any]]:
+    summary = {}
+    for name, entry in sorted(results.items()):
+        latencies = entry["latencies"]
+        summary[name] = {
+            "calls": len(latencies),
+            "errors": len(entry["errors"]),
+            "p50_ms": round(percentile(latencies, 0.50) * 1000, 1),
+            "p95_ms": round(percentile(latencies, 0.95) * 1000, 1),
+            "p99_ms": round(percentile(latencies, 0.99) * 1000, 1),
+            "calls_per_second": round(len(latencies) / seconds, 1) if seconds else 0.0,
+        }
+        if entry["errors"]:
+            summary[name]["first_error"] = entry["errors"][0][:200]
+    return summary
+
+def print_table(title: str, summary: Dict[str, Dict[str, Any]]) -> None:
+    print(f"\n{title}")
+    print(f"{'tool':<30}{'calls':>7}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'calls/s':>10}")
+    for name, row in summary.items():
+        print(f"{name:<30}{row['calls']:>7}{row['errors']:>8}{row['p50_ms']:>10}{row['p95_ms']:>10}"
+              f"{row['p99_ms']:>10}{row['calls_per_second']:>10}")
+
+async def bench(args: argparse.Namespace) -> Dict[str, Any]:
+    # The fake Jira runs in its own process so it does not compete with the server for the GIL
+    process, url = start_process(latency=args.latency, jitter=args.jitter, rate_limit=args.rate_limit,
+                                 issues_per_project=args.issues, description_bytes=args.payload,
+                                 projects=tuple(args.projects.split(",")))
+    os.environ["JIRA_URL"] = url
+    os.environ.setdefault("JIRA_PERSONAL_ACCESS_TOKEN", "benchmark")
+    os.environ.setdefault("JIRA_MIRROR_PATH", "")
+    os.environ.setdefault("JIRA_EXPORT_DIR", tempfile.mkdtemp(prefix="jira-bench-exports-"))
+    if args.client_rate_limit:
+        os.environ["JIRA_RATE_LIMIT"] = str(args.client_rate_limit)
+    # Per-request INFO logs would dominate the latency of fast tools
+    os.environ.setdefault("FASTMCP_LOG_LEVEL", "WARNING")
+    try:
+        started = time.perf_counter()
+        import jira_mcp_server
+        import_seconds = time.perf_counter() - started
+        mcp = jira_mcp_server.mcp
+        logging.getLogger("urllib3").setLevel(logging.ERROR)
+
+        workloads = build_workloads(args.projects.split(","), args.issues)
+        tool_names = [tool.name for tool in await mcp.list_tools()]
+        missing = [name for name in tool_names if name not in workloads]
+        if missing:
+            print(f"No workload for: {', '.join(missing)}", file=sys.stderr)
+        selected = [name for name in tool_names if name in workloads
+                    and (not args.tools or name in args.tools.split(","))]
+
+        rng = random.Random(args.seed)
+        report: Dict[str, Any] = {"config": vars(args), "import_seconds": round(import_seconds, 3), "tools": {}}
+        if args.trace_memory:
+            tracemalloc.start()
+        async with create_connected_server_and_client_session(mcp._mcp_server) as client:
+            for name in selected:
+                calls = [(name, workloads[name](rng)) for _ in range(args.calls)]
+                phase_started = time.perf_counter()
+                results = await run_calls(client, calls, args.concurrency)
+                report["tools"].update(summarize(results, time.perf_counter() - phase_started))
+
+            calls = [(name, workloads[name](rng)) for name in selected for _ in range(args.calls)]
+            rng.shuffle(calls)
+            phase_started = time.perf_counter()
+            results = await run_calls(client, calls, args.concurrency)
+            mixed_seconds = time.perf_counter() - phase_started
+        memory = {"max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)}
+        if args.trace_memory:
+            memory["python_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 2 ** 20, 1)
+            tracemalloc.stop()
+
+        report["mixed"] = summarize(results, mixed_seconds)
+        report["mixed_total"] = {"calls": len(calls), "seconds": round(mixed_seconds, 3),
+                                 "calls_per_second": round(len(calls) / mixed_seconds, 1)}
+        report["memory"] = memory
+        # Import of the server, and building of the Jira client on the first tool call
+        report["startup_ms"] = jira_mcp_server.METRICS.snapshot()["startup_ms"]
+        report["jira"] = json.loads(urlopen(f"{url}/__stats").read())
+        return report
+    finally:
+        process.terminate()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=50, help="calls per tool and phase")
+    parser.add_argument("--concurrency", type=int, default=8, help="tool calls in flight at once")
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds added to every Jira response")
+    parser.add_argument("--jitter", type=float, default=0.01, help="random extra latency in seconds")
+    parser.add_argument("--payload", type=int, default=2000, help="description size in bytes")
+    parser.add_argument("--issues", type=int, default=500, help="issues per project")
+    parser.add_argument("--projects", default="ENG,OPS", help="comma separated project keys")
+    parser.add_argument("--rate-limit", type=float, default=0, help="Jira requests per second before 429s (0: off)")
+    parser.add_argument("--client-rate-limit", type=float, default=0,
+                        help="requests per second the server allows itself (JIRA_RATE_LIMIT, 0: off)")
+    parser.add_argument("--tools", default="", help="comma separated tools to run (default: all)")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="also report the peak of Python allocations (slows every call down)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", help="write the report to this file")
+    args = parser.parse_args()
+
+    report = anyio.run(bench, args)
+    print(f"import: {report['import_seconds']}s, startup: "
+          + ", ".join(f"{phase} {ms} ms" for phase, ms in report["startup_ms"].items()))
+    print_table("Per tool", report["tools"])
+    print_table("Mixed", report["mixed"])
+    print(f"\nmixed: {report['mixed_total']['calls']} calls in {report['mixed_total']['seconds']}s "
+          f"({report['mixed_total']['calls_per_second']} calls/s)")
+    print("memory: " + ", ".join(f"{name} {value}" for name, value in report["memory"].items()))
+    print(f"jira: {report['jira']['requests']} requests, {report['jira']['rate_limited']} rate limited")
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
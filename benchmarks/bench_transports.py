@@ -0,0 +1,185 @@
+"""Compare one stdio server process per client session with one streamable HTTP server for all sessions.
+
+No network or Jira instance is needed. Run from the repository root:
+    python benchmarks/bench_transports.py
+    python benchmarks/bench_transports.py --sessions 16 --calls 50 --workers 2
+
+For every transport the given number of client sessions is opened, each session
+calls get_issue --calls times in a row on keys drawn from a small set, and all
+sessions run at the same time. The report shows the server processes, their
+combined resident memory while the sessions are open, latencies, throughput and
+the requests that reached the fake Jira, which drop when sessions share a cache.
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from contextlib import AsyncExitStack
+from pathlib import Path
+from typing import Any, Dict, List, Set
+from urllib.request import urlopen
+
+import anyio
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamablehttp_client
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake_jira import start_process
+
+ROOT = Path(__file__).resolve().parent.parent
+SERVER = str(ROOT / "jira_mcp_server.py")
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+def descendants(pid: int) -> Set[int]:
+    """Return the ids of all processes started, directly or not, by a process (Linux only)."""
+    children: Dict[int, List[int]] = {}
+    for stat in Path("/proc").glob("[0-9]*/stat"):
+        try:
+            fields = stat.read_text().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        children.setdefault(int(fields[1]), []).append(int(stat.parent.name))
+    found: Set[int] = set()
+    pending = [pid]
+    while pending:
+        for child in children.get(pending.pop(), []):
+            if child not in found:
+                found.add(child)
+                pending.append(child)
+    return found
+
+def rss_mb(pids: Set[int]) -> float:
+    total_kb = 0
+    for pid in pids:
+        try:
+            status = Path(f"/proc/{pid}/status").read_text()
+        except OSError:
+            continue
+        total_kb += next((int(line.split()[1]) for line in status.splitlines() if line.startswith("VmRSS:")), 0)
+    return round(total_kb / 1024, 1)
+
+def server_pids(fake_pid: int) -> Set[int]:
+    """Processes of the MCP servers, i.e. every descendant except the fake Jira."""
+    return descendants(os.getpid()) - {fake_pid} - descendants(fake_pid)
+
+async def drive(sessions: List[ClientSession], args: argparse.Namespace) -> Dict[str, Any]:
+    """Run --calls get_issue calls on every session, all sessions at the same time."""
+    latencies: List[float] = []
+    errors = 0
+
+    async def run(session: ClientSession, rng: random.Random) -> None:
+        nonlocal errors
+        for _ in range(args.calls):
+            started = time.perf_counter()
+            result = await session.call_tool("get_issue", {"key": f"ENG-{rng.randint(1, args.keys)}"})
+            latencies.append(time.perf_counter() - started)
+            errors += result.isError
+
+    started = time.perf_counter()
+    async with anyio.create_task_group() as tg:
+        for index, session in enumerate(sessions):
+            tg.start_soon(run, session, random.Random(args.seed + index))
+    seconds = time.perf_counter() - started
+    return {
+        "calls": len(latencies),
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 1),
+        "calls_per_second": round(len(latencies) / seconds, 1),
+    }
+
+async def bench_stdio(args: argparse.Namespace, env: Dict[str, str], fake_pid: int) -> Dict[str, Any]:
+    params = StdioServerParameters(command=sys.executable, args=[SERVER], env=env, cwd=str(ROOT))
+    async with AsyncExitStack() as stack:
+        started = time.perf_counter()
+        sessions = []
+        for _ in range(args.sessions):
+            read, write = await stack.enter_async_context(stdio_client(params))
+            session = await stack.enter_async_context(ClientSession(read, write))
+            await session.initialize()
+            sessions.append(session)
+        connect_seconds = time.perf_counter() - started
+        report = await drive(sessions, args)
+        pids = server_pids(fake_pid)
+        return {**report, "processes": len(pids), "rss_mb": rss_mb(pids), "connect_seconds": round(connect_seconds, 2)}
+
+async def bench_http(args: argparse.Namespace, env: Dict[str, str], fake_pid: int) -> Dict[str, Any]:
+    base = f"http://127.0.0.1:{args.port}"
+    server = subprocess.Popen([sys.executable, SERVER], cwd=str(ROOT), stderr=subprocess.DEVNULL,
+                              env={**env, "JIRA_MCP_TRANSPORT": "streamable-http", "FASTMCP_PORT": str(args.port),
+                                   "JIRA_MCP_WORKERS": str(args.workers)})
+    try:
+        for _ in range(300):
+            try:
+                urlopen(f"{base}/readyz").read()
+                break
+            except OSError:
+                await anyio.sleep(0.1)
+        async with AsyncExitStack() as stack:
+            started = time.perf_counter()
+            sessions = []
+            for _ in range(args.sessions):
+                read, write, _ = await stack.enter_async_context(streamablehttp_client(f"{base}/mcp"))
+                session = await stack.enter_async_context(ClientSession(read, write))
+                await session.initialize()
+                sessions.append(session)
+            connect_seconds = time.perf_counter() - started
+            report = await drive(sessions, args)
+            pids = {server.pid} | descendants(server.pid)
+            return {**report, "processes": len(pids), "rss_mb": rss_mb(pids),
+                    "connect_seconds": round(connect_seconds, 2)}
+    finally:
+        server.terminate()
+        server.wait(30)
+
+async def bench(args: argparse.Namespace) -> Dict[str, Any]:
+    report: Dict[str, Any] = {"config": vars(args)}
+    for transport, run in (("stdio", bench_stdio), ("streamable-http", bench_http)):
+        process, url = start_process(latency=args.latency, jitter=args.jitter, issues_per_project=args.issues)
+        env = {"JIRA_URL": url, "JIRA_PERSONAL_ACCESS_TOKEN": "benchmark", "JIRA_MIRROR_PATH": "",
+               "FASTMCP_LOG_LEVEL": "WARNING", "PATH": os.environ.get("PATH", "")}
+        try:
+            result = await run(args, env, process.pid)
+            result["jira_requests"] = json.loads(urlopen(f"{url}/__stats").read())["requests"]
+            result["sessions_per_process"] = round(args.sessions / max(1, result["processes"]), 1)
+            result["rss_mb_per_session"] = round(result["rss_mb"] / args.sessions, 1)
+            report[transport] = result
+        finally:
+            process.terminate()
+    return report
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=8, help="client sessions open at the same time")
+    parser.add_argument("--calls", type=int, default=30, help="get_issue calls per session")
+    parser.add_argument("--keys", type=int, default=50, help="distinct issues the sessions read")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes of the HTTP server")
+    parser.add_argument("--port", type=int, default=8931, help="port of the HTTP server")
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds added to every Jira response")
+    parser.add_argument("--jitter", type=float, default=0.01, help="random extra latency in seconds")
+    parser.add_argument("--issues", type=int, default=500, help="issues per project")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", help="write the report to this file")
+    args = parser.parse_args()
+
+    report = anyio.run(bench, args)
+    columns = ("processes", "sessions_per_process", "rss_mb", "rss_mb_per_session", "connect_seconds",
+               "p50_ms", "p95_ms", "calls_per_second", "jira_requests", "errors")
+    print(f"{'':<24}{'stdio':>16}{'streamable-http':>18}")
+    for column in columns:
+        print(f"{column:<24}{report['stdio'][column]:>16}{report['streamable-http'][column]:>18}")
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,491 @@
+"""A local stand-in for the Jira Server/DC REST endpoints used by this project.
+
+It serves search, issues, comments, transitions, projects, boards and instance
+metadata from generated data, with configurable latency, payload size and rate
+limiting, so the MCP server can be benchmarked without network access.
+
+    server = FakeJiraServer(issues_per_project=500, latency=0.02).start()
+    os.environ["JIRA_URL"] = server.url
+    ...
+    server.stop()
+
+To keep the server from competing with the code under test for the GIL, run it in
+its own process with start_process, or from the command line:
+    python benchmarks/fake_jira.py --port 8080 --latency 0.05 --rate-limit 100
+
+GET /__stats returns the number of requests served and rate limited.
+"""
+import argparse
+import json
+import multiprocessing
+import random
+import re
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+STATUSES = ("Open", "In Progress", "Done")
+PRIORITIES = ("Highest", "High", "Medium", "Low")
+ISSUE_TYPES = ("Bug", "Task", "Story")
+USERS = ("alice", "bob", "carol", "dave")
+WORDS = ("timeout", "cache", "retry", "index", "pool", "thread", "lock", "queue", "disk", "memory",
+         "leak", "search", "render", "login", "export", "sync")
+TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.000+0000"
+BLOCKS = {"id": "10000", "name": "Blocks", "inward": "is blocked by", "outward": "blocks"}
+
+class FakeJira:
+    """In-memory Jira data and the REST semantics the server relies on."""
+
+    def __init__(self, projects: Tuple[str, ...] = ("ENG", "OPS"), issues_per_project: int = 500,
+                 description_bytes: int = 2000, comments_per_issue: int = 5, max_results: int = 100,
+                 base_url: str = "http://127.0.0.1"):
+        self.projects = projects
+        self.issues_per_project = issues_per_project
+        self.description_bytes = description_bytes
+        self.comments_per_issue = comments_per_issue
+        self.max_results = max_results
+        self.base_url = base_url
+        self._lock = threading.Lock()
+        self._issues: Dict[str, Dict[str, Any]] = {}
+        self._comments: Dict[str, List[Dict[str, Any]]] = {}
+        self._histories: Dict[str, List[Dict[str, Any]]] = {}
+        self._next_number = {project: issues_per_project + 1 for project in projects}
+        for project in projects:
+            for number in range(1, issues_per_project + 1):
+                self._issues[f"{project}-{number}"] = self._make_issue(project, number)
+
+    def _user(self, name: str) -> Dict[str, Any]:
+        return {"self": f"{self.base_url}/rest/api/2/user?username={name}", "name": name, "key": name,
+                "emailAddress": f"{name}@example.com", "displayName": name.title(), "active": True,
+                "avatarUrls": {size: f"{self.base_url}/secure/useravatar?size={size}&ownerId={name}"
+                               for size in ("48x48", "24x24", "16x16", "32x32")}}
+
+    def _named(self, kind: str, name: str, index: int) -> Dict[str, Any]:
+        return {"self": f"{self.base_url}/rest/api/2/{kind}/{index}", "id": str(index), "name": name,
+                "iconUrl": f"{self.base_url}/images/icons/{kind}/{index}.png", "description": f"{name} {kind}"}
+
+    def _make_issue(self, project: str, number: int, summary: str | None = None) -> Dict[str, Any]:
+        rng = random.Random(f"{project}-{number}")
+        words = " ".join(rng.choice(WORDS) for _ in range(max(1, self.description_bytes // 7)))
+        status = STATUSES[number % len(STATUSES)]
+        key = f"{project}-{number}"
+        issue_id = str(10000 + self.projects.index(project) * 1000000 + number)
+        return {
+            "expand": "operations,versionedRepresentations,editmeta,changelog,renderedFields",
+            "id": issue_id,
+            "self": f"{self.base_url}/rest/api/2/issue/{issue_id}",
+            "key": key,
+            "fields": {
+                "summary": summary or f"{rng.choice(WORDS).title()} {rng.choice(WORDS)} fails in {key}",
+                "description": words[:self.description_bytes],
+                "status": self._named("status", status, STATUSES.index(status) + 1),
+                "priority": self._named("priority", rng.choice(PRIORITIES), 1 + number % len(PRIORITIES)),
+                "issuetype": self._named("issuetype", rng.choice(ISSUE_TYPES), 1 + number % len(ISSUE_TYPES)),
+                "assignee": self._user(rng.choice(USERS)) if number % 5 else None,
+                "reporter": self._user(rng.choice(USERS)),
+                "labels": rng.sample(WORDS, number % 3),
+                "created": "2025-01-01T10:00:00.000+0000",
+                "updated": "2025-06-01T10:00:00.000+0000",
+                "project": {"key": project, "name": project.title()},
+                "issuelinks": self._links(project, number),
+            },
+        }
+
+    def _links(self, project: str, number: int) -> List[Dict[str, Any]]:
+        """Every issue blocks the next one of its project."""
+        links = []
+        if number < self.issues_per_project:
+            links.append({"id": f"{number}1", "type": BLOCKS, "outwardIssue": self._stub(f"{project}-{number + 1}")})
+        if number > 1:
+            links.append({"id": f"{number}2", "type": BLOCKS, "inwardIssue": self._stub(f"{project}-{number - 1}")})
+        return links
+
+    def _stub(self, key: str) -> Dict[str, Any]:
+        return {"id": key, "key": key, "self": f"{self.base_url}/rest/api/2/issue/{key}",
+                "fields": {"summary": f"Linked issue {key}", "status": self._named("status", "Open", 1)}}
+
+    def _comments_of(self, key: str) -> List[Dict[str, Any]]:
+        comments = self._comments.get(key)
+        if comments is None:
+            comments = self._comments[key] = [
+                {"id": str(index), "author": self._user(USERS[index % len(USERS)]),
+                 "body": f"Comment {index} on {key}: " + "looked into it " * 20,
+                 "created": f"2025-02-{index + 1:02d}T10:00:00.000+0000",
+                 "updated": f"2025-02-{index + 1:02d}T10:00:00.000+0000"}
+                for index in range(self.comments_per_issue)]
+        return comments
+
+    @staticmethod
+    def project_fields(issue: Dict[str, Any], fields: str | None) -> Dict[str, Any]:
+        requested = [field for field in (fields or "*all").split(",") if field]
+        if "*all" in requested:
+            # Copy so concurrent updates do not change the issue while it is serialized
+            return {**issue, "fields": dict(issue["fields"])}
+        return {**issue, "fields": {name: issue["fields"].get(name) for name in requested if name in issue["fields"]}}
+
+    def matching(self, jql: str) -> List[Dict[str, Any]]:
+        """Evaluate the handful of JQL shapes the server sends."""
+        jql, *order = re.split(r"\bORDER\s+BY\b", jql, flags=re.IGNORECASE)
+        with self._lock:
+            issues = list(self._issues.values())
+        keys = re.search(r"\bkey\s+in\s*\(([^)]*)\)", jql, re.IGNORECASE)
+        if keys:
+            wanted = {key.strip().strip('"').upper() for key in keys.group(1).split(",")}
+            issues = [issue for issue in issues if issue["key"] in wanted]
+        project = re.search(r'\bproject\s*=\s*"?([A-Za-z0-9_]+)"?', jql, re.IGNORECASE)
+        if project:
+            issues = [issue for issue in issues if issue["fields"]["project"]["key"] == project.group(1).upper()]
+        for field in ("status", "priority", "issuetype"):
+            value = re.search(rf'\b{field}\s*=\s*"([^"]*)"', jql, re.IGNORECASE)
+            if value:
+                issues = [issue for issue in issues if issue["fields"][field]["name"] == value.group(1)]
+        if re.search(r"\bpriority\s+is\s+EMPTY", jql, re.IGNORECASE):
+            issues = []
+        text = re.search(r'\btext\s*~\s*"([^"]*)"', jql, re.IGNORECASE)
+        if text:
+            terms = text.group(1).lower().split()
+            issues = [issue for issue in issues
+                      if all(term in (issue["fields"]["summary"] + " " + issue["fields"]["description"]).lower()
+                             for term in terms)]
+        minutes = re.search(r'\bupdated\s*>=?\s*"-(\d+)m"', jql, re.IGNORECASE)
+        if minutes:
+            since = time.strftime(TIME_FORMAT, time.gmtime(time.time() - int(minutes.group(1)) * 60))
+            issues = [issue for issue in issues if issue["fields"]["updated"] >= since]
+        issues.sort(key=lambda issue: (issue["fields"]["project"]["key"], int(issue["key"].split("-")[1])))
+        if order and order[0].strip().lower().startswith("updated"):
+            issues.sort(key=lambda issue: issue["fields"]["updated"])
+        return issues
+
+    def search(self, params: Dict[str, str]) -> Dict[str, Any]:
+        start = int(params.get("startAt", 0))
+        limit = min(int(params.get("maxResults", 50)), self.max_results)
+        issues = self.matching(params.get("jql", ""))
+        page = [self.project_fields(issue, params.get("fields")) for issue in issues[start:start + limit]]
+        if "changelog" in params.get("expand", ""):
+            with self._lock:
+                for issue in page:
+                    histories = list(self._histories.get(issue["key"], []))
+                    issue["changelog"] = {"startAt": 0, "maxResults": len(histories), "total": len(histories),
+                                          "histories": histories}
+        return {"startAt": start, "maxResults": limit, "total": len(issues), "issues": page}
+
+    def issue(self, key: str) -> Dict[str, Any] | None:
+        with self._lock:
+            return self._issues.get(key.upper())
+
+    def update(self, key: str, fields: Dict[str, Any]) -> bool:
+        with self._lock:
+            issue = self._issues.get(key.upper())
+            if issue is None:
+                return False
+            now = time.strftime(TIME_FORMAT, time.gmtime())
+            items = []
+            for name, value in fields.items():
+                if name in ("priority", "issuetype") and isinstance(value, dict):
+                    value = self._named(name, value.get("name", ""), 1)
+                elif name == "assignee" and isinstance(value, dict):
+                    value = self._user(value.get("name", "alice"))
+                previous = issue["fields"].get(name)
+                if previous != value:
+                    items.append({"field": name, "fieldtype": "jira", "fieldId": name, "from": None,
+                                  "fromString": self._display(previous), "to": None,
+                                  "toString": self._display(value)})
+                issue["fields"][name] = value
+            issue["fields"]["updated"] = now
+            if items:
+                histories = self._histories.setdefault(issue["key"], [])
+                histories.append({"id": str(len(histories) + 1), "author": self._user("alice"), "created": now,
+                                  "items": items})
+            return True
+
+    @staticmethod
+    def _display(value: Any) -> str | None:
+        """The fromString/toString of a changelog item."""
+        if isinstance(value, dict):
+            return value.get("displayName") or value.get("name")
+        if isinstance(value, list):
+            return " ".join(map(str, value))
+        return value
+
+    def create(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        project = (fields.get("project") or {}).get("key", "").upper()
+        if project not in self.projects or not fields.get("summary"):
+            raise ValueError("project and summary are required")
+        with self._lock:
+            number = self._next_number[project]
+            self._next_number[project] += 1
+            issue = self._make_issue(project, number, fields["summary"])
+            issue["fields"]["created"] = issue["fields"]["updated"] = time.strftime(TIME_FORMAT, time.gmtime())
+            self._issues[issue["key"]] = issue
+        return {"id": issue["id"], "key": issue["key"], "self": issue["self"]}
+
+    def add_comment(self, key: str, body: str) -> Dict[str, Any]:
+        with self._lock:
+            comments = self._comments_of(key.upper())
+            comment = {"id": str(len(comments)), "author": self._user("alice"), "body": body,
+                       "created": "2025-03-01T10:00:00.000+0000", "updated": "2025-03-01T10:00:00.000+0000"}
+            comments.append(comment)
+            return comment
+
+    def comments(self, key: str) -> Dict[str, Any]:
+        with self._lock:
+            comments = list(self._comments_of(key.upper()))
+        return {"startAt": 0, "maxResults": len(comments), "total": len(comments), "comments": comments}
+
+    def transitions(self) -> List[Dict[str, Any]]:
+        return [{"id": str(11 + 10 * index), "name": f"To {status}", "to": self._named("status", status, index + 1)}
+                for index, status in enumerate(STATUSES)]
+
+    def transition(self, key: str, transition_id: str) -> bool:
+        for transition in self.transitions():
+            if transition["id"] == str(transition_id):
+                return self.update(key, {"status": transition["to"]})
+        return False
+
+    def metadata(self, kind: str) -> List[Dict[str, Any]]:
+        names = {"status": STATUSES, "priority": PRIORITIES, "issuetype": ISSUE_TYPES}[kind]
+        return [self._named(kind, name, index + 1) for index, name in enumerate(names)]
+
+    def fields(self) -> List[Dict[str, Any]]:
+        names = ("summary", "description", "status", "priority", "issuetype", "assignee", "reporter", "labels",
+                 "created", "updated", "project", "issuelinks")
+        return [*({"id": name, "name": name.title(), "custom": False} for name in names),
+                {"id": "customfield_10002", "name": "Story Points", "custom": True}]
+
+    def createmeta_issuetypes(self, project: str) -> Dict[str, Any] | None:
+        if project.upper() not in self.projects:
+            return None
+        values = [{"id": str(index + 1), "name": name} for index, name in enumerate(ISSUE_TYPES)]
+        return {"startAt": 0, "maxResults": len(values), "total": len(values), "isLast": True, "values": values}
+
+    def createmeta_fields(self, project: str, issue_type_id: str) -> Dict[str, Any] | None:
+        if project.upper() not in self.projects:
+            return None
+        values = [
+            {"fieldId": "summary", "name": "Summary", "required": True, "hasDefaultValue": False},
+            {"fieldId": "issuetype", "name": "Issue Type", "required": True, "hasDefaultValue": False},
+            {"fieldId": "priority", "name": "Priority", "required": False, "hasDefaultValue": True,
+             "allowedValues": self.metadata("priority")},
+            {"fieldId": "description", "name": "Description", "required": False, "hasDefaultValue": False},
+            {"fieldId": "labels", "name": "Labels", "required": False, "hasDefaultValue": False},
+            {"fieldId": "assignee", "name": "Assignee", "required": False, "hasDefaultValue": False},
+            {"fieldId": "customfield_10002", "name": "Story Points", "required": False, "hasDefaultValue": False},
+        ]
+        return {"startAt": 0, "maxResults": len(values), "total": len(values), "isLast": True, "values": values}
+
+    def find_users(self, username: str) -> List[Dict[str, Any]]:
+        return [self._user(name) for name in USERS if username.lower() in name or username == "."]
+
+    def project_list(self) -> List[Dict[str, Any]]:
+        return [{"id": str(index), "key": project, "name": project.title(),
+                 "self": f"{self.base_url}/rest/api/2/project/{index}",
+                 "avatarUrls": {"48x48": f"{self.base_url}/secure/projectavatar?pid={index}"}}
+                for index, project in enumerate(self.projects)]
+
+class _TokenBucket:
+    """Allows rate requests per second with bursts of up to burst requests."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self) -> bool:
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+class FakeJiraServer:
+    """Serves a FakeJira over HTTP on a local port from a background thread.
+
+    Args:
+        latency: Seconds every response is delayed by
+        jitter: Extra random delay of up to this many seconds
+        rate_limit: Requests per second before answering 429 with Retry-After (0 disables)
+        burst: Requests allowed at once when rate limiting
+        **jira_options: Passed to FakeJira (projects, issues_per_project, description_bytes, ...)
+    """
+
+    def __init__(self, latency: float = 0.02, jitter: float = 0.01, rate_limit: float = 0, burst: int = 20,
+                 port: int = 0, **jira_options):
+        self.latency = latency
+        self.jitter = jitter
+        self.bucket = _TokenBucket(rate_limit, burst) if rate_limit > 0 else None
+        self.requests = 0
+        self.rate_limited = 0
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self._httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._httpd.server_port}"
+        self.jira = FakeJira(base_url=self.url, **jira_options)
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> "FakeJiraServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def route(self, method: str, path: str, params: Dict[str, str], body: Any) -> Tuple[int, Any]:
+        jira = self.jira
+        path = re.sub(r"^/rest/api/(2|latest)", "/api", path)
+        if method == "GET" and path == "/api/search":
+            return 200, jira.search(params)
+        if method == "GET" and path == "/api/project":
+            return 200, jira.project_list()
+        if method == "GET" and path in ("/api/status", "/api/priority", "/api/issuetype"):
+            return 200, jira.metadata(path.rsplit("/", 1)[1])
+        if method == "POST" and path == "/api/issue":
+            try:
+                return 201, jira.create(body.get("fields", {}))
+            except ValueError as e:
+                return 400, {"errorMessages": [str(e)], "errors": {}}
+        if method == "POST" and path == "/api/issue/bulk":
+            created, errors = [], []
+            for index, update in enumerate(body.get("issueUpdates", [])):
+                try:
+                    created.append(jira.create(update.get("fields", {})))
+                except ValueError as e:
+                    errors.append({"failedElementNumber": index, "status": 400,
+                                   "elementErrors": {"errorMessages": [str(e)], "errors": {}}})
+            # Like Jira, a request whose every element failed is rejected as a whole
+            return (400 if errors and not created else 201), {"issues": created, "errors": errors}
+
+        if method == "GET" and path == "/api/field":
+            return 200, jira.fields()
+        if method == "GET" and path == "/api/user/search":
+            return 200, jira.find_users(params.get("username", ""))
+        createmeta = re.fullmatch(r"/api/issue/createmeta/([^/]+)/issuetypes(?:/([^/]+))?", path)
+        if method == "GET" and createmeta:
+            project, issue_type_id = createmeta.groups()
+            meta = (jira.createmeta_fields(project, issue_type_id) if issue_type_id
+                    else jira.createmeta_issuetypes(project))
+            return (200, meta) if meta else (404, {"errorMessages": ["Project does not exist"]})
+
+        board = re.fullmatch(r"/rest/agile/1\.0/board/(\d+)/issue", path)
+        if method == "GET" and board:
+            project = jira.projects[int(board.group(1)) % len(jira.projects)]
+            jql = f'project = {project}' + (f' AND {params["jql"]}' if params.get("jql") else "")
+            return 200, jira.search({**params, "jql": jql})
+
+        match = re.fullmatch(r"/api/issue/([^/]+)(/comment|/transitions)?", path)
+        if not match:
+            return 404, {"errorMessages": [f"No route for {method} {path}"]}
+        key, sub = match.group(1), match.group(2)
+        issue = jira.issue(key)
+        if issue is None:
+            return 404, {"errorMessages": ["Issue Does Not Exist"], "errors": {}}
+        if sub == "/comment":
+            if method == "POST":
+                return 201, jira.add_comment(key, body.get("body", ""))
+            return 200, jira.comments(key)
+        if sub == "/transitions":
+            if method == "POST":
+                ok = jira.transition(key, (body.get("transition") or {}).get("id"))
+                return (204, None) if ok else (400, {"errorMessages": ["Invalid transition"]})
+            return 200, {"transitions": jira.transitions()}
+        if method == "PUT":
+            jira.update(key, body.get("fields", {}))
+            return 204, None
+        result = jira.project_fields(issue, params.get("fields"))
+        if "transitions" in params.get("expand", ""):
+            result = {**result, "transitions": jira.transitions()}
+        return 200, result
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                # Headers and body are written separately, avoid waiting on delayed ACKs between them
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def log_message(self, *args):
+                pass
+
+            def _serve(self, method: str):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw_body = self.rfile.read(length) if length else b""
+                if self.path == "/__stats":
+                    self._reply(200, {"requests": server.requests, "rate_limited": server.rate_limited})
+                    return
+                server.requests += 1
+                if server.bucket is not None and not server.bucket.take():
+                    server.rate_limited += 1
+                    self._reply(429, {"errorMessages": ["Rate limit exceeded"]}, {"Retry-After": "1"})
+                    return
+                delay = server.latency + random.random() * server.jitter
+                if delay > 0:
+                    time.sleep(delay)
+                url = urlsplit(self.path)
+                params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+                body = json.loads(raw_body) if raw_body else {}
+                status, payload = server.route(method, url.path, params, body)
+                self._reply(status, payload)
+
+            def _reply(self, status: int, payload: Any, headers: Dict[str, str] | None = None):
+                data = json.dumps(payload).encode() if payload is not None else b""
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                self._serve("GET")
+
+            def do_POST(self):
+                self._serve("POST")
+
+            def do_PUT(self):
+                self._serve("PUT")
+
+        return Handler
+
+def _serve_forever(options: Dict[str, Any], ready: "multiprocessing.Queue") -> None:
+    server = FakeJiraServer(**options)
+    ready.put(server.url)
+    server._httpd.serve_forever()
+
+def start_process(**options) -> Tuple[multiprocessing.Process, str]:
+    """Run a FakeJiraServer in a child process. Returns the process and the server URL."""
+    ready: multiprocessing.Queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_serve_forever, args=(options, ready), daemon=True)
+    process.start()
+    return process, ready.get(timeout=60)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve a fake Jira Server/DC REST API")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.01, help="random extra latency in seconds")
+    parser.add_argument("--rate-limit", type=float, default=0, help="requests per second before 429s (0: off)")
+    parser.add_argument("--issues", type=int, default=500, help="issues per project")
+    parser.add_argument("--payload", type=int, default=2000, help="description size in bytes")
+    parser.add_argument("--projects", default="ENG,OPS", help="comma separated project keys")
+    args = parser.parse_args()
+    server = FakeJiraServer(latency=args.latency, jitter=args.jitter, rate_limit=args.rate_limit, port=args.port,
+                            issues_per_project=args.issues, description_bytes=args.payload,
+                            projects=tuple(args.projects.split(",")))
+    print(f"Fake Jira listening on {server.url}")
+    server._httpd.serve_forever()
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,22 @@
-from .client import JiraClient
+from .client import JiraClient, JIRA_MAX_CONCURRENCY
+from .cache import ResponseCache
+from .metrics import METRICS, Metrics
+from .metadata import MetadataIndex
+from .mirror import IssueMirror
 from .issue import ManageIssues
 from .project import ManageProjects
+from .registry import ClientRegistry, Tenant
 
 __all__ = [
     "JiraClient",
+    "JIRA_MAX_CONCURRENCY",
+    "ResponseCache",
+    "Metrics",
+    "METRICS",
+    "MetadataIndex",
+    "IssueMirror",
     "ManageIssues",
     "ManageProjects",
+    "ClientRegistry",
+    "Tenant",
 ]
\ No newline at end of file
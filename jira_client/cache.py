@@ -0,0 +1,124 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+class ResponseCache:
+    """Bounded in-process cache for read-only Jira responses.
+
+    Entries expire after a per-namespace TTL and the least recently used entry is
+    evicted once the cache is full. Keys are tuples of the form
+    ``(namespace, issue_key, *params)`` so every entry belonging to an issue can be
+    dropped when a write touches it. Issue keys are stored stripped and in upper case,
+    the way invalidate() compares them.
+
+    A load is only stored when its issue was not invalidated while it ran, so a read
+    racing a write cannot put the pre-write response back into the cache.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttls: Dict[str, float] | None = None):
+        self.max_entries = max_entries
+        self.ttls = dict(ttls or {})
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        # Hits and misses per namespace
+        self._namespaces: Dict[Hashable, List[int]] = {}
+        # Loads in flight and invalidations seen since the first of them started, per issue key
+        self._loading: Dict[Hashable, List[int]] = {}
+        # Bumped by clear(), which invalidates every load in flight
+        self._generation = 0
+
+    def get(self, key: Tuple[Hashable, ...]) -> Tuple[bool, Any]:
+        """Return ``(found, value)`` for a key, dropping it if it has expired."""
+        with self._lock:
+            counters = self._namespaces.setdefault(key[0], [0, 0])
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    counters[0] += 1
+                    return True, value
+                del self._entries[key]
+            self.misses += 1
+            counters[1] += 1
+            return False, None
+
+    def set(self, key: Tuple[Hashable, ...], value: Any) -> None:
+        """Store a value using the TTL configured for the key's namespace."""
+        with self._lock:
+            self._store(key, value)
+
+    def get_or_load(self, key: Tuple[Hashable, ...], loader: Callable[[], Any]) -> Any:
+        """Return the cached value for a key, calling ``loader`` on a miss."""
+        found, value = self.get(key)
+        if found:
+            return value
+        issue_key = key[1] if len(key) > 1 else None
+        with self._lock:
+            loading = self._loading.setdefault(issue_key, [0, 0])
+            loading[0] += 1
+            started = (self._generation, loading[1])
+        loaded = False
+        try:
+            value = loader()
+            loaded = True
+        finally:
+            with self._lock:
+                loading[0] -= 1
+                if not loading[0]:
+                    del self._loading[issue_key]
+                if loaded and (self._generation, loading[1]) == started:
+                    self._store(key, value)
+        return value
+
+    def invalidate(self, issue_key: str) -> None:
+        """Drop every entry cached for an issue."""
+        issue_key = issue_key.strip().upper()
+        with self._lock:
+            stale = [key for key in self._entries if len(key) > 1 and key[1] == issue_key]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+            if issue_key in self._loading:
+                self._loading[issue_key][1] += 1
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def _store(self, key: Tuple[Hashable, ...], value: Any) -> None:
+        # Called with the lock held
+        ttl = self.ttls.get(key[0], 0)
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters, overall and per namespace, and the current size of the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'ttls': dict(self.ttls),
+                'namespaces': {namespace: {'hits': hits, 'misses': misses,
+                                           'hit_rate': round(hits / (hits + misses), 4) if hits + misses else 0.0}
+                               for namespace, (hits, misses) in self._namespaces.items()},
+            }
@@ -0,0 +1,61 @@
+import base64
+import binascii
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Set, Tuple
+
+# Format of Jira timestamps, e.g. 2025-06-01T10:00:00.000+0000
+JIRA_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+def parse_jira_time(value: str | None) -> int | None:
+    """Convert a Jira timestamp to epoch milliseconds, None when it is missing or malformed."""
+    try:
+        return int(datetime.strptime(value, JIRA_TIME_FORMAT).timestamp() * 1000)
+    except (TypeError, ValueError):
+        return None
+
+def query_fingerprint(jql: str) -> str:
+    """Short hash tying a cursor to the query it was issued for."""
+    return hashlib.sha256(jql.strip().encode()).hexdigest()[:16]
+
+def encode_cursor(jql: str, since: int | None, keys: Set[str], baseline: bool = False) -> str:
+    """Build the opaque cursor of a change feed.
+
+    It records the newest update seen, in Jira's clock, None while no issue was seen,
+    the issues updated in that same millisecond, which the next poll must not report
+    again, and whether the baseline was cut off and continues on the next poll.
+    """
+    state = {'q': query_fingerprint(jql), 't': since, 'k': sorted(keys), 'b': baseline}
+    return base64.urlsafe_b64encode(json.dumps(state, separators=(",", ":")).encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str, jql: str) -> Tuple[int | None, Set[str], bool]:
+    """Return the (since, keys, baseline) of a cursor, which must have been issued for the same query."""
+    try:
+        state = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        since = None if state['t'] is None else int(state['t'])
+        keys, baseline, fingerprint = set(state['k']), bool(state.get('b')), state['q']
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise ValueError("Invalid change feed cursor") from None
+    if fingerprint != query_fingerprint(jql):
+        raise ValueError("The cursor was issued for a different query")
+    return since, keys, baseline
+
+def field_changes(issue: Dict[str, Any], since: int) -> Tuple[Set[str], List[Dict[str, Any]]]:
+    """Return the ids of the fields changed after since, and those changes oldest first."""
+    changed: Set[str] = set()
+    changes: List[Dict[str, Any]] = []
+    histories = (issue.get('changelog') or {}).get('histories') or []
+    for history in sorted(histories, key=lambda history: parse_jira_time(history.get('created')) or 0):
+        created = parse_jira_time(history.get('created'))
+        if created is None or created <= since:
+            continue
+        author = (history.get('author') or {}).get('displayName')
+        for item in history.get('items') or []:
+            field = item.get('fieldId') or item.get('field')
+            changed.add(field)
+            changes.append({key: value for key, value in (('field', field), ('from', item.get('fromString')),
+                                                          ('to', item.get('toString')), ('author', author),
+                                                          ('at', history.get('created')))
+                            if value is not None})
+    return changed, changes
@@ -1,17 +1,113 @@
 import os
+from typing import TYPE_CHECKING
 from dotenv import load_dotenv
-from atlassian import Jira
+from .metrics import METRICS, Metrics
+
+if TYPE_CHECKING:
+    from atlassian import Jira
 # Loads variables from .env into the environment
-load_dotenv() 
+load_dotenv()
 
 JIRA_URL = os.environ.get("JIRA_URL")
 JIRA_PERSONAL_ACCESS_TOKEN = os.environ.get("JIRA_PERSONAL_ACCESS_TOKEN")
+# Maximum number of Jira requests the server runs at the same time
+JIRA_MAX_CONCURRENCY = int(os.environ.get("JIRA_MAX_CONCURRENCY", "8"))
+# Seconds to wait for Jira to answer a single request
+JIRA_TIMEOUT = int(os.environ.get("JIRA_TIMEOUT", "30"))
+# Retries for rate limited (429) or unavailable (503) responses
+JIRA_MAX_RETRIES = int(os.environ.get("JIRA_MAX_RETRIES", "5"))
+JIRA_BACKOFF_FACTOR = float(os.environ.get("JIRA_BACKOFF_FACTOR", "0.5"))
+JIRA_MAX_BACKOFF_SECONDS = float(os.environ.get("JIRA_MAX_BACKOFF_SECONDS", "60"))
+# Jira requests per second per tenant before requests wait (0 for no limit), and the burst allowed above it
+# (0 for a tenth of the rate)
+JIRA_RATE_LIMIT = float(os.environ.get("JIRA_RATE_LIMIT", "0"))
+JIRA_RATE_BURST = int(os.environ.get("JIRA_RATE_BURST", "0")) or None
+# Issues requested per page when walking JQL results, and pages fetched in parallel
+JIRA_PAGE_SIZE = int(os.environ.get("JIRA_PAGE_SIZE", "100"))
+JIRA_PAGE_CONCURRENCY = int(os.environ.get("JIRA_PAGE_CONCURRENCY", "4"))
+# Single requests run in parallel by the bulk tools
+JIRA_BULK_CONCURRENCY = int(os.environ.get("JIRA_BULK_CONCURRENCY", "4"))
+# Issues requested per page by aggregate scans, which only fetch the grouped fields
+JIRA_AGGREGATE_PAGE_SIZE = int(os.environ.get("JIRA_AGGREGATE_PAGE_SIZE", "1000"))
+# Maximum number of issues returned by get_issue_graph
+JIRA_GRAPH_MAX_NODES = int(os.environ.get("JIRA_GRAPH_MAX_NODES", "200"))
+# Default response budgets in bytes for get_issue and get_issue_comments (0 disables)
+JIRA_ISSUE_MAX_BYTES = int(os.environ.get("JIRA_ISSUE_MAX_BYTES", "16000"))
+JIRA_COMMENTS_MAX_BYTES = int(os.environ.get("JIRA_COMMENTS_MAX_BYTES", "16000"))
+# Characters get_issue_description returns before truncating the description (0 disables)
+JIRA_DESCRIPTION_MAX_CHARS = int(os.environ.get("JIRA_DESCRIPTION_MAX_CHARS", "16000"))
+# Response cache for read-only tools, TTLs are in seconds (0 disables caching)
+JIRA_CACHE_MAX_ENTRIES = int(os.environ.get("JIRA_CACHE_MAX_ENTRIES", "1024"))
+JIRA_CACHE_TTLS = {
+    "issue": float(os.environ.get("JIRA_CACHE_TTL_ISSUE", "60")),
+    "comments": float(os.environ.get("JIRA_CACHE_TTL_COMMENTS", "60")),
+    "links": float(os.environ.get("JIRA_CACHE_TTL_LINKS", "120")),
+    "projects": float(os.environ.get("JIRA_CACHE_TTL_PROJECTS", "600")),
+    # Workflow transitions per (project, issue type, status), and the last seen state of an issue
+    "transitions": float(os.environ.get("JIRA_CACHE_TTL_TRANSITIONS", "3600")),
+    "state": float(os.environ.get("JIRA_CACHE_TTL_ISSUE", "60")),
+    # Instance metadata such as the statuses, priorities and issue types
+    "metadata": float(os.environ.get("JIRA_CACHE_TTL_METADATA", "3600")),
+}
+# Optional local SQLite mirror of selected projects (an empty path disables it)
+JIRA_MIRROR_PATH = os.environ.get("JIRA_MIRROR_PATH", "")
+# Seconds a mirrored project is served without syncing it again
+JIRA_MIRROR_MAX_AGE = float(os.environ.get("JIRA_MIRROR_MAX_AGE", "300"))
+# Projects loaded into the mirror on first read, comma separated
+JIRA_MIRROR_PROJECTS = [project.strip().upper() for project in os.environ.get("JIRA_MIRROR_PROJECTS", "").split(",")
+                        if project.strip()]
+# Extra minutes added to the windows of incremental mirror syncs and change feed polls,
+# absorbing clock skew between Jira and this server
+JIRA_SYNC_OVERLAP_MINUTES = int(os.environ.get("JIRA_SYNC_OVERLAP_MINUTES", "5"))
+# Further Jira instances served by the same process, selected per tool call, as JSON {"name": {"url": "..."}}.
+# Parsed by ClientRegistry on first use.
+JIRA_TENANTS = os.environ.get("JIRA_TENANTS", "")
+# Jira requests in flight per tenant, further requests wait for a pooled connection
+JIRA_TENANT_MAX_CONCURRENCY = int(os.environ.get("JIRA_TENANT_MAX_CONCURRENCY", str(JIRA_MAX_CONCURRENCY)))
+# Seconds after which an unused tenant's client, connections and cache are dropped
+JIRA_TENANT_IDLE_SECONDS = float(os.environ.get("JIRA_TENANT_IDLE_SECONDS", "900"))
+# Directory export_issues writes into, export paths are relative to it
+JIRA_EXPORT_DIR = os.environ.get("JIRA_EXPORT_DIR", "exports")
+# Transport of `python jira_mcp_server.py`: "stdio", "sse" or "streamable-http". FASTMCP_HOST and FASTMCP_PORT
+# set the address of the HTTP transports.
+JIRA_MCP_TRANSPORT = os.environ.get("JIRA_MCP_TRANSPORT", "stdio")
+# Server processes of the streamable HTTP transport, each with its own clients and caches
+JIRA_MCP_WORKERS = int(os.environ.get("JIRA_MCP_WORKERS", "1"))
+# Handle every streamable HTTP request on its own, without a session bound to one process
+JIRA_MCP_STATELESS_HTTP = os.environ.get("JIRA_MCP_STATELESS_HTTP", "true").lower() in ("1", "true", "yes")
+# Seconds open requests get to finish on shutdown before they are cancelled
+JIRA_MCP_SHUTDOWN_SECONDS = float(os.environ.get("JIRA_MCP_SHUTDOWN_SECONDS", "30"))
+# Seconds the readiness check fails after the shutdown signal before connections are refused
+JIRA_MCP_DRAIN_SECONDS = float(os.environ.get("JIRA_MCP_DRAIN_SECONDS", "0"))
+# Path of the Prometheus metrics endpoint served with the SSE and HTTP transports (empty disables it)
+JIRA_METRICS_PATH = os.environ.get("JIRA_METRICS_PATH", "/metrics")
 
 class JiraClient:
-    def __init__(self):
-        """Instantiate and return a Jira client."""
-        self.client = Jira(
-            url=JIRA_URL,
-            token=JIRA_PERSONAL_ACCESS_TOKEN
+    def __init__(self, pool_size: int = JIRA_MAX_CONCURRENCY, timeout: int = JIRA_TIMEOUT,
+                 metrics: Metrics = METRICS, url: str | None = JIRA_URL,
+                 token: str | None = JIRA_PERSONAL_ACCESS_TOKEN):
+        """Instantiate and return a Jira client backed by a pooled keep-alive session.
+
+        At most pool_size requests are in flight at once, further requests wait for a
+        pooled connection, and every request is paced by the session's token bucket.
+        The atlassian and requests packages are imported here rather than with the
+        module, so importing jira_client stays cheap until a client is actually needed.
+        """
+        if not url:
+            raise ValueError("JIRA_URL is not set")
+        from atlassian import Jira
+        from .session import build_session
+        self.url = url
+        self.metrics = metrics
+        self.session = build_session(pool_size, metrics)
+        self.limiter = self.session.limiter
+        self.client: "Jira" = Jira(
+            url=url,
+            token=token,
+            timeout=timeout,
+            session=self.session
         )
 
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.session.close()
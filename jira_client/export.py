@@ -0,0 +1,193 @@
+import csv
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+from .client import JIRA_EXPORT_DIR
+
+EXPORT_FORMATS = ("ndjson", "csv", "parquet")
+# Rows of a Parquet part file, buffered in memory until the part is written
+PARQUET_PART_ROWS = 10000
+# Attributes naming a referenced Jira object (status, user, option, ...) in CSV and Parquet cells
+_NAME_ATTRIBUTES = ("name", "value", "key", "displayName")
+
+def export_path(path: str, root: str = JIRA_EXPORT_DIR) -> Path:
+    """Resolve an export path, which must stay inside the export directory."""
+    base = Path(root).resolve()
+    target = (base / path).resolve()
+    if target == base or base not in target.parents:
+        raise ValueError(f"Export paths must be inside the export directory {base}")
+    target.parent.mkdir(parents=True, exist_ok=True)
+    return target
+
+def state_path(target: Path) -> Path:
+    """Path of the file recording the progress of an export, next to the export itself."""
+    return target.with_name(target.name + ".export.json")
+
+def load_state(target: Path) -> Dict[str, Any] | None:
+    try:
+        return json.loads(state_path(target).read_text())
+    except FileNotFoundError:
+        return None
+
+def save_state(target: Path, state: Dict[str, Any]) -> None:
+    # Written to a temporary file first so an interrupted export never leaves a partial state
+    temporary = state_path(target).with_suffix(".tmp")
+    temporary.write_text(json.dumps(state))
+    os.replace(temporary, state_path(target))
+
+def remove_state(target: Path) -> None:
+    state_path(target).unlink(missing_ok=True)
+
+def checkpoint_on_disk(target: Path, checkpoint: Dict[str, Any]) -> bool:
+    """Whether everything a checkpoint covers is still on disk, so the export can continue after it."""
+    if 'parts' in checkpoint:
+        return all((target / f"part-{part:05d}.parquet").is_file() for part in range(checkpoint['parts']))
+    return target.is_file() and target.stat().st_size >= checkpoint['bytes']
+
+def export_size(target: Path) -> int:
+    """Bytes on disk of an export file, or of the part files of a Parquet export directory."""
+    if target.is_dir():
+        return sum(part.stat().st_size for part in target.glob("part-*.parquet"))
+    return target.stat().st_size if target.exists() else 0
+
+def export_columns(fields: str, format: str) -> List[str] | None:
+    """Return the columns of a CSV or Parquet export, None for NDJSON which keeps whole issues."""
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"format must be one of: {', '.join(EXPORT_FORMATS)}")
+    if format == "ndjson":
+        return None
+    names = [field.strip() for field in fields.split(",") if field.strip()]
+    if any(name.startswith("*") for name in names):
+        raise ValueError("CSV and Parquet exports need the fields listed explicitly")
+    return ["key", "id", *(name for name in names if name not in ("key", "id"))]
+
+def flatten_value(value: Any) -> str | None:
+    """Render a field value as a single cell: the name of referenced objects, lists comma separated."""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        name = next((value[attribute] for attribute in _NAME_ATTRIBUTES if value.get(attribute) is not None), None)
+        return str(name) if name is not None else json.dumps(value, separators=(",", ":"))
+    if isinstance(value, list):
+        return ", ".join(cell for cell in (flatten_value(item) for item in value) if cell)
+    return str(value)
+
+def open_writer(format: str, target: Path, columns: List[str] | None, state: Dict[str, Any] | None = None):
+    """Open the writer of a format, continuing after the checkpoint in state when given."""
+    writer = {"ndjson": NdjsonWriter, "csv": CsvWriter, "parquet": ParquetWriter}[format]
+    return writer(target, columns, state)
+
+class NdjsonWriter:
+    """Writes one compact JSON issue per line, flushing after every page."""
+
+    def __init__(self, target: Path, columns: List[str] | None = None, state: Dict[str, Any] | None = None):
+        self.rows = state['rows'] if state else 0
+        if state:
+            # Drop whatever was written after the last checkpoint
+            self._file = open(target, "r+b")
+            self._file.truncate(state['bytes'])
+            self._file.seek(0, os.SEEK_END)
+        else:
+            self._file = open(target, "wb")
+
+    def write(self, issues: List[Dict[str, Any]]) -> None:
+        lines = []
+        for issue in issues:
+            fields = {name: value for name, value in (issue.get('fields') or {}).items() if value is not None}
+            lines.append(json.dumps({'key': issue.get('key'), 'id': issue.get('id'), 'fields': fields},
+                                    separators=(",", ":")).encode() + b"\n")
+        self._file.write(b"".join(lines))
+        self._file.flush()
+        self.rows += len(issues)
+
+    def checkpoint(self) -> Dict[str, int]:
+        """Return the rows and bytes that are safely on disk."""
+        return {'rows': self.rows, 'bytes': self._file.tell()}
+
+    def close(self) -> None:
+        self._file.close()
+
+class CsvWriter:
+    """Writes a header and one row per issue with flattened field values, flushing after every page."""
+
+    def __init__(self, target: Path, columns: List[str], state: Dict[str, Any] | None = None):
+        self.columns = columns
+        self.rows = state['rows'] if state else 0
+        if state:
+            with open(target, "r+b") as file:
+                file.truncate(state['bytes'])
+        self._file = open(target, "a" if state else "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        if not state:
+            self._writer.writerow(columns)
+
+    def write(self, issues: List[Dict[str, Any]]) -> None:
+        for issue in issues:
+            fields = issue.get('fields') or {}
+            self._writer.writerow([issue.get('key'), issue.get('id'),
+                                   *(flatten_value(fields.get(name)) for name in self.columns[2:])])
+        self._file.flush()
+        self.rows += len(issues)
+
+    def checkpoint(self) -> Dict[str, int]:
+        return {'rows': self.rows, 'bytes': os.fstat(self._file.fileno()).st_size}
+
+    def close(self) -> None:
+        self._file.close()
+
+class ParquetWriter:
+    """Writes a directory of Parquet part files with one string column per field.
+
+    Rows are buffered until PARQUET_PART_ROWS are collected, so checkpoints only cover
+    finished parts and a resumed export rewrites at most the last part. Needs pyarrow.
+    """
+
+    def __init__(self, target: Path, columns: List[str], state: Dict[str, Any] | None = None):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ValueError("Parquet exports need pyarrow, install it with `pip install pyarrow`") from None
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self.target = target
+        self.columns = columns
+        self.schema = pyarrow.schema([(column, pyarrow.string()) for column in columns])
+        self.parts = state['parts'] if state else 0
+        self._committed = state['rows'] if state else 0
+        target.mkdir(parents=True, exist_ok=True)
+        # Parts written after the last checkpoint are written again
+        for part in target.glob("part-*.parquet"):
+            if int(part.stem.split("-")[1]) >= self.parts:
+                part.unlink()
+        self._buffer: List[List[str | None]] = [[] for _ in columns]
+
+    @property
+    def rows(self) -> int:
+        return self._committed + len(self._buffer[0])
+
+    def write(self, issues: List[Dict[str, Any]]) -> None:
+        for issue in issues:
+            fields = issue.get('fields') or {}
+            self._buffer[0].append(issue.get('key'))
+            self._buffer[1].append(issue.get('id'))
+            for index, name in enumerate(self.columns[2:], start=2):
+                self._buffer[index].append(flatten_value(fields.get(name)))
+        if len(self._buffer[0]) >= PARQUET_PART_ROWS:
+            self._writePart()
+
+    def checkpoint(self) -> Dict[str, int]:
+        return {'rows': self._committed, 'bytes': export_size(self.target), 'parts': self.parts}
+
+    def close(self) -> None:
+        if self._buffer[0]:
+            self._writePart()
+
+    def _writePart(self) -> None:
+        table = self._pa.Table.from_arrays([self._pa.array(column, self._pa.string()) for column in self._buffer],
+                                           schema=self.schema)
+        self._pq.write_table(table, self.target / f"part-{self.parts:05d}.parquet")
+        self._committed += len(self._buffer[0])
+        self.parts += 1
+        self._buffer = [[] for _ in self.columns]
@@ -1,13 +1,66 @@
-import json
-from .client import Jira
-from models import DEFAULT_READ_JIRA_FIELDS
-from typing import Dict, Any, Optional
+import itertools
+import math
+import re
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from .cache import ResponseCache
+from .changes import decode_cursor, encode_cursor, field_changes, parse_jira_time
+from .client import JIRA_CACHE_MAX_ENTRIES, JIRA_CACHE_TTLS, JIRA_PAGE_SIZE, JIRA_PAGE_CONCURRENCY, \
+    JIRA_BULK_CONCURRENCY, JIRA_AGGREGATE_PAGE_SIZE, JIRA_GRAPH_MAX_NODES, JIRA_MIRROR_MAX_AGE, JIRA_MIRROR_PROJECTS, JIRA_SYNC_OVERLAP_MINUTES
+from .export import checkpoint_on_disk, export_columns, export_path, export_size, load_state, open_writer, \
+    remove_state, save_state
+from .metadata import MetadataIndex
+from .mirror import IssueMirror, MIRROR_FIELDS, SYNC_FIELDS
+from .shaping import normalize
+from models import DEFAULT_READ_JIRA_FIELDS, SEARCH_RESULT_JIRA_FIELDS, JiraIssue, compact_issue
+from typing import TYPE_CHECKING, Callable, Dict, Any, Iterator, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from atlassian import Jira
+
+DEFAULT_ISSUE_FIELDS = ",".join(sorted(DEFAULT_READ_JIRA_FIELDS))
+# Limits for `key in (...)` batch queries, kept well below Jira's URL length limits
+MAX_KEYS_PER_QUERY = 50
+MAX_KEYS_JQL_LENGTH = 2000
+# Most queries run by one RunJqlBatch call
+MAX_BATCH_QUERIES = 20
+# Issues per request to Jira's /issue/bulk endpoint
+MAX_BULK_CREATE_ISSUES = 50
+# Fields fetched for every issue visited by GetIssueGraph, and its deepest walk
+GRAPH_FIELDS = "summary,status,issuelinks"
+MAX_GRAPH_DEPTH = 5
+# group_by dimensions of AggregateIssues and the Jira field behind each of them
+AGGREGATE_DIMENSIONS = {
+    "status": "status",
+    "assignee": "assignee",
+    "priority": "priority",
+    "issuetype": "issuetype",
+    "label": "labels",
+}
+# Dimensions whose values can be listed up front and counted with one query each
+COUNTABLE_DIMENSIONS = {"status", "priority", "issuetype"}
+# Group of issues without a value, and of issues no count query matched
+NO_VALUE = "(none)"
+OTHER_VALUE = "(other)"
+# Times a change feed walk starts over after issues moved under its page offset
+MAX_CHANGES_RESTARTS = 3
+ORDER_BY_CLAUSE = re.compile(r"\s*\bORDER\s+BY\b.*$", re.IGNORECASE | re.DOTALL)
+# Upper case Jira issue key, e.g. ENG-12
+ISSUE_KEY = re.compile(r"^[A-Z][A-Z0-9_]*-\d+$")
 
 class ManageIssues:
     """Class for managing Jira issues."""
 
-    def __init__(self, jira_client: Jira):
+    def __init__(self, jira_client: "Jira", cache: ResponseCache | None = None, mirror: IssueMirror | None = None,
+                 mirror_max_age: float = JIRA_MIRROR_MAX_AGE, typed_results: bool = True):
         self.jira = jira_client
+        self.cache = cache or ResponseCache(JIRA_CACHE_MAX_ENTRIES, JIRA_CACHE_TTLS)
+        self.mirror = mirror
+        self.mirror_max_age = mirror_max_age
+        # Return issues as JiraIssue models, or as the dicts they serialize to for callers that only send them on
+        self.typed_results = typed_results
+        self.metadata = MetadataIndex(self.jira, self.cache)
 
     def GetIssuesForBoard(
             self,
@@ -15,31 +68,57 @@ class ManageIssues:
             jql: str = "",
             fields: str | None = None,
             start: int = 0,
-            limit: int = 50) -> str:
+            limit: int = 50) -> List[JiraIssue]:
         """Get issues for a specific board."""
-        fields_param = fields or ",".join(DEFAULT_READ_JIRA_FIELDS)
+        fields_param = fields or DEFAULT_ISSUE_FIELDS
         issues = self.jira.get_issues_for_board(board_id=board_id, jql=jql,
                             fields=fields_param, start=start, limit=limit)
-        return json.dumps(issues, indent=4)
+        return self._getFilteredIssues(issues.get('issues', []))
 
-    def GetIssuesForProject(self, project_key: str, fields: str | None = None, start: int = 0, limit: int = 50) -> str:
-        """Get issues for a specific project."""
-        fields_param = fields or ",".join(DEFAULT_READ_JIRA_FIELDS)
+    def GetIssuesForProject(self, project_key: str, fields: str | None = None, start: int = 0,
+                            limit: int = 50) -> List[JiraIssue]:
+        """Get issues for a specific project, from the local mirror when the project is mirrored."""
+        fields_param = fields or DEFAULT_ISSUE_FIELDS
+        if self._mirrorFields(fields_param) and self._useMirror(project_key):
+            issues = self.mirror.issues(project_key.strip().upper(), start, limit)
+            return self._getFilteredIssues([self._projectFields(issue, fields_param) for issue in issues])
         issues = self.jira.get_all_project_issues(project_key, fields=fields_param, start=start, limit=limit)
-        return json.dumps(issues, indent=4)
+        return self._getFilteredIssues(issues)
 
-    def GetIssue(self, key: str):
-        """Get a single issue by key."""
-        issue = self.jira.issue(key)
+    def GetIssue(self, key: str, fields: str | None = None, expand: str | None = None):
+        """Get a single issue by key.
 
-        # Filter out null fields recursively if issue is a dictionary
+        Only the requested fields are fetched from Jira (DEFAULT_READ_JIRA_FIELDS when
+        omitted, "*all" for every field). Expansions such as changelog are only
+        requested when asked for. Issues of mirrored projects are read from the local
+        mirror when it holds every requested field. Null and empty values, links and
+        avatars are stripped, see normalize.
+        """
+        fields_param = fields or DEFAULT_ISSUE_FIELDS
+        if expand is None and self._mirrorFields(fields_param) and self._useMirror(key.split('-')[0]):
+            issue = self.mirror.issue(key.strip().upper())
+            if issue is not None:
+                return normalize(self._projectFields(issue, fields_param))
+        return self.cache.get_or_load(("issue", key.strip().upper(), fields_param, expand),
+                                      lambda: self._fetchIssue(key, fields_param, expand))
+
+    def _fetchIssue(self, key: str, fields: str = DEFAULT_ISSUE_FIELDS, expand: str | None = None):
+        """Fetch a single issue from Jira, bypassing the cache."""
+        issue = self.jira.issue(key, fields=fields, expand=expand)
+
+        # Strip nulls and link noise if issue is a dictionary
         if isinstance(issue, dict):
-            return self._remove_null_values(issue)
+            self._rememberState(issue)
+            return normalize(issue, expand)
         return issue
 
     def GetIssueComments(self, issue_id_or_key: str):
-        """Get comments for a single issue."""
-        return self.jira.issue_get_comments(issue_id_or_key)
+        """Get comments for a single issue. Only comments of issues given by key are cached."""
+        # Writes invalidate by key, so comments fetched by numeric issue id would go stale
+        if issue_id_or_key.strip().isdigit():
+            return self.jira.issue_get_comments(issue_id_or_key)
+        return self.cache.get_or_load(("comments", issue_id_or_key.strip().upper()),
+                                      lambda: self.jira.issue_get_comments(issue_id_or_key))
 
     def AddComment(self, issue_key: str, comment: str) -> Dict[str, Any]:
         """Add a comment to a Jira issue.
@@ -53,14 +132,306 @@ class ManageIssues:
         """
         try:
             result = self.jira.issue_add_comment(issue_key, comment)
+            self._invalidate(issue_key)
             return result if result else {'success': True}
         except Exception as e:
             return {'error': str(e)}
 
-    def GetIssues(self, jql: str):
-        """Get Issues filtered using JQL"""
-        issues = self.jira.jql(jql)
-        return self._getFilteredIssues(issues)
+    def GetIssues(self, jql: str, max_results: int | None = 50, fields: str | None = None) -> List[JiraIssue]:
+        """Get Issues filtered using JQL, following pages up to max_results (None for all)."""
+        filtered_issues = []
+        for page, _ in self.IterIssuePages(jql, fields=fields, max_results=max_results):
+            filtered_issues.extend(page)
+        return filtered_issues
+
+    def RunJqlBatch(self, queries: Dict[str, str], fields: str | None = None, limit: int | None = 50,
+                    concurrency: int = JIRA_BULK_CONCURRENCY) -> Dict[str, Any]:
+        """Run several JQL queries at the same time, e.g. the same question for several projects.
+
+        Every query follows the GetIssues path. A failing query carries an error and does
+        not fail the others.
+
+        Args:
+            queries: JQL queries by name
+            fields: Comma separated extra fields to return for every issue
+            limit: Maximum number of issues per query (None for all)
+            concurrency: Number of queries run in parallel
+
+        Returns:
+            Dictionary with the issues, count or error and the seconds taken of every query
+            by name, and the seconds taken by the whole batch
+        """
+        if len(queries) > MAX_BATCH_QUERIES:
+            raise ValueError(f"At most {MAX_BATCH_QUERIES} queries can be run at once")
+        started = time.perf_counter()
+
+        def run(name: str) -> Dict[str, Any]:
+            query_started = time.perf_counter()
+            try:
+                issues = self.GetIssues(queries[name], max_results=limit, fields=fields)
+                result = {'count': len(issues), 'issues': issues}
+            except Exception as e:
+                result = {'error': str(e)}
+            result['seconds'] = round(time.perf_counter() - query_started, 3)
+            return result
+
+        names = list(queries)
+        results = self._fanOut(run, names, concurrency)
+        return {'results': dict(zip(names, results)), 'seconds': round(time.perf_counter() - started, 3)}
+
+    def IterIssuePages(self, jql: str, fields: str | None = None, max_results: int | None = None,
+                       page_size: int = JIRA_PAGE_SIZE,
+                       concurrency: int = 1) -> Iterator[Tuple[List[JiraIssue], int]]:
+        """Walk a JQL result set page by page.
+
+        Yields ``(filtered_issues, expected)`` for every page, where ``expected`` is the number
+        of issues the walk will produce in total, so callers can stream results
+        without materializing the whole result set. Once the first page reports ``total``,
+        up to ``concurrency`` later pages are fetched at the same time, and pages are still
+        yielded in order. Results may shift if issues change while the query is walked.
+
+        Args:
+            jql: The JQL query
+            fields: Comma separated extra fields to return for every issue. Only these and
+                the summary and status are requested from Jira.
+            max_results: Maximum number of issues to yield. None walks the whole result set.
+            page_size: Number of issues requested per page
+            concurrency: Number of pages fetched in parallel after the first one
+        """
+        pages = self._iterRawPages(jql, self._searchFields(fields), max_results, page_size, concurrency)
+        try:
+            for issues, end in pages:
+                yield self._getFilteredIssues(issues), end
+        finally:
+            pages.close()
+
+    def _iterRawPages(self, jql: str, fields: str, max_results: int | None = None,
+                      page_size: int = JIRA_PAGE_SIZE, concurrency: int = 1, start: int = 0,
+                      expand: str | None = None) -> Iterator[Tuple[List[Dict[str, Any]], int]]:
+        """Walk a JQL result set like IterIssuePages, yielding raw Jira issues.
+
+        The walk begins at the start offset of the result set, max_results counts from there.
+        expand is passed to every search, e.g. "changelog".
+        """
+        end_limit = None if max_results is None else start + max_results
+
+        def page_limit(position: int) -> int:
+            return page_size if end_limit is None else min(page_size, end_limit - position)
+
+        if max_results is not None and max_results <= 0:
+            return
+
+        first = self.jira.jql(jql, fields=fields, start=start, limit=page_limit(start), expand=expand)
+        issues = first.get('issues', [])
+        total = first.get('total', start + len(issues))
+        end = total if end_limit is None else min(total, end_limit)
+        yield issues, end
+
+        # Jira may cap the page size below what was requested
+        step = len(issues)
+        if not step or start + step >= end:
+            return
+
+        starts = range(start + step, end, step)
+        if concurrency <= 1:
+            for offset in starts:
+                issues = self._fetchPage(jql, fields, offset, min(step, end - offset), expand)
+                if not issues:
+                    return
+                yield issues, end
+            return
+
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            pending = deque()
+            for offset in starts:
+                pending.append(executor.submit(self._fetchPage, jql, fields, offset, min(step, end - offset),
+                                               expand))
+                if len(pending) >= concurrency:
+                    yield pending.popleft().result(), end
+            while pending:
+                yield pending.popleft().result(), end
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetchPage(self, jql: str, fields: str, start: int, limit: int,
+                   expand: str | None = None) -> List[Dict[str, Any]]:
+        """Fetch one page of raw issues for a JQL query."""
+        return self.jira.jql(jql, fields=fields, start=start, limit=limit, expand=expand).get('issues', [])
+
+    def _searchFields(self, fields: str | None) -> str:
+        """Build the fields param for search from the summary and status plus any extra fields."""
+        extra_fields = [f.strip() for f in (fields or "").split(",")
+                        if f.strip() and f.strip() not in SEARCH_RESULT_JIRA_FIELDS]
+        return ",".join([*SEARCH_RESULT_JIRA_FIELDS, *extra_fields])
+
+    def GetIssuesByKeys(self, keys: List[str], fields: str | None = None,
+                        concurrency: int = JIRA_PAGE_CONCURRENCY) -> List[JiraIssue | Dict[str, Any]]:
+        """Get several issues with as few `key in (...)` JQL queries as possible.
+
+        Args:
+            keys: The Jira issue keys
+            fields: Comma separated extra fields to return besides key, summary and status
+            concurrency: Number of chunk queries run in parallel
+
+        Returns:
+            One entry per input key, in input order. Keys that could not be fetched
+            are returned as {'key': ..., 'error': ...}.
+        """
+        found = self._fetchRawByKeys(keys, self._searchFields(fields), concurrency)
+        issues = []
+        for key in keys:
+            issue = found.get(key.strip().upper(), {'key': key, 'error': 'Issue does not exist or is not visible'})
+            issues.append(issue if 'error' in issue else self._issueResult(issue))
+        return issues
+
+    def _fetchRawByKeys(self, keys: List[str], fields: str,
+                        concurrency: int = JIRA_PAGE_CONCURRENCY) -> Dict[str, Dict[str, Any]]:
+        """Fetch raw issues by key with chunked `key in (...)` queries run in parallel.
+
+        Returns:
+            Raw issues by upper case key. Malformed keys and keys of failed chunks map to
+            {'key': ..., 'error': ...}, keys Jira did not return are missing.
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        unique_keys = []
+        for key in dict.fromkeys(key.strip().upper() for key in keys if key.strip()):
+            # A malformed key would be a JQL syntax error failing every key of its chunk
+            if ISSUE_KEY.match(key):
+                unique_keys.append(key)
+            else:
+                found[key] = {'key': key, 'error': 'Invalid issue key'}
+
+        # Chunk keys so every query stays below the key count and JQL length limits
+        chunks: List[List[str]] = []
+        chunk_length = 0
+        for key in unique_keys:
+            if not chunks or len(chunks[-1]) >= MAX_KEYS_PER_QUERY or chunk_length + len(key) > MAX_KEYS_JQL_LENGTH:
+                chunks.append([])
+                chunk_length = 0
+            chunks[-1].append(key)
+            chunk_length += len(key) + 4
+
+        def fetch_chunk(chunk: List[str]) -> Dict[str, Dict[str, Any]]:
+            quoted = ", ".join(f'"{key}"' for key in chunk)
+            jql = f"key in ({quoted})"
+            try:
+                # validate_query=warn keeps unknown keys from failing the whole query
+                result = self.jira.jql(jql, fields=fields, limit=len(chunk), validate_query="warn")
+            except Exception as e:
+                return {key: {'key': key, 'error': str(e)} for key in chunk}
+            return {issue['key']: issue for issue in result.get('issues', [])}
+
+        if len(chunks) <= 1 or concurrency <= 1:
+            for chunk in chunks:
+                found.update(fetch_chunk(chunk))
+        else:
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(chunks))) as executor:
+                for chunk_result in executor.map(fetch_chunk, chunks):
+                    found.update(chunk_result)
+        return found
+
+    def CountIssues(self, jql: str) -> int:
+        """Count the issues matching a JQL query without fetching any of them."""
+        return self.jira.jql(jql, fields="key", limit=0).get('total', 0)
+
+    def AggregateIssues(self, jql: str, group_by: List[str], method: str = "auto",
+                        concurrency: int = JIRA_PAGE_CONCURRENCY) -> Dict[str, Any]:
+        """Count the issues matching a JQL query per status, assignee, priority, issue type or label.
+
+        Two methods are available. "count" runs one maxResults=0 query per known status,
+        priority or issue type, in parallel, and only works for a single one of those
+        dimensions. "scan" walks the result set fetching only the grouped fields and
+        supports any combination of dimensions. "auto" counts when that needs fewer
+        requests than scanning, and scans otherwise.
+
+        Args:
+            jql: The JQL query
+            group_by: Dimensions to group by, any of status, assignee, priority, issuetype and label
+            method: "auto", "count" or "scan"
+            concurrency: Number of queries or pages fetched in parallel
+
+        Returns:
+            Dictionary with the total, the method used, the column names and one row per
+            group, largest first. Issues with several labels count once per label.
+        """
+        dimensions = [dimension.strip().lower() for dimension in group_by]
+        if not dimensions or any(dimension not in AGGREGATE_DIMENSIONS for dimension in dimensions):
+            raise ValueError(f"group_by must list one or more of: {', '.join(AGGREGATE_DIMENSIONS)}")
+        if method not in ("auto", "count", "scan"):
+            raise ValueError('method must be "auto", "count" or "scan"')
+        countable = len(dimensions) == 1 and dimensions[0] in COUNTABLE_DIMENSIONS
+        if method == "count" and not countable:
+            raise ValueError("The count method only supports grouping by a single status, priority or issuetype")
+
+        if countable and method != "scan":
+            total = self.CountIssues(jql)
+            values = self._groupValues(dimensions[0]) if total else []
+            if method == "count" or len(values) + 1 < math.ceil(total / JIRA_AGGREGATE_PAGE_SIZE):
+                counts = self._countGroups(jql, dimensions[0], values, concurrency)
+                missing = total - sum(counts.values())
+                if missing > 0:
+                    counts[(OTHER_VALUE,)] = missing
+                return self._aggregateResult(jql, dimensions, "count", total, counts)
+
+        fields = ",".join(sorted({AGGREGATE_DIMENSIONS[dimension] for dimension in dimensions}))
+        counts: Counter = Counter()
+        total = 0
+        pages = self._iterRawPages(jql, fields, page_size=JIRA_AGGREGATE_PAGE_SIZE, concurrency=concurrency)
+        try:
+            for issues, _ in pages:
+                for issue in issues:
+                    fields_values = issue.get('fields') or {}
+                    counts.update(itertools.product(*(self._groupValuesOf(fields_values, dimension)
+                                                      for dimension in dimensions)))
+                total += len(issues)
+        finally:
+            pages.close()
+        return self._aggregateResult(jql, dimensions, "scan", total, counts)
+
+    def _countGroups(self, jql: str, dimension: str, values: List[str],
+                     concurrency: int) -> Counter:
+        """Count the issues of every group value with one maxResults=0 query each."""
+        base = ORDER_BY_CLAUSE.sub("", jql).strip()
+        field = AGGREGATE_DIMENSIONS[dimension]
+        clauses = {value: f'{field} = "{self._quoteJql(value)}"' for value in values}
+        if dimension == "priority":
+            clauses[NO_VALUE] = f"{field} is EMPTY"
+
+        def count(clause: str) -> int:
+            return self.CountIssues(f"({base}) AND {clause}" if base else clause)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(clauses)))) as executor:
+            totals = list(executor.map(count, clauses.values()))
+        return Counter({(value,): total for value, total in zip(clauses, totals) if total})
+
+    def _groupValues(self, dimension: str) -> List[str]:
+        """List every status, priority or issue type name of the instance."""
+        return self.metadata.names(dimension)
+
+    def _groupValuesOf(self, fields: Dict[str, Any], dimension: str) -> List[str]:
+        """Return the group values of an issue for a dimension."""
+        value = fields.get(AGGREGATE_DIMENSIONS[dimension])
+        if dimension == "label":
+            return list(value) if value else [NO_VALUE]
+        if not isinstance(value, dict):
+            return [NO_VALUE]
+        return [value.get('displayName') or value.get('name') or NO_VALUE]
+
+    def _aggregateResult(self, jql: str, dimensions: List[str], method: str, total: int,
+                         counts: Counter) -> Dict[str, Any]:
+        """Build the compact table returned by AggregateIssues."""
+        return {
+            'jql': jql,
+            'total': total,
+            'method': method,
+            'columns': [*dimensions, 'count'],
+            'rows': [[*group, count] for group, count in sorted(counts.items(), key=lambda item: (-item[1], item[0]))],
+        }
+
+    def _quoteJql(self, value: str) -> str:
+        """Escape a value for use inside a double quoted JQL string."""
+        return value.replace('\\', '\\\\').replace('"', '\\"')
 
     def GetLinkedIssues(self, issue_key: str, relationship_type: str = None):
         """Get issues linked to the specified issue.
@@ -73,7 +444,8 @@ class ManageIssues:
             List of linked issues with their relationship types
         """
         # Get the issue with links
-        issue = self.jira.issue(issue_key, fields="issuelinks")
+        issue = self.cache.get_or_load(("links", issue_key.strip().upper()),
+                                       lambda: self.jira.issue(issue_key, fields="issuelinks"))
         linked_issues = []
 
         if "fields" not in issue or "issuelinks" not in issue["fields"]:
@@ -107,40 +479,456 @@ class ManageIssues:
 
         return linked_issues
 
-    def SearchIssuesByText(self, text: str, max_results: int = 10):
+    def GetIssueGraph(self, root_key: str, depth: int = 2, relationship_types: List[str] | None = None,
+                      max_nodes: int = JIRA_GRAPH_MAX_NODES,
+                      concurrency: int = JIRA_PAGE_CONCURRENCY) -> Dict[str, Any]:
+        """Walk the issue link graph breadth first from a root issue.
+
+        Every level is fetched with batched `key in (...)` queries run in parallel, requesting
+        only the summary, status and links. Issues on the last level are not fetched, their
+        summary and status come from the links pointing at them. Every issue is visited once
+        and no issues are added once the graph holds max_nodes.
+
+        Args:
+            root_key: Key of the issue to start from
+            depth: Number of link hops to follow, at most MAX_GRAPH_DEPTH
+            relationship_types: Only follow these links, matched against the link type name
+                in both directions, or against the description of the link as seen from the
+                issue being expanded (e.g. "is blocked by" only follows links to blockers).
+                None follows every link.
+            max_nodes: Maximum number of issues in the graph
+            concurrency: Number of batched queries run in parallel per level
+
+        Returns:
+            Dictionary with the root, the nodes as {key: {'summary': ..., 'status': ...}}, the
+            edges as an adjacency list {key: [[relationship, key], ...]} using the outward
+            description of every link, whether max_nodes was hit, and keys that could not be fetched
+        """
+        depth = max(1, min(depth, MAX_GRAPH_DEPTH))
+        wanted = {name.strip().lower() for name in relationship_types or [] if name.strip()}
+        root = root_key.strip().upper()
+        nodes: Dict[str, Dict[str, str]] = {root: {}}
+        edges: Dict[str, List[List[str]]] = {}
+        seen_edges = set()
+        missing: List[str] = []
+        truncated = False
+
+        frontier = [root]
+        for _ in range(depth):
+            if not frontier:
+                break
+            found = self._fetchRawByKeys(frontier, GRAPH_FIELDS, concurrency)
+            next_frontier = []
+            for key in frontier:
+                issue = found.get(key)
+                if issue is None or 'error' in issue:
+                    missing.append(key)
+                    continue
+                # The search result has the same shape as the issue GetLinkedIssues caches
+                self.cache.set(("links", key), issue)
+                fields = issue.get('fields') or {}
+                nodes[key] = self._graphNode(fields)
+
+                for link in fields.get('issuelinks') or []:
+                    link_type = link.get('type') or {}
+                    relationship = link_type.get('outward') or link_type.get('name') or 'relates to'
+                    # Store every link once, in its outward direction
+                    if 'outwardIssue' in link:
+                        target = link['outwardIssue']
+                        edge = (key, relationship, target.get('key'))
+                        direction = 'outward'
+                    elif 'inwardIssue' in link:
+                        target = link['inwardIssue']
+                        edge = (target.get('key'), relationship, key)
+                        direction = 'inward'
+                    else:
+                        continue
+                    # Descriptions only match links seen from their side, like in GetLinkedIssues
+                    if wanted and not wanted & {str(link_type.get(name) or '').lower() for name in ('name', direction)}:
+                        continue
+
+                    target_key = target.get('key')
+                    if not target_key:
+                        continue
+                    if target_key not in nodes:
+                        if len(nodes) >= max_nodes:
+                            truncated = True
+                            continue
+                        nodes[target_key] = self._graphNode(target.get('fields') or {})
+                        next_frontier.append(target_key)
+                    if edge not in seen_edges:
+                        seen_edges.add(edge)
+                        edges.setdefault(edge[0], []).append([edge[1], edge[2]])
+            frontier = next_frontier
+
+        return {
+            'root': root,
+            'depth': depth,
+            'nodes': nodes,
+            'edges': edges,
+            'truncated': truncated,
+            'missing': missing,
+        }
+
+    def _graphNode(self, fields: Dict[str, Any]) -> Dict[str, str]:
+        """Reduce issue fields to the summary and status name of a graph node."""
+        return {'summary': fields.get('summary', ''), 'status': (fields.get('status') or {}).get('name', '')}
+
+    def SearchIssuesByText(self, text: str, max_results: int = 10, fields: str | None = None,
+                           project_key: str | None = None,
+                           concurrency: int = 1) -> Iterator[Tuple[List[JiraIssue], int]]:
         """Search for Jira issues containing specific text in title, description, or comments.
 
+        Yields pages like IterIssuePages. Mirrored projects are searched locally and
+        yield a single page, best match first.
+
         Args:
             text: The text to search for
             max_results: Maximum number of issues to return
-
-        Returns:
-            List of matching JiraIssue objects
+            fields: Comma separated extra fields to return for every issue
+            project_key: Only search this project. Mirrored projects are searched locally.
+            concurrency: Number of Jira pages fetched in parallel after the first one
         """
+        if project_key:
+            local_issues = self.SearchMirror(text, project_key, max_results, fields)
+            if local_issues is not None:
+                yield local_issues, len(local_issues)
+                return
+        jql = self.BuildTextSearchJql(text, project_key)
+        yield from self.IterIssuePages(jql, fields=fields, max_results=max_results, concurrency=concurrency)
+
+    def BuildTextSearchJql(self, text: str, project_key: str | None = None) -> str:
+        """Build the JQL used to search issue titles, descriptions and comments for text."""
         # Clean and escape the text for JQL
         # Remove quotes and special chars that could break JQL
         clean_text = text.replace('"', ' ').replace('~', ' ').replace('\\', ' ')
 
         # Create JQL to search in multiple fields including comments
         jql = f'text ~ "{clean_text}" OR summary ~ "{clean_text}" OR description ~ "{clean_text}" OR comment ~ "{clean_text}"'
+        if project_key:
+            jql = f'project = "{project_key.strip()}" AND ({jql})'
+        return jql
 
-        # Execute the search
-        issues = self.jira.jql(jql, limit=max_results)
-        return self._getFilteredIssues(issues)
+    def SearchMirror(self, text: str, project_key: str, max_results: int = 10,
+                     fields: str | None = None) -> List[JiraIssue] | None:
+        """Search the full-text index of a mirrored project, best match first.
 
-    def _getFilteredIssues(self, issues):
-        """FIlter issues to include only important fields"""
-        filtered_issues = []
+        Every word must occur in the summary, description or comments of a match, and
+        double quoted parts of the text must occur as a phrase. Matches are ranked with
+        BM25, weighting summary hits above description and comment hits.
+
+        Returns:
+            The matching issues, or None if the project is not mirrored or the fields are
+            not stored locally, so the caller can search Jira instead
+        """
+        fields_param = self._searchFields(fields)
+        if not self._mirrorFields(fields_param) or not self._useMirror(project_key):
+            return None
+        query = self.BuildTextSearchQuery(text)
+        if not query or max_results <= 0:
+            return []
+        issues = self.mirror.search(query, project_key.strip().upper(), max_results)
+        return self._getFilteredIssues([self._projectFields(issue, fields_param) for issue in issues])
+
+    def BuildTextSearchQuery(self, text: str) -> str:
+        """Build an FTS5 query matching every word of text, keeping double quoted parts as phrases."""
+        terms = []
+        for index, part in enumerate(text.split('"')):
+            # Odd parts were inside double quotes
+            words = [part] if index % 2 else part.split()
+            terms.extend(f'"{word.strip()}"' for word in words if word.strip())
+        return " ".join(terms)
+
+    def _getFilteredIssues(self, issues: List[Dict[str, Any]]) -> List[JiraIssue]:
+        """Convert raw issues to JiraIssue models holding only the fields Jira returned"""
+        return [self._issueResult(issue) for issue in issues]
+
+    def _issueResult(self, issue: Dict[str, Any]) -> JiraIssue | Dict[str, Any]:
+        return JiraIssue.from_raw(issue) if self.typed_results else compact_issue(issue)
+
+    def SyncProject(self, project_key: str, full: bool = False, max_age: float | None = None) -> Dict[str, Any]:
+        """Load a project into the local mirror, or bring it up to date.
+
+        The first sync of a project, or a full one, walks every issue of the project.
+        Later syncs only fetch issues updated since the previous sync started, using a
+        relative `updated >= -Nm` window so Jira and server time zones do not matter.
+
+        Args:
+            project_key: The Jira project key
+            full: Walk every issue again, dropping issues that no longer exist
+            max_age: Skip the sync if the project was synced within this many seconds
+
+        Returns:
+            Dictionary with the project, sync mode, issues fetched and mirrored issue count
+        """
+        if self.mirror is None:
+            return {'error': 'Local mirror is disabled, set JIRA_MIRROR_PATH to enable it'}
+        project = project_key.strip().upper()
+        with self.mirror.sync_lock(project):
+            # Another caller may have synced the project while we waited for the lock
+            if max_age is not None and self.mirror.is_fresh(project, max_age):
+                return {'project': project, 'mode': 'fresh', 'fetched': 0, 'issues': self.mirror.count(project)}
+
+            state = self.mirror.project_state(project)
+            full = full or state is None
+            started = time.time()
+            jql = f'project = "{project}"'
+            if not full:
+                minutes = math.ceil((started - state['sync_started']) / 60) + JIRA_SYNC_OVERLAP_MINUTES
+                jql += f' AND updated >= "-{minutes}m"'
+            # Key order keeps pages stable while issues are updated during the walk
+            jql += ' ORDER BY key ASC'
+
+            fetched = 0
+            pages = self._iterRawPages(jql, ",".join(sorted(SYNC_FIELDS)), concurrency=JIRA_PAGE_CONCURRENCY)
+            try:
+                for issues, _ in pages:
+                    fetched += self.mirror.upsert(project, issues, started)
+            finally:
+                pages.close()
+            dropped = self.mirror.mark_synced(project, started, full)
+            return {'project': project, 'mode': 'full' if full else 'incremental', 'fetched': fetched,
+                    'dropped': dropped, 'issues': self.mirror.count(project),
+                    'seconds': round(time.time() - started, 3)}
+
+    def ExportIssues(self, path: str, format: str = "ndjson", jql: str | None = None, project_key: str | None = None,
+                     board_id: str | None = None, fields: str | None = None, resume: bool = False,
+                     progress: Callable[[int, int], None] | None = None, page_size: int = JIRA_PAGE_SIZE,
+                     concurrency: int = JIRA_PAGE_CONCURRENCY) -> Dict[str, Any]:
+        """Write every issue of a JQL query, project or board to a file, one page at a time.
+
+        Only the page being written is held in memory. After every page the rows and bytes
+        on disk are recorded in a state file next to the export, so an interrupted export
+        can be resumed from its last complete page. An export whose partial file is gone
+        or shorter than its checkpoint starts over. The state file is removed once the
+        export finishes. Issues are walked in key order so resumed pages line up, issues
+        created or deleted during an interrupted export can still shift the offsets.
+
+        Args:
+            path: File to write, relative to JIRA_EXPORT_DIR (a directory for Parquet)
+            format: "ndjson", "csv" or "parquet"
+            jql: JQL query of the issues to export
+            project_key: Export every issue of this project instead
+            board_id: Export every issue of this board instead
+            fields: Comma separated fields to export (defaults to the fields returned by get_issue)
+            resume: Continue an interrupted export of the same source, format and fields
+            progress: Called with the rows written and the expected total after every page
+            page_size: Number of issues requested per page
+            concurrency: Number of pages fetched in parallel
+
+        Returns:
+            Dictionary with the path, format, rows and bytes written and the seconds taken
+        """
+        if sum(source is not None for source in (jql, project_key, board_id)) != 1:
+            raise ValueError("Exactly one of jql, project_key or board_id is required")
+        fields_param = fields or DEFAULT_ISSUE_FIELDS
+        columns = export_columns(fields_param, format)
+        target = export_path(path)
+        if project_key is not None:
+            jql = f'project = "{self._quoteJql(project_key.strip().upper())}"'
+        if jql is not None and not ORDER_BY_CLAUSE.search(jql):
+            # Key order keeps pages stable while issues are updated during the export
+            jql += ' ORDER BY key ASC'
+        source = {'jql': jql} if board_id is None else {'board_id': str(board_id)}
+
+        state = load_state(target) if resume else None
+        if state and (state['source'] != source or state['format'] != format or state['fields'] != fields_param):
+            raise ValueError("The export to resume has a different source, format or fields")
+        if state and not checkpoint_on_disk(target, state['checkpoint']):
+            # The partial export was deleted or cut short, start over
+            state = None
+        resumed_from = state['checkpoint']['rows'] if state else 0
+
+        started = time.time()
+        writer = open_writer(format, target, columns, state['checkpoint'] if state else None)
+        try:
+            if board_id is None:
+                pages = self._iterRawPages(jql, fields_param, page_size=page_size, concurrency=concurrency,
+                                           start=resumed_from)
+            else:
+                pages = self._iterBoardPages(board_id, fields_param, resumed_from, page_size)
+            total = resumed_from
+            try:
+                for issues, total in pages:
+                    writer.write(issues)
+                    save_state(target, {'source': source, 'format': format, 'fields': fields_param,
+                                        'checkpoint': writer.checkpoint(), 'total': total})
+                    if progress:
+                        progress(writer.rows, total)
+            finally:
+                pages.close()
+        finally:
+            writer.close()
+        remove_state(target)
+        return {'path': str(target), 'format': format, 'rows': writer.rows, 'bytes': export_size(target),
+                'total': total, 'resumed_from': resumed_from, 'seconds': round(time.time() - started, 3)}
+
+    def _iterBoardPages(self, board_id: str, fields: str, start: int = 0,
+                        page_size: int = JIRA_PAGE_SIZE) -> Iterator[Tuple[List[Dict[str, Any]], int]]:
+        """Walk the issues of a board page by page, yielding raw issues and the board's total."""
+        while True:
+            page = self.jira.get_issues_for_board(board_id=board_id, jql="", fields=fields,
+                                                  start=start, limit=page_size)
+            issues = page.get('issues', [])
+            total = page.get('total', start + len(issues))
+            if not issues:
+                return
+            yield issues, total
+            start += len(issues)
+            if start >= total:
+                return
+
+    def GetChangesSince(self, jql: str, since_cursor: str | None = None, fields: str | None = None,
+                        max_results: int | None = 500) -> Dict[str, Any]:
+        """Return the issues of a JQL query that changed since a cursor, and the cursor to poll with next.
+
+        Without a cursor every matching issue is returned with the requested fields, as the
+        baseline of the feed. With a cursor only issues updated after it are fetched, using
+        relative `updated >= -Nm` windows so Jira and server time zones do not matter,
+        together with their changelog, see _iterChangedIssues. Changed issues carry only the requested fields that
+        changed, plus every field change with its old and new value, author and time. Issues
+        created after the cursor carry all requested fields. Issues that were updated without
+        a field change, e.g. by a comment, carry no changes. Deleted issues and issues that
+        stopped matching the query are not reported.
+
+        Issues are walked oldest update first, so when more than max_results changed the
+        returned cursor continues right after the last issue returned and `more` is set.
+        A baseline cut off this way continues on the next poll, which again returns full
+        issues and `baseline` until every matching issue was returned once. The cursor
+        only records timestamps taken from Jira, so until the first issue is seen every
+        poll is a baseline.
+
+        Args:
+            jql: The JQL query to follow, the same for every poll of a cursor
+            since_cursor: The cursor returned by the previous call, None to start the feed
+            fields: Comma separated extra fields to return besides the summary and status
+            max_results: Maximum number of issues per call (None for all)
+
+        Returns:
+            Dictionary with the changed issues, the new cursor and whether more changes are pending
+        """
+        query = ORDER_BY_CLAUSE.sub("", jql).strip()
+        fields_param = self._searchFields(fields)
+        requested = set(fields_param.split(","))
+        since, seen, baseline = decode_cursor(since_cursor, query) if since_cursor else (None, set(), True)
+        # The feed is a baseline until an issue was seen and the baseline was not cut off
+        baseline = baseline or since is None
+
+        newest, newest_keys = since, set(seen)
+        issues: Dict[str, Any] = {}
+        more = False
+        changed = self._iterChangedIssues(query, f"{fields_param},created,updated", since, seen,
+                                          expand=None if baseline else "changelog")
+        try:
+            for issue in changed:
+                key = issue['key']
+                updated = parse_jira_time(issue['fields']['updated'])
+                if max_results is not None and len(issues) >= max_results and key not in issues:
+                    more = True
+                    break
+                issues[key] = self._changeEntry(issue, None if baseline else since, requested)
+                if newest is None or updated > newest:
+                    newest, newest_keys = updated, {key}
+                elif updated == newest:
+                    newest_keys.add(key)
+        finally:
+            changed.close()
+        return {'changes': list(issues.values()), 'count': len(issues), 'more': more, 'baseline': baseline,
+                'cursor': encode_cursor(query, newest, newest_keys, baseline=baseline and more)}
+
+    def _iterChangedIssues(self, query: str, fields: str, since: int | None, seen: Set[str],
+                           expand: str | None = None) -> Iterator[Dict[str, Any]]:
+        """Yield the raw issues of a query updated after (since, seen), oldest update first.
+
+        Pages are fetched one after another with keyset paging: every page queries the
+        issues updated since the newest one yielded so far, in a relative window widened
+        by JIRA_SYNC_OVERLAP_MINUTES, and skips those already yielded. Issues updated
+        during the walk move to its end instead of shifting later pages. Only when the
+        overlap alone fills a page is it stepped through by offset. Each step repeats the
+        last issue of the previous page, so an issue moving out from under the offset is
+        noticed and the walk starts over.
+        """
+        last, last_keys = since, set(seen)
+        offset, expected, restarts = 0, None, 0
+        while True:
+            if last is None:
+                search = f'({query}) ORDER BY updated ASC, key ASC'
+            else:
+                minutes = math.ceil(max(0, int(time.time() * 1000) - last) / 60000) + JIRA_SYNC_OVERLAP_MINUTES
+                search = f'({query}) AND updated >= "-{minutes}m" ORDER BY updated ASC, key ASC'
+            result = self.jira.jql(search, fields=fields, start=offset, limit=JIRA_PAGE_SIZE, expand=expand)
+            page = result.get('issues', [])
+            if expected is not None and (not page or page[0].get('key') != expected):
+                restarts += 1
+                if restarts > MAX_CHANGES_RESTARTS:
+                    raise RuntimeError("Issues changed too quickly to walk the change feed, poll again")
+                offset, expected = 0, None
+                continue
+
+            advanced = False
+            for issue in page:
+                key = issue.get('key')
+                updated = parse_jira_time((issue.get('fields') or {}).get('updated'))
+                if not key or updated is None or (last is not None and (updated < last or
+                                                                        (updated == last and key in last_keys))):
+                    continue
+                advanced = True
+                yield issue
+                if last is None or updated > last:
+                    last, last_keys = updated, {key}
+                else:
+                    last_keys.add(key)
+            if not page or offset + len(page) >= result.get('total', 0):
+                return
+            if advanced:
+                offset, expected = 0, None
+            else:
+                offset, expected = offset + len(page) - 1, page[-1].get('key')
 
-        for issue in issues.get('issues', []):
-            filtered_issue = {
-                'key': issue.get('key'),
-                'summary': issue.get('fields', {}).get('summary'),
-                'status': issue.get('fields', {}).get('status', {}).get('name'),
-            }
-            filtered_issues.append(filtered_issue)
+    def _changeEntry(self, issue: Dict[str, Any], since: int | None, requested: Set[str]) -> Dict[str, Any]:
+        """Build the change feed entry of an issue updated after since."""
+        issue_fields = issue.get('fields') or {}
+        created = parse_jira_time(issue_fields.get('created'))
+        if since is None or (created is not None and created > since):
+            kept = {name: value for name, value in issue_fields.items() if name in requested or name == 'updated'}
+            entry = {'issue': self._issueResult({'key': issue.get('key'), 'fields': kept})}
+            if since is not None:
+                entry['created'] = True
+            return entry
+        changed, changes = field_changes(issue, since)
+        kept = {name: issue_fields.get(name) for name in changed & requested}
+        kept['updated'] = issue_fields.get('updated')
+        return {'issue': self._issueResult({'key': issue.get('key'), 'fields': kept}), 'changes': changes}
 
-        return json.dumps(filtered_issues, indent=4)
+    def _useMirror(self, project_key: str) -> bool:
+        """Whether reads of a project can be answered from the local mirror.
+
+        Mirrored projects, and projects listed in JIRA_MIRROR_PROJECTS, are synced first
+        when their last sync is older than mirror_max_age. If that sync fails the read
+        goes to Jira.
+        """
+        if self.mirror is None:
+            return False
+        project = project_key.strip().upper()
+        if self.mirror.is_fresh(project, self.mirror_max_age):
+            return True
+        if project not in JIRA_MIRROR_PROJECTS and self.mirror.project_state(project) is None:
+            return False
+        try:
+            self.SyncProject(project, max_age=self.mirror_max_age)
+        except Exception:
+            return False
+        return True
+
+    def _mirrorFields(self, fields: str) -> bool:
+        """Whether the mirror stores every field of a fields param."""
+        requested = {field.strip() for field in fields.split(",") if field.strip()}
+        return bool(requested) and requested <= MIRROR_FIELDS
+
+    def _projectFields(self, issue: Dict[str, Any], fields: str) -> Dict[str, Any]:
+        """Copy a mirrored raw issue with only the requested fields."""
+        stored = issue.get('fields', {})
+        return {**issue, 'fields': {field: stored[field] for field in fields.split(",") if field in stored}}
 
     def CreateIssue(self, project_key: str, issue_type: str, summary: str, description: str = None,
                 priority: str = None, labels: list = None, assignee: str = None,
@@ -160,10 +948,36 @@ class ManageIssues:
         Returns:
             Dictionary with the created issue data
         """
+        try:
+            issue_dict = self._buildCreateFields(project_key, issue_type, summary, description,
+                                                 priority, labels, assignee, additional_fields)
+        except Exception as e:
+            # Unknown names, or metadata that could not be loaded
+            return {'error': str(e)}
+
+        try:
+            # Create the issue
+            new_issue = self.jira.create_issue(fields=issue_dict)
+            if isinstance(new_issue, dict) and new_issue.get('key'):
+                self._invalidate(new_issue['key'])
+            return normalize(new_issue)
+        except Exception as e:
+            # Return error information
+            return {'error': str(e)}
+
+    def _buildCreateFields(self, project_key: str, issue_type: str, summary: str, description: str = None,
+                           priority: str = None, labels: list = None, assignee: str = None,
+                           additional_fields: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Build the fields payload used to create an issue.
+
+        Names are resolved and the payload is checked against the metadata index, so
+        payloads Jira would reject raise ValueError without a request.
+        """
         # Build the issue fields
+        issue_type_entry = self.metadata.issue_type(project_key, issue_type)
         issue_dict = {
             'project': {'key': project_key},
-            'issuetype': {'name': issue_type},
+            'issuetype': {'name': issue_type_entry['name'] if issue_type_entry else issue_type},
             'summary': summary
         }
 
@@ -172,31 +986,162 @@ class ManageIssues:
             issue_dict['description'] = description
 
         if priority:
-            issue_dict['priority'] = {'name': priority}
+            issue_dict['priority'] = {'name': self.metadata.priority(priority)}
 
         if labels:
             issue_dict['labels'] = labels
 
         if assignee:
-            issue_dict['assignee'] = {'name': assignee}
+            issue_dict['assignee'] = {'name': self.metadata.user(assignee)}
 
         # Add any additional fields
         if additional_fields:
-            issue_dict.update(additional_fields)
+            issue_dict.update(self.metadata.resolve_fields(additional_fields))
 
+        if issue_type_entry:
+            self.metadata.check_create(project_key, issue_type_entry['id'], issue_dict)
+        return issue_dict
+
+    def GetCreateMetadata(self, project_key: str, issue_type: str | None = None) -> Dict[str, Any]:
+        """Describe what can be created in a project.
+
+        Args:
+            project_key: The project key
+            issue_type: Issue type to describe the fields of, None to list the project's issue types
+
+        Returns:
+            Dictionary with the issue types of the project, or the id, name, whether it is
+            required and the allowed values of every field of the issue type
+        """
         try:
-            # Create the issue
-            new_issue = self.jira.create_issue(fields=issue_dict)
-            return self._remove_null_values(new_issue)
-        except Exception as e:
-            # Return error information
+            return self.metadata.create_metadata(project_key, issue_type)
+        except ValueError as e:
             return {'error': str(e)}
 
+    def BulkCreateIssues(self, issues: List[Dict[str, Any]],
+                         concurrency: int = JIRA_BULK_CONCURRENCY) -> List[Dict[str, Any]]:
+        """Create many issues using Jira's /issue/bulk endpoint.
+
+        Args:
+            issues: List of dictionaries with the CreateIssue arguments (project_key,
+                issue_type, summary and optionally description, priority, labels,
+                assignee, additional_fields)
+            concurrency: Number of single creates run in parallel when the bulk
+                endpoint is not available
+
+        Returns:
+            One result per input issue, in input order: the created issue data or {'error': ...}
+        """
+        # Imported here like the client itself, see JiraClient
+        from requests.exceptions import HTTPError
+        results: List[Dict[str, Any]] = [{'error': 'Issue could not be created'} for _ in issues]
+
+        # Build every payload up front so one invalid issue does not fail its whole chunk
+        payloads: List[Tuple[int, Dict[str, Any]]] = []
+        for index, issue in enumerate(issues):
+            try:
+                payloads.append((index, {'fields': self._buildCreateFields(**issue)}))
+            except (TypeError, ValueError) as e:
+                results[index] = {'error': f'Invalid issue: {e}'}
+            except Exception as e:
+                results[index] = {'error': str(e)}
+
+        for start in range(0, len(payloads), MAX_BULK_CREATE_ISSUES):
+            chunk = payloads[start:start + MAX_BULK_CREATE_ISSUES]
+            try:
+                response = self.jira.create_issues([payload for _, payload in chunk]) or {}
+            except HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                if status in (404, 405):
+                    # Bulk endpoint missing: create one by one
+                    single_results = self._fanOut(lambda index: self.CreateIssue(**issues[index]),
+                                                  [index for index, _ in chunk], concurrency)
+                    for (index, _), result in zip(chunk, single_results):
+                        results[index] = result
+                    continue
+                try:
+                    response = e.response.json() if status == 400 else {}
+                except ValueError:
+                    response = {}
+                if not isinstance(response, dict) or not response.get('errors'):
+                    for index, _ in chunk:
+                        results[index] = {'error': str(e)}
+                    continue
+                # Every issue was rejected, the body lists the errors per element like a partial success
+            except Exception as e:
+                for index, _ in chunk:
+                    results[index] = {'error': str(e)}
+                continue
+
+            # Jira lists created issues in request order, skipping the failed elements
+            errors = {error.get('failedElementNumber'): error for error in response.get('errors', [])}
+            created = iter(response.get('issues', []))
+            for position, (index, _) in enumerate(chunk):
+                if position in errors:
+                    element_errors = errors[position].get('elementErrors', {})
+                    results[index] = {'error': element_errors.get('errors') or element_errors.get('errorMessages')
+                                      or 'Issue could not be created'}
+                    continue
+                new_issue = next(created, None)
+                if new_issue is not None:
+                    self._invalidate(new_issue.get('key'))
+                    results[index] = normalize(new_issue)
+
+        return results
+
+    def BulkUpdateIssues(self, updates: List[Dict[str, Any]],
+                         concurrency: int = JIRA_BULK_CONCURRENCY) -> List[Dict[str, Any]]:
+        """Update many issues with bounded concurrency.
+
+        Jira Server/DC has no bulk edit endpoint, so updates are fanned out.
+
+        Args:
+            updates: List of dictionaries with the UpdateIssue arguments (issue_key and
+                optionally summary, description, priority, labels, assignee, status,
+                additional_fields)
+            concurrency: Number of updates run in parallel
+
+        Returns:
+            One result per input update, in input order
+        """
+        return self._fanOut(lambda update: self.UpdateIssue(**update), updates, concurrency)
+
+    def BulkAddComment(self, comments: List[Dict[str, str]],
+                       concurrency: int = JIRA_BULK_CONCURRENCY) -> List[Dict[str, Any]]:
+        """Add many comments with bounded concurrency.
+
+        Args:
+            comments: List of dictionaries with issue_key and comment
+            concurrency: Number of comments added in parallel
+
+        Returns:
+            One result per input comment, in input order
+        """
+        return self._fanOut(lambda item: self.AddComment(item['issue_key'], item['comment']), comments, concurrency)
+
+    def _fanOut(self, func: Callable[[Any], Dict[str, Any]], items: List[Any],
+                concurrency: int) -> List[Dict[str, Any]]:
+        """Call func for every item with bounded concurrency, returning results in input order."""
+        def call(item: Any) -> Dict[str, Any]:
+            try:
+                return func(item)
+            except Exception as e:
+                return {'error': str(e)}
+
+        if len(items) <= 1 or concurrency <= 1:
+            return [call(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(items))) as executor:
+            return list(executor.map(call, items))
+
     def UpdateIssue(self, issue_key: str, summary: str = None, description: str = None,
                    priority: str = None, labels: list = None, assignee: str = None,
-                   status: str = None, additional_fields: Dict[str, Any] = None) -> Dict[str, Any]:
+                   status: str = None, additional_fields: Dict[str, Any] = None,
+                   return_issue: bool = True) -> Dict[str, Any]:
         """Update an existing Jira issue.
 
+        Status changes look the transition up in a cache keyed by project, issue type
+        and current status, so a known issue is transitioned with a single request.
+
         Args:
             issue_key: The Jira issue key to update
             summary: New summary/title
@@ -206,11 +1151,13 @@ class ManageIssues:
             assignee: New assignee username
             status: New status/transition
             additional_fields: Additional fields to update
+            return_issue: Re-read and return the full issue. When False only the
+                changed fields are returned, saving a request.
 
         Returns:
             Dictionary with the updated issue data
         """
-        # Build the update fields
+        # Build the update fields, resolving names locally so unknown ones fail without a request
         issue_dict = {}
 
         if summary:
@@ -219,18 +1166,22 @@ class ManageIssues:
         if description:
             issue_dict['description'] = description
 
-        if priority:
-            issue_dict['priority'] = {'name': priority}
+        try:
+            if priority:
+                issue_dict['priority'] = {'name': self.metadata.priority(priority)}
 
-        if labels:
-            issue_dict['labels'] = labels
+            if labels:
+                issue_dict['labels'] = labels
 
-        if assignee:
-            issue_dict['assignee'] = {'name': assignee}
+            if assignee:
+                issue_dict['assignee'] = {'name': self.metadata.user(assignee)}
 
-        # Add any additional fields
-        if additional_fields:
-            issue_dict.update(additional_fields)
+            # Add any additional fields
+            if additional_fields:
+                issue_dict.update(self.metadata.resolve_fields(additional_fields))
+        except Exception as e:
+            # Unknown names, or metadata that could not be loaded
+            return {'error': str(e)}
 
         try:
             # Update the issue
@@ -238,36 +1189,102 @@ class ManageIssues:
                 self.jira.update_issue_field(key=issue_key, fields=issue_dict)
 
             # Handle status transition if provided
+            new_state = None
             if status:
-                # Get available transitions
-                transitions = self.jira.get_issue_transitions(issue_key)
-                transition_id = None
-
-                # Find the transition ID for the requested status
-                for transition in transitions:
-                    if transition['name'].lower() == status.lower():
-                        transition_id = transition['id']
-                        break
-
-                if transition_id:
-                    self.jira.issue_transition(issue_key, transition_id)
-                else:
+                new_state = self._transitionIssue(issue_key, status)
+                if new_state is None:
+                    self._invalidate(issue_key)
                     return {'error': f'Status transition to "{status}" not available for this issue'}
 
-            # Return the updated issue
-            updated_issue = self.jira.issue(issue_key)
-            return self._remove_null_values(updated_issue)
+            self._invalidate(issue_key)
+            if new_state and new_state[2]:
+                self.cache.set(("state", issue_key.strip().upper()), new_state)
+            if not return_issue:
+                changes = {'key': issue_key, 'fields': dict(issue_dict)}
+                if new_state:
+                    changes['fields']['status'] = {'name': new_state[2]}
+                return changes
+
+            # Return the updated issue and write it through to the cache
+            updated_issue = self._fetchIssue(issue_key)
+            self.cache.set(("issue", issue_key.strip().upper(), DEFAULT_ISSUE_FIELDS, None), updated_issue)
+            return updated_issue
         except Exception as e:
+            self._invalidate(issue_key)
             # Return error information
             return {'error': str(e)}
 
-    # Helper function.
-    def _remove_null_values(self, obj):
-        """Recursively remove null values from dictionaries and lists."""
-        if isinstance(obj, dict):
-            return {k: self._remove_null_values(v) for k, v in obj.items() if v is not None}
-        elif isinstance(obj, list):
-            return [self._remove_null_values(item) for item in obj if item is not None]
-        else:
-            return obj
+    def _transitionIssue(self, issue_key: str, status: str) -> Tuple[str, str, str] | None:
+        """Move an issue to a status.
+
+        Returns:
+            The new (project, issue type, status) state, or None if no transition matches
+        """
+        from requests.exceptions import HTTPError
+        transition, cached = self._findTransition(issue_key, status)
+        if transition is None and cached:
+            # The cached state may be stale, look the transitions up again
+            transition, cached = self._findTransition(issue_key, status, refresh=True)
+        if transition is None:
+            return None
+
+        try:
+            self.jira.set_issue_status_by_transition_id(issue_key, transition['id'])
+        except HTTPError:
+            if not cached:
+                raise
+            # The issue moved since its transitions were cached, retry with fresh ones
+            transition, _ = self._findTransition(issue_key, status, refresh=True)
+            if transition is None:
+                return None
+            self.jira.set_issue_status_by_transition_id(issue_key, transition['id'])
+        return (*transition['state'][:2], transition['to'])
+
+    def _findTransition(self, issue_key: str, status: str,
+                        refresh: bool = False) -> Tuple[Dict[str, Any] | None, bool]:
+        """Find the transition matching a transition or target status name.
+
+        Transitions are cached per (project, issue type, status) with a name index, and
+        the state of every issue seen recently is cached as well. On a miss a single
+        request fetches both the issue state and its transitions.
+
+        Returns:
+            The transition ({'id': ..., 'to': ..., 'state': ...}) or None, and whether it came from the cache
+        """
+        if not refresh:
+            found, state = self.cache.get(("state", issue_key.strip().upper()))
+            if found:
+                found, index = self.cache.get(("transitions", *state))
+                if found:
+                    return index.get(status.lower()), True
+
+        issue = self.jira.issue(issue_key, fields="status,issuetype", expand="transitions")
+        state = self._rememberState(issue) or (issue_key.split('-')[0], None, None)
+        index: Dict[str, Dict[str, Any]] = {}
+        for transition in issue.get('transitions', []):
+            entry = {'id': transition['id'], 'to': transition.get('to', {}).get('name', transition['name']),
+                     'state': state}
+            # Transition names take precedence over target status names
+            index.setdefault(entry['to'].lower(), entry)
+            index[transition['name'].lower()] = entry
+        if state[2]:
+            self.cache.set(("transitions", *state), index)
+        return index.get(status.lower()), False
+
+    def _invalidate(self, issue_key: str) -> None:
+        """Drop cached responses for an issue and have its mirrored project synced on next read."""
+        self.cache.invalidate(issue_key)
+        if self.mirror is not None and issue_key:
+            self.mirror.mark_stale(issue_key.strip().split('-')[0].upper())
+
+    def _rememberState(self, issue: Dict[str, Any]) -> Tuple[str, str, str] | None:
+        """Cache the (project, issue type, status) of an issue for transition lookups."""
+        fields = issue.get('fields', {}) if isinstance(issue, dict) else {}
+        issue_type = fields.get('issuetype', {}).get('name')
+        status = fields.get('status', {}).get('name')
+        if not (issue.get('key') and issue_type and status):
+            return None
+        state = (issue['key'].split('-')[0], issue_type, status)
+        self.cache.set(("state", issue['key']), state)
+        return state
 
@@ -0,0 +1,237 @@
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Tuple
+from .cache import ResponseCache
+
+if TYPE_CHECKING:
+    from atlassian import Jira
+
+# Jira loaders of the instance-wide name lists
+NAME_LOADERS = {
+    "status": "get_all_statuses",
+    "priority": "get_all_priorities",
+    "issuetype": "get_issue_types",
+}
+# Fields set by CreateIssue itself, or by Jira, which never have to be passed by the caller
+IMPLICIT_CREATE_FIELDS = {"project", "issuetype", "summary", "reporter"}
+# Page size of the createmeta endpoints
+CREATEMETA_PAGE_SIZE = 200
+# Valid names listed in an error message
+MAX_LISTED_NAMES = 20
+
+class MetadataIndex:
+    """Indexes of instance metadata used to check and resolve write payloads before they are sent.
+
+    Field names and ids, statuses, priorities, issue types, create metadata per project
+    and issue type and looked up users are loaded on first use and kept in the
+    "metadata" namespace of the response cache, so they are refreshed once their TTL
+    has passed. A name missing from an index reloads it once before it is rejected, so
+    metadata added in Jira since the index was loaded is picked up. When an index cannot
+    be loaded, e.g. for lack of permissions, payloads are passed to Jira unchecked.
+    """
+
+    def __init__(self, jira_client: "Jira", cache: ResponseCache):
+        self.jira = jira_client
+        self.cache = cache
+
+    def names(self, kind: str) -> List[str]:
+        """List every status, priority or issue type name of the instance."""
+        index = self._index(("metadata", kind), lambda: self._loadNames(kind))
+        return list(dict.fromkeys(index.values())) if index else []
+
+    def priority(self, name: str) -> str:
+        """Return the priority name as spelled in Jira, raising ValueError for an unknown priority."""
+        return self._resolve(("metadata", "priority"), lambda: self._loadNames("priority"), name, "priority")
+
+    def issue_type(self, project_key: str, name: str) -> Dict[str, str] | None:
+        """Return the id and name of an issue type of a project, None if the project's issue types are unknown."""
+        key = ("metadata", "createmeta", project_key.upper())
+        index = self._index(key, lambda: self._loadIssueTypes(project_key))
+        if index is None:
+            return None
+        if name.lower() not in index:
+            index = self._index(key, lambda: self._loadIssueTypes(project_key), refresh=True) or index
+        if name.lower() not in index:
+            raise ValueError(f'Unknown issue type "{name}" for project {project_key}, '
+                             f'valid issue types: {_listed(entry["name"] for entry in index.values())}')
+        return index[name.lower()]
+
+    def create_fields(self, project_key: str, issue_type_id: str) -> Dict[str, Dict[str, Any]] | None:
+        """Return the create metadata of a project and issue type, by field id, None if it is unknown.
+
+        Every field maps to its name, whether it is required, and the names of its
+        allowed values when Jira lists them.
+        """
+        return self._index(("metadata", "createmeta", project_key.upper(), issue_type_id),
+                           lambda: self._loadCreateFields(project_key, issue_type_id))
+
+    def field_id(self, name: str) -> str:
+        """Return the id of a field given by id or name, raising ValueError for an unknown field."""
+        # Instances have hundreds of fields, too many to list
+        return self._resolve(("metadata", "fields"), self._loadFields, name, "field", list_valid=False)
+
+    def user(self, name: str) -> str:
+        """Return the username of a user given by username, display name or email.
+
+        Raises ValueError when no user, or more than one, matches.
+        """
+        # Only users that were found are cached, so users created since are found right away
+        found, username = self.cache.get(("metadata", "user", name.lower()))
+        if found:
+            return username
+        from requests.exceptions import HTTPError
+        try:
+            users = self.jira.user_find_by_user_string(username=name, limit=MAX_LISTED_NAMES) or []
+        except HTTPError:
+            return name
+        lowered = name.lower()
+        matches = [user for user in users
+                   if lowered in (str(user.get(attribute, "")).lower()
+                                  for attribute in ("name", "key", "displayName", "emailAddress"))]
+        if len(matches) > 1:
+            exact = [user for user in matches if str(user.get("name", "")).lower() == lowered]
+            if len(exact) != 1:
+                raise ValueError(f'"{name}" matches several users: {_listed(user.get("name") for user in matches)}')
+            matches = exact
+        if not matches:
+            raise ValueError(f'Unknown user "{name}"')
+        username = matches[0].get("name") or name
+        self.cache.set(("metadata", "user", lowered), username)
+        return username
+
+    def resolve_fields(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace field names by field ids, raising ValueError for unknown fields."""
+        return {self.field_id(name): value for name, value in fields.items()}
+
+    def check_create(self, project_key: str, issue_type_id: str, fields: Dict[str, Any]) -> None:
+        """Check a create payload against the create metadata of its project and issue type.
+
+        Raises ValueError listing the required fields that are missing, or the first
+        value that is not one of its field's allowed values.
+        """
+        meta = self.create_fields(project_key, issue_type_id)
+        if not meta:
+            return
+        missing = [entry["name"] for field, entry in meta.items()
+                   if entry["required"] and field not in fields and field not in IMPLICIT_CREATE_FIELDS]
+        if missing:
+            raise ValueError(f"Missing required fields: {', '.join(sorted(missing))}")
+        for field, value in fields.items():
+            allowed = (meta.get(field) or {}).get("allowed")
+            if not allowed:
+                continue
+            for item in value if isinstance(value, list) else [value]:
+                name = item.get("name", item.get("value")) if isinstance(item, dict) else None
+                if isinstance(name, str) and name.lower() not in allowed:
+                    raise ValueError(f'"{name}" is not a valid value of {meta[field]["name"]}, '
+                                     f'valid values: {_listed(allowed.values())}')
+
+    def create_metadata(self, project_key: str, issue_type: str | None = None) -> Dict[str, Any]:
+        """Describe the issue types of a project, or the fields of one of its issue types."""
+        key = ("metadata", "createmeta", project_key.upper())
+        if issue_type is None:
+            index = self._index(key, lambda: self._loadIssueTypes(project_key))
+            if index is None:
+                return {'error': f'Create metadata of project {project_key} is not available'}
+            return {'project': project_key.upper(), 'issue_types': [entry["name"] for entry in index.values()]}
+        entry = self.issue_type(project_key, issue_type)
+        meta = self.create_fields(project_key, entry["id"]) if entry else None
+        if meta is None:
+            return {'error': f'Create metadata of {issue_type} issues in project {project_key} is not available'}
+        fields = []
+        for field, info in meta.items():
+            described = {'id': field, 'name': info["name"], 'required': info["required"]}
+            if info.get("allowed"):
+                described['allowed_values'] = list(info["allowed"].values())
+            fields.append(described)
+        return {'project': project_key.upper(), 'issue_type': entry["name"], 'fields': fields}
+
+    def _resolve(self, key: Tuple[Hashable, ...], loader: Callable[[], Dict[str, str] | None], name: str,
+                 kind: str, list_valid: bool = True) -> str:
+        """Look a name up in a name index, reloading the index once before rejecting it."""
+        index = self._index(key, loader)
+        if index is None:
+            return name
+        if name.lower() not in index:
+            index = self._index(key, loader, refresh=True) or index
+        if name.lower() not in index:
+            valid = f", valid names: {_listed(dict.fromkeys(index.values()))}" if list_valid else ""
+            raise ValueError(f'Unknown {kind} "{name}"{valid}')
+        return index[name.lower()]
+
+    def _index(self, key: Tuple[Hashable, ...], loader: Callable[[], Any], refresh: bool = False) -> Any:
+        """Return a cached index, loading it on a miss. Indexes that failed to load are not cached."""
+        if not refresh:
+            found, index = self.cache.get(key)
+            if found:
+                return index
+        index = loader()
+        if index is not None:
+            self.cache.set(key, index)
+        return index
+
+    def _loadNames(self, kind: str) -> Dict[str, str] | None:
+        """Index the statuses, priorities or issue types of the instance by lower case name."""
+        items = self._load(lambda: getattr(self.jira, NAME_LOADERS[kind])())
+        if items is None:
+            return None
+        return {item['name'].lower(): item['name'] for item in items if item.get('name')}
+
+    def _loadFields(self) -> Dict[str, str] | None:
+        """Index field ids by lower case id and name. Ids take precedence over names of other fields."""
+        fields = self._load(self.jira.get_all_fields)
+        if fields is None:
+            return None
+        index = {field['name'].lower(): field['id'] for field in fields if field.get('name') and field.get('id')}
+        index.update({field['id'].lower(): field['id'] for field in fields if field.get('id')})
+        return index
+
+    def _loadIssueTypes(self, project_key: str) -> Dict[str, Dict[str, str]] | None:
+        """Index the issue types that can be created in a project by lower case name."""
+        issue_types = self._loadPages(lambda start: self.jira.issue_createmeta_issuetypes(
+            project_key, start=start, limit=CREATEMETA_PAGE_SIZE))
+        if issue_types is None:
+            return None
+        return {issue_type['name'].lower(): {'id': str(issue_type['id']), 'name': issue_type['name']}
+                for issue_type in issue_types if issue_type.get('name') and issue_type.get('id')}
+
+    def _loadCreateFields(self, project_key: str, issue_type_id: str) -> Dict[str, Dict[str, Any]] | None:
+        """Index the create metadata of a project and issue type by field id."""
+        fields = self._loadPages(lambda start: self.jira.issue_createmeta_fieldtypes(
+            project_key, issue_type_id, start=start, limit=CREATEMETA_PAGE_SIZE))
+        if fields is None:
+            return None
+        meta = {}
+        for field in fields:
+            allowed = {}
+            for value in field.get('allowedValues') or []:
+                name = value.get('name', value.get('value')) if isinstance(value, dict) else None
+                if isinstance(name, str):
+                    allowed[name.lower()] = name
+            meta[field['fieldId']] = {'name': field.get('name', field['fieldId']),
+                                      'required': bool(field.get('required')) and not field.get('hasDefaultValue'),
+                                      'allowed': allowed or None}
+        return meta
+
+    def _loadPages(self, fetch: Callable[[int], Dict[str, Any]]) -> List[Dict[str, Any]] | None:
+        """Collect the values of a paged createmeta endpoint, None if it failed."""
+        values: List[Dict[str, Any]] = []
+        while True:
+            page = self._load(lambda: fetch(len(values)))
+            if not isinstance(page, dict):
+                return None
+            values.extend(page.get('values') or [])
+            if page.get('isLast', True) or not page.get('values'):
+                return values
+
+    def _load(self, loader: Callable[[], Any]) -> Any:
+        """Call a Jira loader, None if Jira refused the request."""
+        from requests.exceptions import HTTPError
+        try:
+            return loader()
+        except HTTPError:
+            return None
+
+def _listed(names) -> str:
+    """Join names for an error message, at most MAX_LISTED_NAMES of them."""
+    names = [str(name) for name in names if name]
+    listed = ", ".join(names[:MAX_LISTED_NAMES])
+    return listed + (f" and {len(names) - MAX_LISTED_NAMES} more" if len(names) > MAX_LISTED_NAMES else "")
@@ -0,0 +1,184 @@
+import re
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+from urllib.parse import urlsplit
+
+# Upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# Path segments replaced by placeholders so endpoints group well
+_ISSUE_KEY = re.compile(r"^[A-Z][A-Z0-9_]+-\d+$", re.IGNORECASE)
+_NUMBER = re.compile(r"^\d+$")
+
+class _Series:
+    """Counters and latency histogram of one tool or Jira endpoint."""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.rate_limited = 0
+        # Requests that shared the response of an identical request already in flight
+        self.coalesced = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.bytes = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.statuses: Dict[int, int] = defaultdict(int)
+
+    def observe(self, seconds: float, size: int, error: bool) -> None:
+        self.count += 1
+        self.errors += error
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.bytes += size
+        index = next((i for i, bound in enumerate(LATENCY_BUCKETS) if seconds <= bound), len(LATENCY_BUCKETS))
+        self.buckets[index] += 1
+
+    def quantile(self, q: float) -> float:
+        """Estimate a latency quantile from the histogram, interpolating inside the bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, in_bucket in enumerate(self.buckets):
+            if in_bucket and seen + in_bucket >= rank:
+                lower = LATENCY_BUCKETS[index - 1] if index else 0.0
+                upper = LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else self.max_seconds
+                return min(lower + (upper - lower) * (rank - seen) / in_bucket, self.max_seconds)
+            seen += in_bucket
+        return self.max_seconds
+
+    def snapshot(self) -> Dict[str, Any]:
+        result = {
+            'count': self.count,
+            'errors': self.errors,
+            'p50_ms': round(self.quantile(0.5) * 1000, 1),
+            'p95_ms': round(self.quantile(0.95) * 1000, 1),
+            'p99_ms': round(self.quantile(0.99) * 1000, 1),
+            'max_ms': round(self.max_seconds * 1000, 1),
+            'mean_ms': round(self.seconds / self.count * 1000, 1) if self.count else 0.0,
+            'bytes': self.bytes,
+        }
+        if self.rate_limited:
+            result['rate_limited'] = self.rate_limited
+        if self.coalesced:
+            result['coalesced'] = self.coalesced
+        if self.statuses:
+            result['statuses'] = dict(sorted(self.statuses.items()))
+        return result
+
+class Metrics:
+    """Thread safe latency, size and error counters for MCP tools and Jira endpoints.
+
+    Tool calls are recorded by the server, Jira requests by a response hook and the
+    retry policy of the JiraClient session, so rate limited attempts that were retried
+    are counted as well. Startup phases, such as importing the server or building the
+    Jira client on first use, are recorded once as durations.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, str], _Series] = {}
+        self._startup: Dict[str, float] = {}
+
+    def observe(self, kind: str, name: str, seconds: float, size: int = 0, error: bool = False,
+                status: int | None = None) -> None:
+        """Record one tool call ("tool") or Jira request ("jira")."""
+        with self._lock:
+            series = self._series.get((kind, name))
+            if series is None:
+                series = self._series[(kind, name)] = _Series()
+            series.observe(seconds, size, error)
+            if status is not None:
+                series.statuses[status] += 1
+                series.rate_limited += status == 429
+
+    def count_rate_limited(self, name: str) -> None:
+        """Record a rate limited Jira response that is about to be retried."""
+        with self._lock:
+            series = self._series.get(("jira", name))
+            if series is None:
+                series = self._series[("jira", name)] = _Series()
+            series.rate_limited += 1
+
+    def count_coalesced(self, name: str) -> None:
+        """Record a Jira request answered by an identical request already in flight."""
+        with self._lock:
+            series = self._series.get(("jira", name))
+            if series is None:
+                series = self._series[("jira", name)] = _Series()
+            series.coalesced += 1
+
+    def record_startup(self, phase: str, seconds: float) -> None:
+        """Record how long a startup phase took."""
+        with self._lock:
+            self._startup[phase] = seconds
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return a summary per tool and per Jira endpoint, with estimated latency percentiles, and startup times."""
+        result: Dict[str, Dict[str, Any]] = {'tools': {}, 'jira': {}}
+        with self._lock:
+            result['startup_ms'] = {phase: round(seconds * 1000, 1) for phase, seconds in self._startup.items()}
+            for (kind, name), series in sorted(self._series.items()):
+                result['tools' if kind == "tool" else 'jira'][name] = series.snapshot()
+        return result
+
+    def prometheus(self, cache_stats: Dict[str, Any] | None = None) -> str:
+        """Render every series, and optionally the response cache counters, in the Prometheus text format."""
+        names = {"tool": ("jira_mcp_tool", "tool"), "jira": ("jira_mcp_jira_request", "endpoint")}
+        lines: List[str] = []
+        with self._lock:
+            series_items = sorted(self._series.items())
+            startup = sorted(self._startup.items())
+        for kind, (metric, label) in names.items():
+            items = [(name, series) for (series_kind, name), series in series_items if series_kind == kind]
+            lines.append(f"# TYPE {metric}_seconds histogram")
+            for name, series in items:
+                labels = f'{label}="{_escape(name)}"'
+                cumulative = 0
+                for bound, in_bucket in zip((*LATENCY_BUCKETS, "+Inf"), series.buckets):
+                    cumulative += in_bucket
+                    lines.append(f'{metric}_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f"{metric}_seconds_sum{{{labels}}} {series.seconds}")
+                lines.append(f"{metric}_seconds_count{{{labels}}} {series.count}")
+            counters = [("errors", "errors"), ("response_bytes", "bytes")]
+            if kind == "jira":
+                counters += [("rate_limited", "rate_limited"), ("coalesced", "coalesced")]
+            for suffix, attribute in counters:
+                lines.append(f"# TYPE {metric}_{suffix}_total counter")
+                for name, series in items:
+                    lines.append(f'{metric}_{suffix}_total{{{label}="{_escape(name)}"}} {getattr(series, attribute)}')
+        if startup:
+            lines.append("# TYPE jira_mcp_startup_seconds gauge")
+            for phase, seconds in startup:
+                lines.append(f'jira_mcp_startup_seconds{{phase="{_escape(phase)}"}} {seconds}')
+        if cache_stats:
+            for counter in ("hits", "misses", "evictions", "invalidations"):
+                lines.append(f"# TYPE jira_mcp_cache_{counter}_total counter")
+                lines.append(f"jira_mcp_cache_{counter}_total {cache_stats.get(counter, 0)}")
+            lines.append("# TYPE jira_mcp_cache_entries gauge")
+            lines.append(f"jira_mcp_cache_entries {cache_stats.get('entries', 0)}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        # Startup times are kept, they are not recorded again
+        with self._lock:
+            self._series.clear()
+
+def endpoint_name(method: str, url: str) -> str:
+    """Group a Jira request URL by endpoint, e.g. "GET /rest/api/2/issue/{key}/comment"."""
+    segments = []
+    for segment in urlsplit(url).path.split("/"):
+        if _ISSUE_KEY.match(segment):
+            segment = "{key}"
+        elif _NUMBER.match(segment) and segments and segments[-1] not in ("api", "agile"):
+            # Keep API versions such as /rest/api/2
+            segment = "{id}"
+        segments.append(segment)
+    return f"{method} {'/'.join(segments)}"
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+# Registry shared by the server and every JiraClient unless another one is passed in
+METRICS = Metrics()
@@ -0,0 +1,183 @@
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List
+from models import DEFAULT_READ_JIRA_FIELDS
+
+# Fields stored for every mirrored issue
+MIRROR_FIELDS = frozenset(DEFAULT_READ_JIRA_FIELDS)
+# Fields fetched when syncing. Comments are only kept in the full-text index.
+SYNC_FIELDS = MIRROR_FIELDS | {"comment"}
+# BM25 ranking with weights for the project, summary, description and comments index columns
+_RANK = "bm25(issues_fts, 0.0, 10.0, 3.0, 1.0)"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    key TEXT PRIMARY KEY,
+    id INTEGER NOT NULL,
+    project TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    updated TEXT,
+    seen_at REAL NOT NULL,
+    raw TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS issues_project_number ON issues (project, number);
+CREATE INDEX IF NOT EXISTS issues_id ON issues (id);
+CREATE VIRTUAL TABLE IF NOT EXISTS issues_fts USING fts5 (
+    project UNINDEXED, summary, description, comments
+);
+CREATE TABLE IF NOT EXISTS projects (
+    project TEXT PRIMARY KEY,
+    sync_started REAL NOT NULL,
+    synced_at REAL NOT NULL,
+    full_sync_at REAL NOT NULL
+);
+"""
+
+class IssueMirror:
+    """Local SQLite copy of the issues of selected projects.
+
+    A project is loaded once with a full walk of its issues and then kept up to date
+    with incremental syncs that only fetch issues updated since the previous sync
+    started. Read paths in ManageIssues answer from the mirror while a project's last
+    sync is recent enough. Issues deleted in Jira are only dropped by a full sync.
+
+    Summaries, descriptions and comment bodies are kept in an FTS5 index, keyed by the
+    Jira issue id and updated together with the issues, for ranked text search.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        self._sync_locks: Dict[str, threading.Lock] = {}
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+
+    def sync_lock(self, project: str) -> threading.Lock:
+        """Return the lock serializing syncs of a project."""
+        with self._lock:
+            return self._sync_locks.setdefault(project, threading.Lock())
+
+    def project_state(self, project: str) -> Dict[str, float] | None:
+        """Return the sync timestamps of a project, or None if it is not mirrored."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT sync_started, synced_at, full_sync_at FROM projects WHERE project = ?",
+                (project,)).fetchone()
+        if row is None:
+            return None
+        return {'sync_started': row[0], 'synced_at': row[1], 'full_sync_at': row[2]}
+
+    def is_fresh(self, project: str, max_age: float) -> bool:
+        """Whether a project was synced within the last max_age seconds."""
+        state = self.project_state(project)
+        return state is not None and time.time() - state['synced_at'] <= max_age
+
+    def upsert(self, project: str, issues: Iterable[Dict[str, Any]], seen_at: float) -> int:
+        """Store raw Jira issues, replacing older copies and their index entries. Returns the number stored."""
+        rows = []
+        documents = []
+        for issue in issues:
+            if not issue.get('key'):
+                continue
+            issue_id = int(issue.get('id') or 0)
+            fields = {name: value for name, value in (issue.get('fields') or {}).items() if name in MIRROR_FIELDS}
+            comments = ((issue.get('fields') or {}).get('comment') or {}).get('comments', [])
+            rows.append((issue['key'], issue_id, project, _issue_number(issue['key']), fields.get('updated'), seen_at,
+                         json.dumps({'id': issue.get('id'), 'key': issue['key'], 'fields': fields},
+                                    separators=(",", ":"))))
+            documents.append((issue_id, project, fields.get('summary') or "", fields.get('description') or "",
+                              "\n".join(comment.get('body') or "" for comment in comments)))
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO issues (key, id, project, number, updated, seen_at, raw) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows)
+            self._conn.executemany("DELETE FROM issues_fts WHERE rowid = ?", [(document[0],) for document in documents])
+            self._conn.executemany(
+                "INSERT INTO issues_fts (rowid, project, summary, description, comments) VALUES (?, ?, ?, ?, ?)",
+                documents)
+            self._conn.execute("COMMIT")
+        return len(rows)
+
+    def mark_synced(self, project: str, started: float, full: bool) -> int:
+        """Record a finished sync. A full sync also drops issues it did not see.
+
+        Returns the number of dropped issues.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            dropped = 0
+            if full:
+                self._conn.execute("DELETE FROM issues_fts WHERE rowid IN "
+                                   "(SELECT id FROM issues WHERE project = ? AND seen_at < ?)", (project, started))
+                dropped = self._conn.execute("DELETE FROM issues WHERE project = ? AND seen_at < ?",
+                                             (project, started)).rowcount
+            self._conn.execute(
+                "INSERT INTO projects (project, sync_started, synced_at, full_sync_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (project) DO UPDATE SET sync_started = excluded.sync_started, "
+                "synced_at = excluded.synced_at, full_sync_at = "
+                "CASE WHEN ? THEN excluded.full_sync_at ELSE projects.full_sync_at END",
+                (project, started, now, started, full))
+            self._conn.execute("COMMIT")
+        return dropped
+
+    def mark_stale(self, project: str) -> None:
+        """Force the next read of a project to sync it first, e.g. after a write."""
+        with self._lock:
+            self._conn.execute("UPDATE projects SET synced_at = 0 WHERE project = ?", (project,))
+
+    def issue(self, key: str) -> Dict[str, Any] | None:
+        """Return the mirrored raw issue for a key."""
+        with self._lock:
+            row = self._conn.execute("SELECT raw FROM issues WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def issues(self, project: str, start: int = 0, limit: int = 50) -> List[Dict[str, Any]]:
+        """Return mirrored raw issues of a project by ascending key number, the order Jira lists them in."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT raw FROM issues WHERE project = ? ORDER BY number LIMIT ? OFFSET ?",
+                (project, limit, start)).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def search(self, query: str, project: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Return mirrored raw issues of a project matching an FTS5 query, best BM25 match first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT i.raw FROM issues_fts f JOIN issues i ON i.id = f.rowid "
+                f"WHERE issues_fts MATCH ? AND f.project = ? ORDER BY {_RANK} LIMIT ?",
+                (query, project, limit)).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def count(self, project: str) -> int:
+        """Return the number of mirrored issues of a project."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM issues WHERE project = ?", (project,)).fetchone()[0]
+
+    def status(self) -> List[Dict[str, Any]]:
+        """Return the issue count and sync times of every mirrored project."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT p.project, p.synced_at, p.full_sync_at, COUNT(i.key) FROM projects p "
+                "LEFT JOIN issues i ON i.project = p.project GROUP BY p.project ORDER BY p.project").fetchall()
+        now = time.time()
+        return [{'project': project, 'issues': issues,
+                 'age_seconds': round(now - synced_at, 1) if synced_at else None,
+                 'last_full_sync': time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(full_sync_at))}
+                for project, synced_at, full_sync_at, issues in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+def _issue_number(key: str) -> int:
+    """Return the number of an issue key, e.g. 12 for ENG-12."""
+    number = key.rpartition("-")[2]
+    return int(number) if number.isdigit() else 0
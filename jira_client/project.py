@@ -1,26 +1,42 @@
-from .client import Jira
+from typing import TYPE_CHECKING
+from .cache import ResponseCache
+from .client import JIRA_CACHE_MAX_ENTRIES, JIRA_CACHE_TTLS, JIRA_MIRROR_MAX_AGE
+from .mirror import IssueMirror
+
+if TYPE_CHECKING:
+    from atlassian import Jira
 
 class ManageProjects:
     """Class for managing Jira projects."""
 
-    def __init__(self, jira_client: Jira):
+    def __init__(self, jira_client: "Jira", cache: ResponseCache | None = None, mirror: IssueMirror | None = None,
+                 mirror_max_age: float = JIRA_MIRROR_MAX_AGE):
         self.jira = jira_client
+        self.cache = cache or ResponseCache(JIRA_CACHE_MAX_ENTRIES, JIRA_CACHE_TTLS)
+        self.mirror = mirror
+        self.mirror_max_age = mirror_max_age
 
     def GetProjects(self):
         """Get all projects."""
-        return self.jira.projects(included_archived=None, expand=None)
+        return self.cache.get_or_load(("projects",),
+                                      lambda: self.jira.projects(included_archived=None, expand=None))
 
     def GetProjectsCount(self) -> int:
         """Get the count of all projects."""
-        projects = self.jira.projects(included_archived=None, expand=None)
-        return len(projects)
+        return len(self.GetProjects())
     
     def GetIssueCountForProject(self, project_key: str) -> int:
-        """Get the count of issues for a specific project."""
+        """Get the count of issues for a specific project.
+
+        Projects synced into the local mirror within mirror_max_age are counted locally.
+        """
+        if self.mirror is not None and self.mirror.is_fresh(project_key.strip().upper(), self.mirror_max_age):
+            return self.mirror.count(project_key.strip().upper())
         try:
             # Use JQL to count issues in the project
             jql = f"project = {project_key}"
-            result = self.jira.jql(jql=jql, fields="key", limit=1)
+            # maxResults=0 returns the total without any issues
+            result = self.jira.jql(jql=jql, fields="key", limit=0)
             if not isinstance(result, dict):
                 msg = f"Unexpected return value type from `jira.jql`: {type(result)}"
                 raise TypeError(msg)
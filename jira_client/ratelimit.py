@@ -0,0 +1,50 @@
+import math
+import threading
+import time
+
+class TokenBucket:
+    """Thread safe token bucket shared by every request of a Jira client.
+
+    Requests take one token each and wait while the bucket is empty. The bucket refills
+    at rate tokens per second up to burst tokens, by default a tenth of a second's worth
+    so an idle client does not overrun Jira's own limit at once. A rate of 0 never makes
+    requests wait. pause() stops every request for a while, e.g. after Jira answered 429,
+    so the other threads do not run into the same rate limit while one of them backs off.
+    """
+
+    def __init__(self, rate: float = 0, burst: int | None = None):
+        self.rate = rate
+        self.burst = max(1, burst or math.ceil(rate / 10))
+        self.waited_seconds = 0.0
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take a token, sleeping until one is available. Returns the seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                delay = self._paused_until - now
+                if delay <= 0:
+                    if self.rate <= 0:
+                        break
+                    self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        break
+                    delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+        if waited:
+            with self._lock:
+                self.waited_seconds += waited
+        return waited
+
+    def pause(self, seconds: float) -> None:
+        """Make every request wait at least this many seconds from now."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
@@ -0,0 +1,246 @@
+import hashlib
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Tuple
+from .cache import ResponseCache
+from .client import JiraClient, JIRA_URL, JIRA_PERSONAL_ACCESS_TOKEN, JIRA_CACHE_MAX_ENTRIES, JIRA_CACHE_TTLS, \
+    JIRA_MIRROR_PATH, JIRA_TENANTS, JIRA_TENANT_MAX_CONCURRENCY, JIRA_TENANT_IDLE_SECONDS
+from .issue import ManageIssues
+from .metrics import METRICS, Metrics
+from .mirror import IssueMirror
+from .project import ManageProjects
+
+# Counters summed over the caches of all tenants
+_CACHE_COUNTERS = ("entries", "hits", "misses", "evictions", "invalidations")
+
+class Tenant:
+    """Jira client, response cache and management classes of one (instance, credential) pair."""
+
+    def __init__(self, name: str, url: str, token: str | None, pool_size: int, mirror: IssueMirror | None = None,
+                 metrics: Metrics = METRICS):
+        self.name = name
+        self.url = url
+        self.jira_client = JiraClient(pool_size, metrics=metrics, url=url, token=token)
+        self.cache = ResponseCache(JIRA_CACHE_MAX_ENTRIES, JIRA_CACHE_TTLS)
+        # Tool results are serialized right away, so issues skip the JiraIssue models
+        self.issues = ManageIssues(self.jira_client.client, self.cache, mirror, typed_results=False)
+        self.projects = ManageProjects(self.jira_client.client, self.cache, mirror)
+        self.active = 0
+        self.last_used = time.monotonic()
+
+    def close(self) -> None:
+        self.jira_client.close()
+
+class ClientRegistry:
+    """Jira clients keyed by (instance, credential), built on first use.
+
+    Each tenant has its own connection pool, which also caps its requests in flight,
+    and its own response cache, so callers with different Jira permissions never see
+    each other's cached responses. The default tenant uses JIRA_URL and
+    JIRA_PERSONAL_ACCESS_TOKEN and is the only one reading from the local mirror.
+    Other tenants are a caller's own token for one of the configured instances, which
+    are JIRA_URL and the instances named in JIRA_TENANTS, and are closed once unused
+    for idle_seconds.
+    """
+
+    def __init__(self, url: str | None = JIRA_URL, token: str | None = JIRA_PERSONAL_ACCESS_TOKEN,
+                 tenants: str | Dict[str, Any] | None = None, mirror_path: str = JIRA_MIRROR_PATH,
+                 pool_size: int = JIRA_TENANT_MAX_CONCURRENCY, idle_seconds: float = JIRA_TENANT_IDLE_SECONDS,
+                 metrics: Metrics = METRICS):
+        self.default = ((url or "").rstrip("/"), token)
+        self.tenant_config = JIRA_TENANTS if tenants is None else tenants
+        self.mirror_path = mirror_path
+        self.pool_size = pool_size
+        self.idle_seconds = idle_seconds
+        self.metrics = metrics
+        self._lock = threading.RLock()
+        self._clients: Dict[Tuple[str, str], Tenant] = {}
+        # Locks serializing the build of a tenant, so only one caller builds it while others wait for it
+        self._building: Dict[Tuple[str, str], threading.Lock] = {}
+        self._tenants: Dict[str, str | ValueError] | None = None
+        self._tenants_error: ValueError | None = None
+        self._mirror_lock = threading.Lock()
+        self._mirror: IssueMirror | None = None
+
+    def resolve(self, tenant: str | None = None, url: str | None = None,
+                token: str | None = None) -> Tuple[str, str | None]:
+        """Return the (url, token) selected by a tool call.
+
+        Only the default tenant runs with a configured token. Any other instance is used
+        with the caller's own token, so naming a tenant never grants its credentials.
+
+        Args:
+            tenant: Name of an instance in JIRA_TENANTS, used with token
+            url: Jira instance to use with token, it must be one of the configured instances
+                (defaults to JIRA_URL)
+            token: Personal access token to use instead of the configured one
+        """
+        if tenant:
+            url = self.tenants().get(tenant)
+            if url is None:
+                raise self._tenants_error or ValueError(f"Unknown Jira tenant: {tenant}")
+            if isinstance(url, ValueError):
+                raise url
+            if not token:
+                raise ValueError(f"A token is required to use the Jira tenant {tenant}")
+        if token:
+            url = (url or self.default[0]).rstrip("/")
+            if url not in self.instances():
+                raise ValueError(f"{url} is not a configured Jira instance")
+            return url, token
+        if url and url.rstrip("/") != self.default[0]:
+            raise ValueError("A token is required to select another Jira instance")
+        return self.default
+
+    def tenants(self) -> Dict[str, str | ValueError]:
+        """Return the instance URL of every tenant in JIRA_TENANTS, parsing it on first use.
+
+        Entries that cannot be used map to the error raised when a tool call selects them,
+        so a bad entry does not stop the server or the other tenants. Without valid JSON
+        no tenant is configured and selecting one raises the parse error.
+        """
+        if self._tenants is None:
+            with self._lock:
+                if self._tenants is None:
+                    try:
+                        self._tenants = _parse_tenants(self.tenant_config)
+                    except ValueError as e:
+                        self._tenants_error = e
+                        self._tenants = {}
+        return self._tenants
+
+    def instances(self) -> List[str]:
+        """Return the configured Jira instance URLs."""
+        return sorted({url for url in self.tenants().values() if isinstance(url, str)}
+                      | ({self.default[0]} if self.default[0] else set()))
+
+    def mirror(self) -> IssueMirror | None:
+        """Return the local issue mirror of the default tenant, opening it on first use, or None if it is disabled."""
+        if self._mirror is None and self.mirror_path:
+            with self._mirror_lock:
+                if self._mirror is None:
+                    self._mirror = IssueMirror(self.mirror_path)
+        return self._mirror
+
+    def get(self, url: str, token: str | None) -> Tenant:
+        """Return the tenant of an (instance, credential) pair, building its client on first use.
+
+        The client is built outside of the registry lock, so a slow build only holds up
+        the callers of the same tenant.
+        """
+        key = (url, _fingerprint(token))
+        self.evict_idle()
+        with self._lock:
+            tenant = self._clients.get(key)
+            building = self._building.setdefault(key, threading.Lock()) if tenant is None else None
+        if building is not None:
+            with building:
+                with self._lock:
+                    tenant = self._clients.get(key)
+                if tenant is None:
+                    try:
+                        tenant = self._build(url, token)
+                    finally:
+                        with self._lock:
+                            self._building.pop(key, None)
+                    with self._lock:
+                        self._clients[key] = tenant
+        with self._lock:
+            tenant.last_used = time.monotonic()
+        return tenant
+
+    @contextmanager
+    def lease(self, url: str, token: str | None) -> Iterator[Tenant]:
+        """Use a tenant for the duration of a call, so it is not evicted while in use."""
+        tenant = self.get(url, token)
+        with self._lock:
+            tenant.active += 1
+        try:
+            yield tenant
+        finally:
+            with self._lock:
+                tenant.active -= 1
+                tenant.last_used = time.monotonic()
+
+    def evict_idle(self) -> int:
+        """Close tenants, other than the default one, unused for idle_seconds. Returns the number closed."""
+        now = time.monotonic()
+        default_key = (self.default[0], _fingerprint(self.default[1]))
+        with self._lock:
+            idle = [key for key, tenant in self._clients.items()
+                    if key != default_key and not tenant.active and now - tenant.last_used > self.idle_seconds]
+            for key in idle:
+                self._clients.pop(key).close()
+        return len(idle)
+
+    def cache_stats(self, url: str | None = None, token: str | None = None) -> Dict[str, Any]:
+        """Return the cache statistics of a tenant, or counters summed over all tenants when no url is given."""
+        with self._lock:
+            if url is not None:
+                tenant = self._clients.get((url, _fingerprint(token)))
+                # A tenant that was not built yet has an empty cache
+                return (tenant.cache if tenant else ResponseCache(JIRA_CACHE_MAX_ENTRIES, JIRA_CACHE_TTLS)).stats()
+            caches = [tenant.cache for tenant in self._clients.values()]
+        totals = dict.fromkeys(_CACHE_COUNTERS, 0)
+        for cache in caches:
+            stats = cache.stats()
+            for counter in _CACHE_COUNTERS:
+                totals[counter] += stats[counter]
+        return totals
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Return the active calls, idle time, rate limiter wait and cache size of every tenant with a live client."""
+        now = time.monotonic()
+        with self._lock:
+            tenants = list(self._clients.values())
+        return [{'tenant': tenant.name, 'url': tenant.url, 'active': tenant.active,
+                 'idle_seconds': round(now - tenant.last_used, 1),
+                 'throttled_seconds': round(tenant.jira_client.limiter.waited_seconds, 1),
+                 'cache_entries': tenant.cache.stats()['entries']}
+                for tenant in tenants]
+
+    def close(self) -> None:
+        with self._lock:
+            for tenant in self._clients.values():
+                tenant.close()
+            self._clients.clear()
+            if self._mirror is not None:
+                self._mirror.close()
+                self._mirror = None
+
+    def _build(self, url: str, token: str | None) -> Tenant:
+        started = time.perf_counter()
+        is_default = (url, token) == self.default
+        tenant = Tenant(self._name(url, token), url, token, self.pool_size,
+                        self.mirror() if is_default else None, self.metrics)
+        if is_default:
+            self.metrics.record_startup("jira_client", time.perf_counter() - started)
+        return tenant
+
+    def _name(self, url: str, token: str | None) -> str:
+        if (url, token) == self.default:
+            return "default"
+        # Tokens passed by clients are never reported, only a short fingerprint
+        return f"token:{_fingerprint(token)[:8]}"
+
+def _parse_tenants(config: str | Dict[str, Any]) -> Dict[str, str | ValueError]:
+    """Map the tenant names of JIRA_TENANTS to their instance URL, or to the error of an unusable entry."""
+    if isinstance(config, str):
+        try:
+            config = json.loads(config or "{}")
+        except ValueError as e:
+            raise ValueError(f"JIRA_TENANTS is not valid JSON: {e}") from None
+    if not isinstance(config, dict):
+        raise ValueError("JIRA_TENANTS must be a JSON object of tenants")
+    tenants: Dict[str, str | ValueError] = {}
+    for name, tenant in config.items():
+        url = tenant.get('url') if isinstance(tenant, dict) else None
+        tenants[name] = url.rstrip("/") if isinstance(url, str) and url else \
+            ValueError(f"The Jira tenant {name} has no url in JIRA_TENANTS")
+    return tenants
+
+def _fingerprint(token: str | None) -> str:
+    """Hash credentials so raw tokens are not kept as registry keys."""
+    return hashlib.sha256((token or "").encode()).hexdigest()
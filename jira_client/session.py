@@ -0,0 +1,143 @@
+import threading
+import requests
+from concurrent.futures import Future
+from typing import Dict, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .client import JIRA_BACKOFF_FACTOR, JIRA_MAX_BACKOFF_SECONDS, JIRA_MAX_RETRIES, JIRA_RATE_LIMIT, JIRA_RATE_BURST
+from .metrics import METRICS, Metrics, endpoint_name
+from .ratelimit import TokenBucket
+
+RETRY_STATUS_CODES = (429, 503)
+
+class _MeteredRetry(Retry):
+    """Retry policy that counts rate limited responses before they are retried.
+
+    A rate limited response also pauses the session's token bucket for the Retry-After
+    time, or the backoff, so concurrent requests wait instead of being rejected too.
+    """
+
+    metrics: Metrics = METRICS
+    limiter: TokenBucket | None = None
+
+    def new(self, **kw) -> "_MeteredRetry":
+        retry = super().new(**kw)
+        retry.metrics = self.metrics
+        retry.limiter = self.limiter
+        return retry
+
+    def increment(self, method=None, url=None, response=None, *args, **kwargs) -> "_MeteredRetry":
+        # Raises once retries are exhausted, the final response is recorded by the session hook
+        retry = super().increment(method, url, response, *args, **kwargs)
+        if response is not None and response.status == 429:
+            self.metrics.count_rate_limited(endpoint_name(method or "GET", url or ""))
+            if self.limiter is not None:
+                self.limiter.pause(retry.get_retry_after(response) or retry.get_backoff_time())
+        return retry
+
+class _LimitedAdapter(HTTPAdapter):
+    """HTTP adapter taking a token from the session's bucket before every request."""
+
+    def __init__(self, limiter: TokenBucket, **kwargs):
+        self.limiter = limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, *args, **kwargs):
+        self.limiter.acquire()
+        return super().send(request, *args, **kwargs)
+
+class CoalescingSession(requests.Session):
+    """Session sending identical GET requests that are in flight at the same time only once.
+
+    Concurrent callers asking for the same URL with the same headers wait for the first
+    request and each get their own copy of its response, with the body already read.
+    Each caller still decodes the body itself, so no parsed JSON is shared. Requests
+    issued after the response arrived are sent again, caching is left to ResponseCache.
+    """
+
+    def __init__(self, metrics: Metrics = METRICS):
+        super().__init__()
+        self.metrics = metrics
+        self._flights: Dict[Tuple, Future] = {}
+        self._lock = threading.Lock()
+
+    def request(self, method, url, params=None, data=None, headers=None, **kwargs):
+        if method.upper() != "GET" or data or kwargs.get("stream"):
+            return super().request(method, url, params=params, data=data, headers=headers, **kwargs)
+        key = (requests.Request("GET", url, params=params).prepare().url,
+               tuple(sorted((headers or {}).items())))
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = Future()
+        if not leader:
+            self.metrics.count_coalesced(endpoint_name("GET", key[0]))
+            return _copy_response(flight.result())
+        try:
+            response = super().request(method, url, params=params, data=data, headers=headers, **kwargs)
+            # Waiters copy a snapshot, so changes the leader's caller makes to its response stay its own
+            flight.set_result(_copy_response(response))
+            return response
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+
+def _copy_response(response: requests.Response) -> requests.Response:
+    """Copy a response with its body read, so callers do not share its headers or history."""
+    copy = requests.Response()
+    copy.__setstate__(response.__getstate__())
+    copy.headers = requests.structures.CaseInsensitiveDict(response.headers)
+    copy.history = list(response.history)
+    return copy
+
+def build_session(pool_size: int, metrics: Metrics = METRICS, limiter: TokenBucket | None = None) -> CoalescingSession:
+    """Build a requests session with a connection pool sized for the tool concurrency.
+
+    The pool blocks once pool_size connections are in use, so pool_size also caps the
+    requests in flight. Every request takes a token from limiter, by default a bucket
+    of JIRA_RATE_LIMIT requests per second, and identical concurrent GET requests are
+    sent only once.
+
+    Rate limited and unavailable responses are retried with exponential backoff,
+    honouring Jira's Retry-After header when present. Read errors are not retried
+    so that non-idempotent writes are never sent twice. The latency, size and status
+    of every response are recorded per endpoint in metrics.
+    """
+    retries = _MeteredRetry(
+        total=None,
+        connect=JIRA_MAX_RETRIES,
+        read=0,
+        status=JIRA_MAX_RETRIES,
+        allowed_methods=None,
+        status_forcelist=RETRY_STATUS_CODES,
+        backoff_factor=JIRA_BACKOFF_FACTOR,
+        backoff_max=JIRA_MAX_BACKOFF_SECONDS,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    limiter = limiter or TokenBucket(JIRA_RATE_LIMIT, JIRA_RATE_BURST)
+    retries.metrics = metrics
+    retries.limiter = limiter
+    adapter = _LimitedAdapter(limiter, pool_connections=1, pool_maxsize=pool_size, max_retries=retries,
+                              pool_block=True)
+
+    session = CoalescingSession(metrics)
+    session.limiter = limiter
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    })
+
+    def record_response(response: requests.Response, *args, **kwargs) -> None:
+        metrics.observe("jira", endpoint_name(response.request.method, response.url),
+                        response.elapsed.total_seconds(), len(response.content),
+                        error=response.status_code >= 400, status=response.status_code)
+
+    session.hooks["response"].append(record_response)
+    return session
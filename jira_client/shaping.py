@@ -0,0 +1,269 @@
+import base64
+import binascii
+import json
+from typing import Any, Dict, List, Tuple
+from .changes import parse_jira_time
+
+# Strings are never truncated below this many characters
+MIN_TEXT_LENGTH = 200
+# Rough bytes per LLM token, used to report an approximate token count
+BYTES_PER_TOKEN = 4
+# Keys that only carry REST links or images
+NOISE_KEYS = {"self", "avatarUrls", "iconUrl"}
+# Keys of a Jira user object, which collapse() replaces by its display name
+USER_KEYS = {"avatarUrls", "emailAddress", "accountId", "timeZone"}
+# Expansions Jira may add next to the fields of an issue
+EXPANSION_KEYS = {"renderedFields", "names", "schema", "transitions", "operations", "editmeta", "changelog",
+                  "versionedRepresentations"}
+# Fields always kept when an issue has to be trimmed to its budget
+ESSENTIAL_FIELDS = {"summary", "description", "status", "issuetype", "priority", "assignee", "reporter"}
+
+def payload_size(obj: Any) -> int:
+    """Size in bytes of the compact JSON encoding of obj."""
+    return len(json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode())
+
+def normalize(obj: Any, expand: str | None = None) -> Any:
+    """Strip a Jira response of everything that carries no information, in place.
+
+    One iterative walk drops null values, link and avatar noise (NOISE_KEYS), and
+    containers left empty, except the top level ones such as an empty "fields". For an
+    issue, the "expand" list and expansions other than the requested ones are dropped
+    as well. Responses are modified rather than copied, so only pass fresh responses.
+    Returns obj.
+    """
+    if not isinstance(obj, (dict, list)):
+        return obj
+    if isinstance(obj, dict) and "fields" in obj:
+        requested = {name.strip() for name in (expand or "").split(",")}
+        for key in [key for key in obj if key == "expand" or (key in EXPANSION_KEYS and key not in requested)]:
+            del obj[key]
+
+    # Containers in walk order with where they are held, children always after their parent
+    visited: List[Tuple[Any, Any, Any]] = []
+    stack: List[Tuple[Any, Any, Any]] = [(obj, None, None)]
+    push = stack.append
+    while stack:
+        entry = stack.pop()
+        visited.append(entry)
+        node = entry[0]
+        if type(node) is dict:
+            dropped = None
+            for name, value in node.items():
+                if value is None or name in NOISE_KEYS:
+                    if dropped is None:
+                        dropped = []
+                    dropped.append(name)
+                elif type(value) is dict or type(value) is list:
+                    push((value, node, name))
+            if dropped:
+                for name in dropped:
+                    del node[name]
+        else:
+            if None in node:
+                node[:] = [item for item in node if item is not None]
+            for index, item in enumerate(node):
+                if type(item) is dict or type(item) is list:
+                    push((item, node, index))
+
+    # Children first, so a container emptied by dropping its children is dropped too
+    emptied: List[Any] = []
+    for node, parent, key in reversed(visited):
+        if emptied and emptied[-1] is node:
+            emptied.pop()
+            node[:] = [item for item in node if item is not _EMPTY]
+        if node or parent is None or parent is obj:
+            continue
+        if type(parent) is dict:
+            del parent[key]
+        else:
+            parent[key] = _EMPTY
+            if not emptied or emptied[-1] is not parent:
+                emptied.append(parent)
+    return obj
+
+# Placeholder of an emptied list item until its list is compacted
+_EMPTY = object()
+
+def collapse(obj: Any) -> Any:
+    """Drop link/avatar noise and replace nested user objects with their display name."""
+    if isinstance(obj, dict):
+        if "displayName" in obj and not USER_KEYS.isdisjoint(obj):
+            return obj["displayName"]
+        return {k: collapse(v) for k, v in obj.items() if k not in NOISE_KEYS}
+    if isinstance(obj, list):
+        return [collapse(item) for item in obj]
+    return obj
+
+def truncate_text(text: str, length: int) -> str:
+    """Cut text to length characters, noting how much was removed."""
+    if len(text) <= length:
+        return text
+    return f"{text[:length]}... [truncated {len(text) - length} of {len(text)} chars]"
+
+def _long_strings(obj: Any, length: int, path: Tuple = ()) -> List[str]:
+    """List the paths of every string longer than length."""
+    paths = []
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            paths.extend(_long_strings(value, length, path + (key,)))
+    elif isinstance(obj, list):
+        for index, value in enumerate(obj):
+            paths.extend(_long_strings(value, length, path + (index,)))
+    elif isinstance(obj, str) and len(obj) > length:
+        paths.append(".".join(str(part) for part in path))
+    return paths
+
+def _cap_strings(obj: Any, length: int) -> Any:
+    """Copy obj with every string truncated to length characters."""
+    if isinstance(obj, dict):
+        return {k: _cap_strings(v, length) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_cap_strings(item, length) for item in obj]
+    if isinstance(obj, str):
+        return truncate_text(obj, length)
+    return obj
+
+def _longest_string(obj: Any) -> int:
+    if isinstance(obj, dict):
+        return max((_longest_string(v) for v in obj.values()), default=0)
+    if isinstance(obj, list):
+        return max((_longest_string(item) for item in obj), default=0)
+    return len(obj) if isinstance(obj, str) else 0
+
+def _fit_strings(obj: Any, max_bytes: int) -> Tuple[Any, int | None]:
+    """Find the largest string length cap that fits obj into max_bytes.
+
+    Returns the capped copy and the cap, or obj and None when no truncation is needed.
+    The copy may still exceed the budget if even MIN_TEXT_LENGTH is too long.
+    """
+    if payload_size(obj) <= max_bytes:
+        return obj, None
+    low, high = MIN_TEXT_LENGTH, _longest_string(obj)
+    if high <= low or payload_size(_cap_strings(obj, low)) > max_bytes:
+        return _cap_strings(obj, low), low
+    # Binary search for the largest cap that still fits
+    while low < high:
+        middle = (low + high + 1) // 2
+        if payload_size(_cap_strings(obj, middle)) <= max_bytes:
+            low = middle
+        else:
+            high = middle - 1
+    return _cap_strings(obj, low), low
+
+def shape_issue(issue: Dict[str, Any], max_bytes: int) -> Dict[str, Any]:
+    """Fit an issue into a byte budget.
+
+    Nested users are collapsed to display names first. If the issue is still too large,
+    every string is cut to the longest common length that fits, so the description and
+    other long text keep as much as the budget allows. If even the shortest cut does
+    not fit, non-essential fields are omitted, largest first, before cutting. The same
+    input and budget always produce the same output. A "_shaping" entry reports the
+    original and final size. A max_bytes of 0 disables the budget.
+    """
+    if not isinstance(issue, dict):
+        return issue
+    original_bytes = payload_size(issue)
+    shaped = collapse(issue)
+    truncated: List[str] = []
+    omitted: List[str] = []
+
+    if max_bytes > 0:
+        fields = shaped.get("fields")
+        if isinstance(fields, dict):
+            optional = sorted((name for name in fields if name not in ESSENTIAL_FIELDS),
+                              key=lambda name: (-payload_size(fields[name]), name))
+            for name in optional:
+                if payload_size(_cap_strings(shaped, MIN_TEXT_LENGTH)) <= max_bytes:
+                    break
+                del fields[name]
+                omitted.append(name)
+
+        capped, cap = _fit_strings(shaped, max_bytes)
+        if cap is not None:
+            truncated = _long_strings(shaped, cap)
+            shaped = capped
+
+    final_bytes = payload_size(shaped)
+    shaped["_shaping"] = {
+        "original_bytes": original_bytes,
+        "bytes": final_bytes,
+        "approx_tokens": final_bytes // BYTES_PER_TOKEN,
+        "budget_bytes": max_bytes,
+    }
+    if truncated:
+        shaped["_shaping"]["truncated"] = truncated
+    if omitted:
+        shaped["_shaping"]["omitted_fields"] = omitted
+    return shaped
+
+def page_comments(comments: Dict[str, Any] | List[Dict[str, Any]], max_bytes: int,
+                  limit: int | None = None, cursor: str | None = None) -> Dict[str, Any]:
+    """Return one page of comments, newest first, that fits into a byte budget.
+
+    Authors are collapsed to display names. Comments are added until the budget or
+    limit is reached; a single comment larger than the budget has its body truncated.
+    Pass the returned next_cursor to fetch the following page. It holds the created
+    time and id of the last comment returned, so comments added in between do not
+    shift the next page. A max_bytes of 0 disables the budget.
+    """
+    if limit is not None and limit < 1:
+        raise ValueError("limit must be at least 1")
+    if isinstance(comments, dict):
+        comments = comments.get("comments", [])
+    ordered = sorted(comments, key=_comment_order, reverse=True)
+    start = 0
+    after = _decode_comment_cursor(cursor) if cursor else None
+    if after is not None:
+        start = next((index for index, comment in enumerate(ordered) if _comment_order(comment) < after),
+                     len(ordered))
+
+    page: List[Dict[str, Any]] = []
+    size = 0
+    index = start
+    while index < len(ordered) and (limit is None or len(page) < limit):
+        comment = collapse({key: ordered[index].get(key)
+                            for key in ("id", "author", "created", "updated", "body")
+                            if ordered[index].get(key) is not None})
+        if comment.get("updated") == comment.get("created"):
+            comment.pop("updated", None)
+        comment_size = payload_size(comment)
+        if max_bytes > 0 and size + comment_size > max_bytes:
+            if page:
+                break
+            # Always return at least one comment so paging makes progress
+            body = comment.get("body", "")
+            comment["body"] = truncate_text(body, max(MIN_TEXT_LENGTH, len(body) - (comment_size - max_bytes) - 64))
+            comment_size = payload_size(comment)
+        page.append(comment)
+        size += comment_size
+        index += 1
+
+    return {
+        "total": len(ordered),
+        "comments": page,
+        "next_cursor": (_encode_comment_cursor(ordered[index - 1]) if index > start else cursor)
+                       if index < len(ordered) else None,
+        "bytes": size,
+        "approx_tokens": size // BYTES_PER_TOKEN,
+    }
+
+def _comment_order(comment: Dict[str, Any]) -> Tuple[int, int]:
+    """Sort key of a comment, its creation time in epoch milliseconds and then its numeric id.
+
+    Timestamps are compared as instants, so time zone offsets do not reorder comments,
+    and ids as numbers, so comment 10 sorts after comment 9.
+    """
+    comment_id = str(comment.get("id", ""))
+    return (parse_jira_time(comment.get("created")) or 0, int(comment_id) if comment_id.isdigit() else 0)
+
+def _encode_comment_cursor(comment: Dict[str, Any]) -> str:
+    """Build the opaque cursor continuing after a comment."""
+    return base64.urlsafe_b64encode(json.dumps(_comment_order(comment)).encode()).decode().rstrip("=")
+
+def _decode_comment_cursor(cursor: str) -> Tuple[int, int] | None:
+    """Return the sort key a comment cursor continues after, None when it is malformed."""
+    try:
+        created, comment_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return (int(created), int(comment_id))
+    except (binascii.Error, ValueError, TypeError):
+        return None
@@ -1,15 +1,151 @@
-from mcp.server.fastmcp import FastMCP
-from jira_client import JiraClient, ManageIssues, ManageProjects
-from models import JiraIssue
-from typing import List, Dict, Any, Optional
+import time
+# Taken first so the recorded import time includes the MCP and Jira client packages
+IMPORT_STARTED = time.perf_counter()
+import anyio
+import inspect
+import re
+import threading
+import uvicorn
+from contextlib import ExitStack, asynccontextmanager
+from contextvars import ContextVar
+from functools import partial
+from mcp.server.fastmcp import Context, FastMCP
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+from uvicorn.supervisors import Multiprocess
+from jira_client import ClientRegistry, JIRA_MAX_CONCURRENCY, METRICS
+from jira_client.client import JIRA_PAGE_CONCURRENCY, JIRA_ISSUE_MAX_BYTES, JIRA_COMMENTS_MAX_BYTES, \
+    JIRA_DESCRIPTION_MAX_CHARS, JIRA_GRAPH_MAX_NODES, JIRA_METRICS_PATH, JIRA_MCP_TRANSPORT, JIRA_MCP_WORKERS, \
+    JIRA_MCP_STATELESS_HTTP, JIRA_MCP_SHUTDOWN_SECONDS, JIRA_MCP_DRAIN_SECONDS
+from jira_client.shaping import page_comments, shape_issue, truncate_text
+from models import to_compact_json
+from typing import List, Dict, Any, Optional, Callable, Iterator, Tuple
+
+# Results of tools reporting a failure as {"error": ...} instead of raising
+ERROR_RESULT = re.compile(r'^\s*\{\s*"error"\s*:')
+
+class InstrumentedFastMCP(FastMCP):
+    """FastMCP server recording the latency, response size and errors of every tool call.
+
+    Tools that return {"error": ...} instead of raising count as errors too.
+
+    The Jira tenant of a call is selected by the "jira_token" and optionally the
+    "jira_tenant" or "jira_url" keys of the request _meta, see ClientRegistry.resolve.
+    """
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any]):
+        started = time.perf_counter()
+        try:
+            token = current_tenant.set(client_registry.resolve(**self._tenantSelection()))
+            try:
+                content = await super().call_tool(name, arguments)
+            finally:
+                current_tenant.reset(token)
+        except Exception:
+            METRICS.observe("tool", name, time.perf_counter() - started, error=True)
+            raise
+        texts = [item.text for item in content if getattr(item, 'text', None)]
+        METRICS.observe("tool", name, time.perf_counter() - started, sum(len(text.encode()) for text in texts),
+                        error=len(texts) == 1 and ERROR_RESULT.match(texts[0]) is not None)
+        return content
+
+    def _tenantSelection(self) -> Dict[str, str]:
+        try:
+            meta = self.get_context().request_context.meta
+        except ValueError:
+            # Called outside of an MCP request
+            return {}
+        extra = (meta.model_extra if meta is not None else None) or {}
+        return {name: extra[f"jira_{name}"] for name in ("tenant", "url", "token") if extra.get(f"jira_{name}")}
 
 # Instantiate the MCP server
-mcp = FastMCP("Jira")
+mcp = InstrumentedFastMCP("Jira", stateless_http=JIRA_MCP_STATELESS_HTTP)
+
+class LazyManager:
+    """Stand-in for the ManageIssues or ManageProjects instance of the tenant selected by the current tool call.
+
+    Methods are looked up when they are called rather than when they are accessed, so
+    run_blocking(manage_issues.GetIssue, ...) builds the tenant's Jira client on the
+    worker thread instead of blocking the event loop.
+    """
+
+    def __init__(self, attribute: str):
+        self._attribute = attribute
+
+    def __getattr__(self, name: str) -> Callable:
+        return partial(self._call, name)
+
+    def _call(self, name: str, *args, **kwargs):
+        with ExitStack() as lease:
+            tenant = lease.enter_context(client_registry.lease(*selected_tenant()))
+            result = getattr(getattr(tenant, self._attribute), name)(*args, **kwargs)
+            if inspect.isgenerator(result):
+                # Page iterators such as IterIssuePages run after the call returns
+                return LeasedIterator(result, lease.pop_all())
+            return result
+
+class LeasedIterator:
+    """Iterator over a generator that holds the tenant lease until the generator is exhausted or closed."""
+
+    def __init__(self, generator: Iterator, lease: ExitStack):
+        self._generator = generator
+        self._lease = lease
+
+    def __iter__(self) -> "LeasedIterator":
+        return self
+
+    def __next__(self):
+        try:
+            return next(self._generator)
+        except BaseException:
+            self.close()
+            raise
 
-# Instantiate Jira management classes
-jira_client = JiraClient().client
-manage_projects = ManageProjects(jira_client)
-manage_issues = ManageIssues(jira_client)
+    def close(self) -> None:
+        try:
+            self._generator.close()
+        finally:
+            self._lease.close()
+
+    def __del__(self):
+        self.close()
+
+# Jira clients per (instance, credential), built on the first tool call that needs them
+client_registry = ClientRegistry()
+manage_projects = LazyManager("projects")
+manage_issues = LazyManager("issues")
+# (url, token) chosen by the _meta of the tool call being served
+current_tenant: ContextVar[Tuple[str, str | None] | None] = ContextVar("current_tenant", default=None)
+
+def selected_tenant() -> Tuple[str, str | None]:
+    """Return the (url, token) of the current tool call, the default tenant outside of tool calls."""
+    return current_tenant.get() or client_registry.default
+
+# Bounded worker pool shared by all tools for blocking Jira calls
+jira_limiter = anyio.CapacityLimiter(JIRA_MAX_CONCURRENCY)
+
+async def run_blocking(func: Callable, *args, **kwargs):
+    """Run a blocking Jira call on a worker thread so the event loop keeps serving other tool calls."""
+    return await anyio.to_thread.run_sync(partial(func, *args, **kwargs), limiter=jira_limiter)
+
+async def collect_issue_pages(pages: Iterator, ctx: Context | None = None, stream: bool = False) -> str:
+    """Drain a page iterator such as ManageIssues.IterIssuePages, reporting progress after every page.
+
+    When stream is set, each page's issues are sent as the progress message so the client
+    sees partial results before the whole result set has been fetched.
+    """
+    filtered_issues = []
+    try:
+        while (item := await run_blocking(next, pages, None)) is not None:
+            page, total = item
+            filtered_issues.extend(page)
+            if ctx is not None:
+                message = to_compact_json(page) if stream else f"Fetched {len(filtered_issues)} of {total} issues"
+                await ctx.report_progress(len(filtered_issues), total, message)
+    finally:
+        pages.close()
+    return to_compact_json(filtered_issues)
 
 # Example tool
 
@@ -18,102 +154,324 @@ def add(a: int, b: int) -> int:
     """Add two numbers and return the result."""
     return a + b
 
+@mcp.tool()
+def get_cache_stats() -> Dict[str, Any]:
+    """
+    Retrieve hit/miss counters of the read-only response cache of the selected Jira tenant.
+    Returns:
+        Dictionary with entry count, hits, misses, hit rate, evictions and per-tool TTLs.
+    """
+    return client_registry.cache_stats(*selected_tenant())
+
+@mcp.tool()
+async def sync_project(project_key: str, full: bool = False) -> str:
+    """
+    Load a project into the local issue mirror, or fetch the issues updated since its last sync.
+    Reads of mirrored projects are then answered locally while the mirror is fresh.
+    Args:
+        project_key: The key of the Jira project.
+        full: Walk every issue of the project again, dropping deleted issues.
+    Returns:
+        JSON object with the sync mode, issues fetched and mirrored issue count.
+    """
+    return to_compact_json(await run_blocking(manage_issues.SyncProject, project_key, full))
+
+@mcp.tool()
+async def get_mirror_status() -> str:
+    """
+    Retrieve the projects held in the local issue mirror.
+    Returns:
+        JSON list with the issue count and seconds since the last sync of every mirrored project.
+    """
+    issue_mirror = await run_blocking(client_registry.mirror)
+    if issue_mirror is None:
+        return to_compact_json({'error': 'Local mirror is disabled, set JIRA_MIRROR_PATH to enable it'})
+    return to_compact_json(await run_blocking(issue_mirror.status))
+
+# Metrics
+
+@mcp.resource("metrics://jira", mime_type="application/json")
+def get_metrics() -> str:
+    """Latency percentiles, call, error and 429 counts and response sizes per tool and Jira endpoint, cache and tenant counters."""
+    return to_compact_json({**METRICS.snapshot(), 'cache': client_registry.cache_stats(),
+                            'tenants': client_registry.stats()})
+
+if JIRA_METRICS_PATH:
+    @mcp.custom_route(JIRA_METRICS_PATH, methods=["GET"])
+    async def metrics_endpoint(request: Request) -> Response:
+        """Serve the metrics in the Prometheus text format when running with the SSE or HTTP transport."""
+        return PlainTextResponse(METRICS.prometheus(client_registry.cache_stats()),
+                                 media_type="text/plain; version=0.0.4")
+
+# Health checks and lifecycle of the SSE and HTTP transports
+
+# Set once the HTTP server receives its shutdown signal
+shutting_down = threading.Event()
+
+@mcp.custom_route("/healthz", methods=["GET"])
+async def liveness(request: Request) -> Response:
+    """Answer while the process is serving requests."""
+    return PlainTextResponse("ok")
+
+@mcp.custom_route("/readyz", methods=["GET"])
+async def readiness(request: Request) -> Response:
+    """Answer 200 once a Jira instance is configured and the default client is built, 503 while shutting down.
+
+    Building the client here also takes its cost off the first tool call.
+    """
+    if shutting_down.is_set():
+        return PlainTextResponse("shutting down", status_code=503)
+    if not client_registry.instances():
+        return PlainTextResponse("no Jira instance configured, set JIRA_URL or JIRA_TENANTS", status_code=503)
+    if client_registry.default[0]:
+        await run_blocking(client_registry.get, *client_registry.default)
+    return PlainTextResponse("ready")
+
+class DrainingServer(uvicorn.Server):
+    """uvicorn server failing the readiness check as soon as it receives SIGTERM or SIGINT.
+
+    uvicorn refuses new connections and closes idle ones right after the signal, so the
+    first signal only fails the readiness check and the server stops JIRA_MCP_DRAIN_SECONDS
+    later, giving load balancers polling /readyz time to take it out. A second signal
+    stops it right away.
+    """
+
+    def handle_exit(self, sig: int, frame: Any) -> None:
+        if not shutting_down.is_set() and JIRA_MCP_DRAIN_SECONDS > 0:
+            shutting_down.set()
+            timer = threading.Timer(JIRA_MCP_DRAIN_SECONDS, super().handle_exit, (sig, frame))
+            timer.daemon = True
+            timer.start()
+            return
+        shutting_down.set()
+        super().handle_exit(sig, frame)
+
+def http_app(transport: str = JIRA_MCP_TRANSPORT) -> Starlette:
+    """Build the ASGI app of the SSE or streamable HTTP transport, with the metrics and health check routes.
+
+    From the shutdown signal on the readiness check fails, see DrainingServer. Once the open
+    requests finished, or JIRA_MCP_SHUTDOWN_SECONDS passed, the Jira clients and the mirror
+    are closed. Also used as the uvicorn app factory of the worker processes.
+    """
+    app = mcp.sse_app() if transport == "sse" else mcp.streamable_http_app()
+    serve = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app: Starlette):
+        async with serve(app):
+            try:
+                yield
+            finally:
+                shutting_down.set()
+        await run_blocking(client_registry.close)
+
+    app.router.lifespan_context = lifespan
+    return app
+
+def serve() -> None:
+    """Run the server with the transport set in JIRA_MCP_TRANSPORT."""
+    if JIRA_MCP_TRANSPORT == "stdio":
+        mcp.run()
+        return
+    if JIRA_MCP_TRANSPORT not in ("sse", "streamable-http"):
+        raise ValueError('JIRA_MCP_TRANSPORT must be "stdio", "sse" or "streamable-http"')
+    if JIRA_MCP_TRANSPORT == "sse" and JIRA_MCP_WORKERS > 1:
+        raise ValueError("SSE sessions are bound to one process, use streamable-http to run several workers")
+    options = dict(host=mcp.settings.host, port=mcp.settings.port, log_level=mcp.settings.log_level.lower(),
+                   timeout_graceful_shutdown=JIRA_MCP_SHUTDOWN_SECONDS)
+    if JIRA_MCP_WORKERS > 1:
+        # Every worker imports the server again and builds the app with the factory
+        config = uvicorn.Config("jira_mcp_server:http_app", factory=True, workers=JIRA_MCP_WORKERS, **options)
+        # Taken from the module the workers build the app from, also when this file runs as a script,
+        # so the server and the readiness check share one shutting_down event
+        import jira_mcp_server
+        server = jira_mcp_server.DrainingServer(config)
+        Multiprocess(config, target=server.run, sockets=[config.bind_socket()]).run()
+    else:
+        DrainingServer(uvicorn.Config(http_app(), **options)).run()
+
 # Issue Management Tools
 
 @mcp.tool()
-def get_issues_for_board(board_id: str, jql: str = "", limit: int = 20) -> List[JiraIssue]:
+async def get_issues_for_board(board_id: str, jql: str = "", limit: int = 20,
+                               fields: str | None = None) -> str:
     """
     Retrieve issues from a specific Jira board.
     Args:
         board_id: The ID of the Jira board.
         jql: JQL query string to filter issues.
         limit: Maximum number of issues to return.
+        fields: Comma separated fields to fetch (defaults to the standard read fields).
     Returns:
-        List of JiraIssue objects.
+        JSON list of JiraIssue objects.
     """
-    return manage_issues.GetIssuesForBoard(board_id, jql, limit)
+    issues = await run_blocking(manage_issues.GetIssuesForBoard, board_id, jql=jql, fields=fields, limit=limit)
+    return to_compact_json(issues)
 
 @mcp.tool()
-def get_issues_for_project(project_key: str, limit: int = 20) -> List[JiraIssue]:
+async def get_issues_for_project(project_key: str, limit: int = 20,
+                                 fields: str | None = None) -> str:
     """
     Retrieve issues from a specific Jira project.
     Args:
         project_key: The key or name of the Jira project.
         limit: Maximum number of issues to return.
+        fields: Comma separated fields to fetch (defaults to the standard read fields).
+    Returns:
+        JSON list of JiraIssue objects.
+    """
+    issues = await run_blocking(manage_issues.GetIssuesForProject, project_key, fields=fields, limit=limit)
+    return to_compact_json(issues)
+
+@mcp.tool()
+async def get_issues(jql: str, max_results: int = 50, fields: str | None = None, stream: bool = False,
+                     ctx: Context = None) -> str:
+    """
+    Filters and returns issues using JQL, following result pages automatically.
+    Args:
+        jql: The JQL to use to filter issues.
+        max_results: Maximum number of issues to return (default: 50).
+        fields: Comma separated extra fields to return besides key, summary and status.
+        stream: Send every fetched page as a progress notification while the query runs.
     Returns:
-        List of JiraIssue objects.
+        JSON list of JiraIssue objects.
     """
-    return manage_issues.GetIssuesForProject(project_key, limit)
+    pages = await run_blocking(manage_issues.IterIssuePages, jql, fields=fields, max_results=max_results,
+                               concurrency=JIRA_PAGE_CONCURRENCY)
+    return await collect_issue_pages(pages, ctx, stream)
 
 @mcp.tool()
-def get_issues(jql: str) -> List[JiraIssue]:
+async def run_jql_batch(queries: Dict[str, str], fields: str | None = None, limit: int = 50) -> str:
     """
-    Filters and returns issues using JQL.
+    Run several JQL queries at the same time, e.g. to compare open bugs across projects in one call.
     Args:
-        key: The JQL to use to filter issues.
+        queries: JQL queries by name, e.g. {"eng": "project = ENG AND issuetype = Bug", "ops": "project = OPS AND ..."}
+            (at most 20).
+        fields: Comma separated extra fields to return for every issue besides key, summary and status.
+        limit: Maximum number of issues per query.
     Returns:
-        List of JiraIssue objects.
+        JSON object with results by query name, each with its issues and count or an error, and the seconds it
+        took, and the seconds taken by the whole batch.
     """
-    return manage_issues.GetIssues(jql)
+    return to_compact_json(await run_blocking(manage_issues.RunJqlBatch, queries, fields, limit))
 
 @mcp.tool()
-def get_issue(key: str) -> JiraIssue:
+async def get_changes_since(jql: str, since_cursor: str | None = None, fields: str | None = None,
+                            max_results: int = 500) -> str:
+    """
+    Poll a JQL query for the issues that changed since the previous poll.
+    Only issues updated after the cursor are fetched, so polling cost follows the churn, not the result size.
+    Args:
+        jql: The JQL query to follow, e.g. 'project = ENG AND status != Done'
+        since_cursor: The cursor returned by the previous call, omit it to get every matching issue
+            and a first cursor.
+        fields: Comma separated extra fields to return besides the summary and status
+        max_results: Maximum number of issues per call, call again with the new cursor while more is true
+    Returns:
+        JSON object with the changed issues (only their changed fields, and each field change with its
+        old and new value, author and time), the new cursor and whether more changes are pending.
+        While "baseline" is true full issues are returned, also on the calls continuing a cut off baseline.
+    """
+    return to_compact_json(await run_blocking(manage_issues.GetChangesSince, jql, since_cursor, fields,
+                                              max_results))
+
+@mcp.tool()
+async def get_issue(key: str, fields: str | None = None, expand: str | None = None,
+                    max_bytes: int = JIRA_ISSUE_MAX_BYTES) -> str:
     """
     Retrieve details of a specific Jira issue.
     Args:
         key: The Jira issue key.
+        fields: Comma separated fields to fetch (defaults to the standard read fields, "*all" for every field).
+        expand: Optional expansions such as "changelog" or "renderedFields".
+        max_bytes: Response budget. Long text is truncated and optional fields dropped to fit (0 for no limit).
     Returns:
-        JiraIssue object.
+        JSON object with the issue key and requested fields, and a "_shaping" size report.
     """
-    return manage_issues.GetIssue(key)
+    issue = await run_blocking(manage_issues.GetIssue, key, fields, expand)
+    return to_compact_json(shape_issue(issue, max_bytes))
 
 @mcp.tool()
-def get_issue_comments(issue_id_or_key: str) -> List[Dict]:
+async def get_issues_by_keys(keys: List[str], fields: str | None = None) -> str:
     """
-    Retrieve comments for a specific Jira issue.
+    Retrieve several Jira issues at once with batched JQL queries.
+    Args:
+        keys: The Jira issue keys (e.g., ["ENG-123", "ENG-124"]).
+        fields: Comma separated extra fields to return besides key, summary and status.
+    Returns:
+        One issue per key in input order. Keys that could not be fetched carry an error message.
+    """
+    issues = await run_blocking(manage_issues.GetIssuesByKeys, keys, fields)
+    return to_compact_json(issues)
+
+@mcp.tool()
+async def aggregate_issues(jql: str, group_by: List[str], method: str = "auto") -> str:
+    """
+    Count issues matching a JQL query per group, without returning the issues.
+    Args:
+        jql: The JQL to use to filter issues.
+        group_by: One or more of "status", "assignee", "priority", "issuetype" and "label".
+        method: "count" runs one count query per status, priority or issue type, "scan" reads only the
+            grouped fields of every issue, "auto" (default) picks the one needing fewer requests.
+    Returns:
+        JSON object with total, method, columns and rows of [group value..., count], largest first.
+    """
+    return to_compact_json(await run_blocking(manage_issues.AggregateIssues, jql, group_by, method))
+
+@mcp.tool()
+async def get_issue_comments(issue_id_or_key: str, limit: int | None = None, cursor: str | None = None,
+                             max_bytes: int = JIRA_COMMENTS_MAX_BYTES) -> str:
+    """
+    Retrieve comments for a specific Jira issue, newest first, one page at a time.
     Args:
         issue_id_or_key: The Jira issue key or ID.
+        limit: Maximum number of comments in the page, at least 1.
+        cursor: The next_cursor of the previous page, to continue paging.
+        max_bytes: Response budget for the page (0 for no limit).
     Returns:
-        List of comment dictionaries.
+        JSON object with total, comments (id, author name, created, body) and next_cursor.
     """
-    return manage_issues.GetIssueComments(issue_id_or_key)
+    comments = await run_blocking(manage_issues.GetIssueComments, issue_id_or_key)
+    return to_compact_json(page_comments(comments, max_bytes, limit, cursor))
 
 @mcp.tool()
-def get_issue_description(issue_key: str) -> str:
+async def get_issue_description(issue_key: str, max_chars: int = JIRA_DESCRIPTION_MAX_CHARS) -> str:
     """
     Retrieve the description of a specific Jira issue.
     Args:
         issue_key: The Jira issue key.
+        max_chars: Longer descriptions are truncated to this many characters (0 for no limit).
     Returns:
         String containing the issue description, or None if no description exists.
     """
-    issue = manage_issues.GetIssue(issue_key)
+    issue = await run_blocking(manage_issues.GetIssue, issue_key, "description")
     if isinstance(issue, dict) and "fields" in issue:
-        return issue["fields"].get("description", "No description available")
+        description = issue["fields"].get("description", "No description available")
+        return truncate_text(description, max_chars) if max_chars > 0 else description
     return "Unable to retrieve description"
 
 # Project Management Tools
 
 @mcp.tool()
-def get_projects() -> List[Dict]:
+async def get_projects() -> str:
     """
     Retrieve all Jira projects.
     Returns:
         List of project dictionaries.
     """
-    return manage_projects.GetProjects()
+    return to_compact_json(await run_blocking(manage_projects.GetProjects))
 
 @mcp.tool()
-def get_project_count() -> int:
+async def get_project_count() -> int:
     """
     Retrieve the count of all active Jira projects.
     Returns:
         Integer count of projects.
     """
-    return manage_projects.GetProjectsCount()
+    return await run_blocking(manage_projects.GetProjectsCount)
 
 @mcp.tool()
-def get_issues_count_for_project(project_key: str) -> int:
+async def get_issues_count_for_project(project_key: str) -> int:
     """
     Retrieve the count of issues for a specific Jira project.
     Args:
@@ -121,10 +479,10 @@ def get_issues_count_for_project(project_key: str) -> int:
     Returns:
         Integer count of issues.
     """
-    return manage_projects.GetIssueCountForProject(project_key)
+    return await run_blocking(manage_projects.GetIssueCountForProject, project_key)
 
 @mcp.tool()
-def get_linked_issues(issue_key: str, relationship_type: str = None) -> List[Dict]:
+async def get_linked_issues(issue_key: str, relationship_type: str = None) -> str:
     """
     Get issues linked to the specified issue.
     Args:
@@ -133,26 +491,67 @@ def get_linked_issues(issue_key: str, relationship_type: str = None) -> List[Dic
     Returns:
         List of linked issues with their relationship types.
     """
-    return manage_issues.GetLinkedIssues(issue_key, relationship_type)
+    return to_compact_json(await run_blocking(manage_issues.GetLinkedIssues, issue_key, relationship_type))
+
+@mcp.tool()
+async def get_issue_graph(root_key: str, depth: int = 2, relationship_types: List[str] | None = None,
+                          max_nodes: int = JIRA_GRAPH_MAX_NODES) -> str:
+    """
+    Walk the links between issues breadth first, e.g. to follow blocker chains or dependencies.
+    Args:
+        root_key: The Jira issue key to start from (e.g., "ENG-123").
+        depth: Number of link hops to follow (default: 2, at most 5).
+        relationship_types: Only follow these links, by link type name in both directions or by description
+            in one direction (e.g., ["Blocks"], or ["is blocked by"] to follow blockers only). All links are
+            followed when omitted.
+        max_nodes: Maximum number of issues in the graph.
+    Returns:
+        JSON object with nodes {key: {summary, status}}, edges as an adjacency list
+        {key: [[relationship, key], ...]}, whether max_nodes was hit and keys that could not be fetched.
+    """
+    return to_compact_json(await run_blocking(manage_issues.GetIssueGraph, root_key, depth,
+                                              relationship_types, max_nodes))
 
 @mcp.tool()
-def search_issues_by_text(text: str, max_results: int = 10) -> List[Dict]:
+async def search_issues_by_text(text: str, max_results: int = 10, fields: str | None = None,
+                                project_key: str | None = None, stream: bool = False, ctx: Context = None) -> str:
     """
     Search for Jira issues containing specific text in title, description, or comments.
     Args:
-        text: The text to search for (can be error message, stack trace, or any keyword)
+        text: The text to search for (can be error message, stack trace, or any keyword).
+            Double quoted parts are matched as phrases in mirrored projects.
         max_results: Maximum number of issues to return (default: 10)
+        fields: Comma separated extra fields to return besides key, summary and status.
+        project_key: Only search this project. Mirrored projects are searched locally, best match first.
+        stream: Send every fetched page as a progress notification while the search runs.
     Returns:
         List of matching issues with key, summary, and status.
     """
-    return manage_issues.SearchIssuesByText(text, max_results)
+    pages = await run_blocking(manage_issues.SearchIssuesByText, text, max_results, fields, project_key,
+                               concurrency=JIRA_PAGE_CONCURRENCY)
+    return await collect_issue_pages(pages, ctx, stream)
 
 # Issue Creation and Update Tools
 
 @mcp.tool()
-def create_issue(project_key: str, issue_type: str, summary: str, description: str = None,
+async def get_create_metadata(project_key: str, issue_type: str | None = None) -> str:
+    """
+    Describe what can be created in a project, from a cached index of Jira's create metadata.
+
+    Args:
+        project_key: The project key
+        issue_type: Issue type to describe (optional). Without it the project's issue types are listed.
+
+    Returns:
+        JSON object with the project's issue types, or the fields of the issue type with their id,
+        name, whether they are required and their allowed values
+    """
+    return to_compact_json(await run_blocking(manage_issues.GetCreateMetadata, project_key, issue_type))
+
+@mcp.tool()
+async def create_issue(project_key: str, issue_type: str, summary: str, description: str = None,
                 priority: str = None, labels: List[str] = None, assignee: str = None,
-                additional_fields: Dict[str, Any] = None) -> Dict[str, Any]:
+                additional_fields: Dict[str, Any] = None) -> str:
     """
     Create a new Jira issue.
 
@@ -163,19 +562,21 @@ def create_issue(project_key: str, issue_type: str, summary: str, description: s
         description: Issue description (optional)
         priority: Priority of the issue (e.g., 'High', 'Medium', 'Low') (optional)
         labels: List of labels to attach to the issue (optional)
-        assignee: Username of the assignee (optional)
-        additional_fields: Additional fields to set on the issue (optional)
+        assignee: Username, display name or email of the assignee (optional)
+        additional_fields: Additional fields to set on the issue, by field id or name (optional)
 
     Returns:
         Dictionary with the created issue data
     """
-    return manage_issues.CreateIssue(project_key, issue_type, summary, description,
-                                    priority, labels, assignee, additional_fields)
+    new_issue = await run_blocking(manage_issues.CreateIssue, project_key, issue_type, summary, description,
+                                   priority, labels, assignee, additional_fields)
+    return to_compact_json(new_issue)
 
 @mcp.tool()
-def update_issue(issue_key: str, summary: str = None, description: str = None,
+async def update_issue(issue_key: str, summary: str = None, description: str = None,
                priority: str = None, labels: List[str] = None, assignee: str = None,
-               status: str = None, additional_fields: Dict[str, Any] = None) -> Dict[str, Any]:
+               status: str = None, additional_fields: Dict[str, Any] = None,
+               return_issue: bool = True) -> str:
     """
     Update an existing Jira issue.
 
@@ -187,17 +588,19 @@ def update_issue(issue_key: str, summary: str = None, description: str = None,
         labels: New list of labels (optional)
         assignee: New assignee username (optional)
         status: New status/transition (optional)
-        additional_fields: Additional fields to update (optional)
+        additional_fields: Additional fields to update, by field id or name (optional)
+        return_issue: Return the full updated issue. Set to False to return only the changed fields and save a request.
 
     Returns:
         Dictionary with the updated issue data
     """
-    return manage_issues.UpdateIssue(issue_key, summary, description,
-                                   priority, labels, assignee,
-                                   status, additional_fields)
+    updated_issue = await run_blocking(manage_issues.UpdateIssue, issue_key, summary, description,
+                                       priority, labels, assignee,
+                                       status, additional_fields, return_issue)
+    return to_compact_json(updated_issue)
 
 @mcp.tool()
-def add_comment(issue_key: str, comment: str) -> Dict[str, Any]:
+async def add_comment(issue_key: str, comment: str) -> str:
     """
     Add a comment to a Jira issue.
 
@@ -208,7 +611,84 @@ def add_comment(issue_key: str, comment: str) -> Dict[str, Any]:
     Returns:
         Dictionary with the created comment data or error
     """
-    return manage_issues.AddComment(issue_key, comment)
+    return to_compact_json(await run_blocking(manage_issues.AddComment, issue_key, comment))
+
+# Bulk Tools
+
+@mcp.tool()
+async def bulk_create_issues(issues: List[Dict[str, Any]]) -> str:
+    """
+    Create many Jira issues in as few requests as possible.
+
+    Args:
+        issues: List of issues, each a dictionary with the create_issue arguments
+            (project_key, issue_type, summary and optionally description, priority,
+            labels, assignee, additional_fields)
+
+    Returns:
+        One result per issue in input order, with the created issue data or an error
+    """
+    results = await run_blocking(manage_issues.BulkCreateIssues, issues)
+    return to_compact_json(results)
+
+@mcp.tool()
+async def bulk_update_issues(updates: List[Dict[str, Any]]) -> str:
+    """
+    Update many Jira issues concurrently.
+
+    Args:
+        updates: List of updates, each a dictionary with the update_issue arguments
+            (issue_key and optionally summary, description, priority, labels, assignee,
+            status, additional_fields)
+
+    Returns:
+        One result per update in input order, with the updated issue data or an error
+    """
+    results = await run_blocking(manage_issues.BulkUpdateIssues, updates)
+    return to_compact_json(results)
+
+@mcp.tool()
+async def bulk_add_comment(comments: List[Dict[str, str]]) -> str:
+    """
+    Add comments to many Jira issues concurrently.
+
+    Args:
+        comments: List of dictionaries with issue_key and comment
+
+    Returns:
+        One result per comment in input order, with the created comment data or an error
+    """
+    results = await run_blocking(manage_issues.BulkAddComment, comments)
+    return to_compact_json(results)
+
+# Export Tools
+
+@mcp.tool()
+async def export_issues(path: str, format: str = "ndjson", jql: str | None = None, project_key: str | None = None,
+                        board_id: str | None = None, fields: str | None = None, resume: bool = False,
+                        ctx: Context = None) -> str:
+    """
+    Export every issue of a JQL query, project or board to a file on the server.
+    Pages are written as they arrive, so exports of any size use little memory.
+    Args:
+        path: File to write, relative to the server's export directory (a directory of part files for Parquet)
+        format: "ndjson" (one issue per line), "csv" or "parquet"
+        jql: JQL query of the issues to export
+        project_key: Export every issue of this project instead
+        board_id: Export every issue of this board instead
+        fields: Comma separated fields to export (defaults to the fields returned by get_issue)
+        resume: Continue an interrupted export of the same path from its last complete page
+    Returns:
+        JSON object with the path, format, rows and bytes written and the seconds taken.
+    """
+    def progress(rows: int, total: int) -> None:
+        anyio.from_thread.run(ctx.report_progress, rows, total, f"Exported {rows} of {total} issues")
+
+    return to_compact_json(await run_blocking(manage_issues.ExportIssues, path, format, jql=jql,
+                                              project_key=project_key, board_id=board_id, fields=fields,
+                                              resume=resume, progress=progress if ctx is not None else None))
+
+METRICS.record_startup("import", time.perf_counter() - IMPORT_STARTED)
 
 if __name__ == "__main__":
-    mcp.run()
+    serve()
@@ -1,7 +1,16 @@
-from .issue import JiraIssue
-from .constants import DEFAULT_READ_JIRA_FIELDS
+from .issue import JiraIssue, JiraIssueType, JiraPriority, JiraStatus, JiraStatusCategory, JiraUser, compact_issue, \
+    to_compact_json
+from .constants import DEFAULT_READ_JIRA_FIELDS, SEARCH_RESULT_JIRA_FIELDS
 
 __all__ = [
     "JiraIssue",
-    DEFAULT_READ_JIRA_FIELDS
+    "JiraIssueType",
+    "JiraPriority",
+    "JiraStatus",
+    "JiraStatusCategory",
+    "JiraUser",
+    "compact_issue",
+    "to_compact_json",
+    "DEFAULT_READ_JIRA_FIELDS",
+    "SEARCH_RESULT_JIRA_FIELDS",
 ]
\ No newline at end of file
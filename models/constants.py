@@ -11,6 +11,9 @@ DEFAULT_READ_JIRA_FIELDS: set[str] = {
     "issuetype",
 }
 
+# Fields returned for every issue in search results
+SEARCH_RESULT_JIRA_FIELDS: tuple[str, ...] = ("summary", "status")
+
 JIRA_DEFAULT_ID = "0"
 UNKNOWN = "Unknown"
 UNASSIGNED = "Unassigned"
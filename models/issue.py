@@ -1,18 +1,64 @@
-from pydantic import BaseModel
+from typing import Any, Callable, Dict, List
+from pydantic import BaseModel, TypeAdapter
 from .constants import UNASSIGNED, UNKNOWN, EMPTY_STRING, JIRA_DEFAULT_ID, NONE_VALUE
 
+# Serializer used for tool results, which mix models, dicts and lists
+_RESULT_ADAPTER = TypeAdapter(Any)
+_DEFAULTS: Dict[type, Dict[str, Any]] = {}
+
+def _construct(cls: type, values: Dict[str, Any]) -> Any:
+    """Create a model from trusted values, skipping validation.
+
+    A leaner model_construct: field defaults are computed once per class and only the
+    given values are marked as set.
+    """
+    defaults = _DEFAULTS.get(cls)
+    if defaults is None:
+        defaults = _DEFAULTS[cls] = {name: field.get_default(call_default_factory=True)
+                                     for name, field in cls.model_fields.items()}
+    model = cls.__new__(cls)
+    object.__setattr__(model, '__dict__', {**defaults, **values})
+    object.__setattr__(model, '__pydantic_fields_set__', set(values))
+    object.__setattr__(model, '__pydantic_extra__', None)
+    object.__setattr__(model, '__pydantic_private__', None)
+    return model
+
+def to_compact_json(value: Any) -> str:
+    """Serialize a tool result to JSON without indentation.
+
+    Models only include the fields that were actually read from Jira, so defaults of
+    fields the caller did not request are not sent to the client.
+    """
+    return _RESULT_ADAPTER.dump_json(value, exclude_unset=True, exclude_none=True).decode()
+
+def compact_issue(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a Jira REST issue to the dict that to_compact_json(JiraIssue.from_raw(raw)) encodes.
+
+    Results that are only sent to a client skip building the models, which costs
+    about as much as serializing them.
+    """
+    return _convert(raw, 2)
+
 class JiraUser(BaseModel):
     """
     Model representing a Jira user.
     """
 
     account_id: str | None = None
+    # Username on Jira Server/Data Center, which has no account ids
+    name: str | None = None
     display_name: str = UNASSIGNED
     email: str | None = None
     active: bool = True
     avatar_url: str | None = None
     time_zone: str | None = None
 
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any] | None) -> "JiraUser | None":
+        """Build a user from a Jira REST user object without validation, keeping its display name,
+        account id (Cloud) and username (Server/Data Center)."""
+        return _construct(cls, _user_values(raw)) if raw else None
+
 class JiraStatusCategory(BaseModel):
     """
     Model representing a Jira status category.
@@ -34,6 +80,13 @@ class JiraStatus(BaseModel):
     icon_url: str | None = None
     category: JiraStatusCategory | None = None
 
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any] | None) -> "JiraStatus | None":
+        """Build a status from a Jira REST object without validation, keeping its name."""
+        if not raw:
+            return None
+        return _construct(cls, {"name": raw.get("name", UNKNOWN)})
+
 class JiraIssueType(BaseModel):
     """
     Model representing a Jira issue type.
@@ -44,6 +97,13 @@ class JiraIssueType(BaseModel):
     description: str | None = None
     icon_url: str | None = None
 
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any] | None) -> "JiraIssueType | None":
+        """Build an issue type from a Jira REST object without validation, keeping its name."""
+        if not raw:
+            return None
+        return _construct(cls, {"name": raw.get("name", UNKNOWN)})
+
 class JiraPriority(BaseModel):
     """
     Model representing a Jira priority.
@@ -54,8 +114,21 @@ class JiraPriority(BaseModel):
     description: str | None = None
     icon_url: str | None = None
 
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any] | None) -> "JiraPriority | None":
+        """Build a priority from a Jira REST object without validation, keeping its name."""
+        if not raw:
+            return None
+        return _construct(cls, {"name": raw.get("name", NONE_VALUE)})
+
 class JiraIssue(BaseModel):
+    """
+    Model representing a Jira issue.
+    """
+
+    key: str = EMPTY_STRING
     summary: str = EMPTY_STRING
+    description: str | None = None
     status: JiraStatus | None = None
     assignee: JiraUser | None = None
     reporter: JiraUser | None = None
@@ -63,4 +136,67 @@ class JiraIssue(BaseModel):
     updated: str = EMPTY_STRING
     issue_type: JiraIssueType | None = None
     priority: JiraPriority | None = None
-    url: str | None = None
\ No newline at end of file
+    labels: List[str] | None = None
+    # Requested fields that have no dedicated attribute, e.g. custom fields
+    custom_fields: Dict[str, Any] | None = None
+
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any]) -> "JiraIssue":
+        """Build an issue from a Jira REST issue without validation.
+
+        Only the fields present in the response are set, so serializing with
+        exclude_unset trims everything that was not requested. Nested objects only
+        keep their name (and account id and username for users).
+        """
+        return _construct(cls, _convert(raw, 1))
+
+def _convert(raw: Dict[str, Any], converter_index: int) -> Dict[str, Any]:
+    """Map the fields of a Jira REST issue to JiraIssue attributes, with the converters at
+    converter_index of _FIELD_CONVERTERS: 1 builds models, 2 JSON-ready dicts."""
+    values: Dict[str, Any] = {"key": raw.get("key", EMPTY_STRING)}
+
+    custom_fields: Dict[str, Any] = {}
+    for name, value in (raw.get("fields") or {}).items():
+        if value is None:
+            continue
+        converter = _FIELD_CONVERTERS.get(name)
+        if converter is None:
+            custom_fields[name] = value
+            continue
+        value = converter[converter_index](value)
+        if value is not None:
+            values[converter[0]] = value
+    if custom_fields:
+        values["custom_fields"] = custom_fields
+    return values
+
+def _plain(value: Any) -> Any:
+    return value
+
+def _user_values(raw: Dict[str, Any]) -> Dict[str, Any]:
+    values: Dict[str, Any] = {"display_name": raw.get("displayName") or raw.get("name") or UNASSIGNED}
+    if raw.get("accountId"):
+        values["account_id"] = raw["accountId"]
+    if raw.get("name"):
+        values["name"] = raw["name"]
+    return values
+
+def _user_dict(raw: Dict[str, Any]) -> Dict[str, Any] | None:
+    return _user_values(raw) if raw else None
+
+def _named_dict(default: str) -> Callable[[Dict[str, Any]], Dict[str, Any] | None]:
+    return lambda raw: {"name": raw.get("name", default)} if raw else None
+
+# Jira field name -> (JiraIssue attribute, model converter, dict converter)
+_FIELD_CONVERTERS = {
+    "summary": ("summary", _plain, _plain),
+    "description": ("description", _plain, _plain),
+    "status": ("status", JiraStatus.from_raw, _named_dict(UNKNOWN)),
+    "assignee": ("assignee", JiraUser.from_raw, _user_dict),
+    "reporter": ("reporter", JiraUser.from_raw, _user_dict),
+    "created": ("created", _plain, _plain),
+    "updated": ("updated", _plain, _plain),
+    "issuetype": ("issue_type", JiraIssueType.from_raw, _named_dict(UNKNOWN)),
+    "priority": ("priority", JiraPriority.from_raw, _named_dict(NONE_VALUE)),
+    "labels": ("labels", _plain, _plain),
+}
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The packages live at the repository root, next to jira_mcp_server.py
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
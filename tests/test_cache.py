@@ -0,0 +1,48 @@
+from jira_client.cache import ResponseCache
+
+def test_invalidate_matches_keys_in_any_case():
+    cache = ResponseCache(10, {'issue': 60, 'comments': 60})
+    cache.set(('issue', "ENG-1", "summary"), {'key': "ENG-1"})
+    cache.set(('comments', "ENG-1"), [])
+    cache.set(('issue', "ENG-2", "summary"), {'key': "ENG-2"})
+
+    cache.invalidate(" eng-1 ")
+
+    assert cache.get(('issue', "ENG-1", "summary")) == (False, None)
+    assert cache.get(('comments', "ENG-1")) == (False, None)
+    assert cache.get(('issue', "ENG-2", "summary"))[0]
+
+def test_load_overtaken_by_invalidation_is_not_cached():
+    cache = ResponseCache(10, {'issue': 60})
+
+    def load_racing_a_write():
+        cache.invalidate("ENG-1")
+        return "before the write"
+
+    assert cache.get_or_load(('issue', "ENG-1"), load_racing_a_write) == "before the write"
+    assert cache.get(('issue', "ENG-1")) == (False, None)
+    assert cache.get_or_load(('issue', "ENG-1"), lambda: "after the write") == "after the write"
+    assert cache.get(('issue', "ENG-1")) == (True, "after the write")
+
+def test_clear_during_load_skips_caching():
+    cache = ResponseCache(10, {'projects': 60})
+
+    def load():
+        cache.clear()
+        return ["ENG"]
+
+    cache.get_or_load(('projects',), load)
+    assert cache.get(('projects',)) == (False, None)
+
+def test_failed_load_caches_nothing():
+    cache = ResponseCache(10, {'issue': 60})
+
+    def load():
+        raise RuntimeError("Jira is down")
+
+    try:
+        cache.get_or_load(('issue', "ENG-1"), load)
+    except RuntimeError:
+        pass
+    assert cache.get(('issue', "ENG-1")) == (False, None)
+    assert cache.stats()['entries'] == 0
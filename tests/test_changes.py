@@ -0,0 +1,78 @@
+import re
+import time
+import pytest
+import jira_client.issue
+from jira_client.changes import decode_cursor, encode_cursor
+from jira_client.issue import ManageIssues
+
+def jira_time(ms: int) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(ms / 1000)) + f".{ms % 1000:03d}+0000"
+
+class ChangeFeedJira:
+    """Stub of Jira.jql ordering issues by updated time and key, with relative `updated >= "-Nm"` windows."""
+
+    def __init__(self, updated: dict):
+        self.updated = updated
+        self.calls = 0
+        self.before_page = None
+
+    def jql(self, jql, fields=None, start=0, limit=None, expand=None, **kwargs):
+        self.calls += 1
+        if self.before_page:
+            self.before_page(self)
+        window = re.search(r'updated >= "-(\d+)m"', jql)
+        floor = time.time() * 1000 - int(window.group(1)) * 60000 if window else 0
+        rows = sorted((ms, key) for key, ms in self.updated.items() if ms >= floor)
+        rows.sort(key=lambda row: (row[0], int(row[1].split("-")[1])))
+        return {'total': len(rows), 'issues': [
+            {'key': key, 'fields': {'summary': key, 'updated': jira_time(ms), 'created': jira_time(0)}}
+            for ms, key in rows[start:start + limit]]}
+
+@pytest.fixture
+def small_pages(monkeypatch):
+    monkeypatch.setattr(jira_client.issue, "JIRA_PAGE_SIZE", 3)
+
+def keys(result):
+    return sorted(entry['issue']['key'] for entry in result['changes'])
+
+def test_cursor_round_trip():
+    cursor = encode_cursor("project = ENG", 1700000000000, {"ENG-1", "ENG-2"}, baseline=True)
+    assert decode_cursor(cursor, "project = ENG") == (1700000000000, {"ENG-1", "ENG-2"}, True)
+
+def test_cursor_rejects_other_query_and_garbage():
+    cursor = encode_cursor("project = ENG", 1700000000000, set())
+    with pytest.raises(ValueError, match="different query"):
+        decode_cursor(cursor, "project = OPS")
+    with pytest.raises(ValueError, match="Invalid change feed cursor"):
+        decode_cursor("not a cursor", "project = ENG")
+
+def test_baseline_continues_across_calls(small_pages):
+    base = int(time.time() * 1000) - 3600_000
+    jira = ChangeFeedJira({f"A-{number}": base + number * 1000 for number in range(1, 6)})
+    issues = ManageIssues(jira, typed_results=False)
+
+    first = issues.GetChangesSince("project = A", max_results=2)
+    assert first['baseline'] and first['more']
+    seen = keys(first)
+    cursor = first['cursor']
+    while True:
+        page = issues.GetChangesSince("project = A", cursor, max_results=2)
+        seen += keys(page)
+        cursor = page['cursor']
+        if not page['more']:
+            break
+    assert sorted(seen) == [f"A-{number}" for number in range(1, 6)]
+    assert issues.GetChangesSince("project = A", cursor)['count'] == 0
+
+def test_keyset_walk_keeps_issue_moved_between_pages(small_pages):
+    base = int(time.time() * 1000) - 3600_000
+    jira = ChangeFeedJira({f"A-{number}": base + number * 1000 for number in range(1, 11)})
+
+    def move_first_issue(jira):
+        # A-1, returned by the first page, is updated before the second page is read
+        if jira.calls == 2:
+            jira.updated["A-1"] = int(time.time() * 1000)
+
+    jira.before_page = move_first_issue
+    result = ManageIssues(jira, typed_results=False).GetChangesSince("project = A", max_results=None)
+    assert keys(result) == sorted(f"A-{number}" for number in range(1, 11))
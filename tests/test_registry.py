@@ -0,0 +1,30 @@
+import pytest
+from jira_client.registry import ClientRegistry
+
+def registry(tenants: str) -> ClientRegistry:
+    return ClientRegistry("https://jira.example.com", "default-token", tenants, mirror_path="")
+
+def test_named_tenant_needs_the_callers_token():
+    tenants = registry('{"ops": {"url": "https://ops.example.com/", "token": "stored"}}')
+    with pytest.raises(ValueError, match="token is required"):
+        tenants.resolve(tenant="ops")
+    assert tenants.resolve(tenant="ops", token="mine") == ("https://ops.example.com", "mine")
+
+def test_unconfigured_instances_are_rejected():
+    tenants = registry("{}")
+    assert tenants.resolve() == ("https://jira.example.com", "default-token")
+    with pytest.raises(ValueError, match="not a configured Jira instance"):
+        tenants.resolve(url="https://other.example.com", token="mine")
+    with pytest.raises(ValueError, match="token is required"):
+        tenants.resolve(url="https://other.example.com")
+
+def test_bad_tenant_configuration_only_fails_calls_selecting_it():
+    tenants = registry('{"ops": {"token": "x"}, "qa": {"url": "https://qa.example.com"}}')
+    assert tenants.instances() == ["https://jira.example.com", "https://qa.example.com"]
+    with pytest.raises(ValueError, match="has no url"):
+        tenants.resolve(tenant="ops", token="mine")
+
+    broken = registry("{not json")
+    assert broken.resolve() == ("https://jira.example.com", "default-token")
+    with pytest.raises(ValueError, match="not valid JSON"):
+        broken.resolve(tenant="ops", token="mine")
@@ -0,0 +1,38 @@
+import pytest
+from jira_client.shaping import page_comments
+
+def comment(comment_id: int, created: str) -> dict:
+    return {'id': str(comment_id), 'body': f"comment {comment_id}", 'created': created,
+            'author': {'displayName': "Alice", 'accountId': "a1"}}
+
+def ids(page):
+    return [item['id'] for item in page['comments']]
+
+def test_pages_do_not_shift_when_comments_are_added():
+    comments = [comment(number, "2025-03-01T10:00:00.000+0000") for number in (8, 9, 10, 11)]
+    first = page_comments(comments, 0, limit=2)
+    assert ids(first) == ["11", "10"]
+
+    comments.append(comment(12, "2025-03-02T10:00:00.000+0000"))
+    second = page_comments(comments, 0, limit=2, cursor=first['next_cursor'])
+    assert ids(second) == ["9", "8"]
+    assert second['next_cursor'] is None
+
+def test_order_uses_instants_and_numeric_ids():
+    comments = [comment(9, "2025-03-01T10:00:00.000+0000"),
+                comment(10, "2025-03-01T10:00:00.000+0000"),
+                # 09:30 UTC, the oldest despite sorting last as a string
+                comment(2, "2025-03-01T11:30:00.000+0200")]
+    assert ids(page_comments(comments, 0)) == ["10", "9", "2"]
+
+def test_budget_returns_at_least_one_comment_with_a_cursor():
+    comments = [comment(number, "2025-03-01T10:00:00.000+0000") for number in range(1, 4)]
+    comments[2]['body'] = "x" * 5000
+    page = page_comments(comments, 1000)
+    assert ids(page) == ["3"]
+    assert page['comments'][0]['body'].endswith("chars]")
+    assert ids(page_comments(comments, 1000, cursor=page['next_cursor']))[0] == "2"
+
+def test_limit_below_one_is_rejected():
+    with pytest.raises(ValueError):
+        page_comments([comment(1, "2025-03-01T10:00:00.000+0000")], 0, limit=0)